@@ -1 +1 @@
-from .date import Date, timedelta
+from .date import Date, DateArray, timedelta
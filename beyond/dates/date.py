@@ -3,15 +3,16 @@
 """Date module
 """
 
+import numpy as np
 from numpy import sin, radians
 from collections import namedtuple
 from datetime import datetime, timedelta, date
 
 from ..errors import DateError, UnknownScaleError
-from .eop import EopDb
+from .eop import EopDb, Eop
 from ..utils.node import Node
 
-__all__ = ["Date", "timedelta"]
+__all__ = ["Date", "DateArray", "timedelta"]
 
 
 class Timescale(Node):
@@ -499,6 +500,321 @@ class DateRange:
         return self._range.step
 
 
+class DateArray:
+    """Array of dates sharing the same scale
+
+    Where :py:class:`Date` stores a single instant, DateArray stores a whole
+    column of them as two NumPy arrays (integer days and seconds in the day)
+    expressed in a single scale. All computations (MJD, Julian centuries,
+    scale changes) are done on the whole array at once.
+
+    Earth Orientation Parameters are retrieved once per distinct day of the
+    array, which is the resolution of the
+    :py:class:`~beyond.dates.eop.SimpleEopDatabase`.
+
+    Indexing with an integer, or iterating over the array, provides
+    :py:class:`Date` objects. Indexing with a slice or a mask provides a new
+    DateArray.
+
+    Examples:
+
+        .. code-block:: python
+
+            DateArray([57709, 57709], [0., 3600.])
+            DateArray.range(Date(2016, 11, 17), timedelta(days=1), timedelta(seconds=1))
+            DateArray.from_dates([Date(2016, 11, 17), Date(2016, 11, 18)])
+
+    Attributes:
+        scale: Scale in which the dates are represented
+    """
+
+    JD_MJD = Date.JD_MJD
+    J2000 = Date.J2000
+
+    def __init__(self, d, s, scale=Date.DEFAULT_SCALE, normalize=True):
+        """
+        Args:
+            d (array of int): Days, as MJD
+            s (array of float): Seconds in the day
+            scale (str or Timescale): scale of the dates
+            normalize (bool): If ``False``, the seconds are assumed to be
+                within [0, 86400[ and are not checked. This avoids reading
+                the whole arrays (e.g. when memory-mapped).
+        """
+
+        if type(scale) is str:
+            scale = get_scale(scale.upper())
+
+        d, s = np.broadcast_arrays(
+            np.asarray(d, dtype=np.int64), np.asarray(s, dtype=float)
+        )
+
+        if d.ndim != 1:
+            raise DateError("DateArray should be one-dimensional")
+
+        if normalize and s.size and (s.min() < 0 or s.max() >= 86400.0):
+            d = d + (s // 86400).astype(np.int64)
+            s = s % 86400.0
+
+        self._d = d
+        self._s = s
+        self.scale = scale
+        self._cache = {}
+
+    def _new(self, d, s):
+        """Create a new DateArray with the same scale, without any check"""
+        new = self.__class__.__new__(self.__class__)
+        new._d = d
+        new._s = s
+        new.scale = self.scale
+        new._cache = {}
+        return new
+
+    @classmethod
+    def from_dates(cls, dates, scale=None):
+        """Create a DateArray from an iterable of Date objects
+
+        Args:
+            dates (iterable of Date):
+            scale (str): Scale of the DateArray. If ``None``, the scale of the
+                first date is used
+        Return:
+            DateArray
+        """
+
+        dates = list(dates)
+
+        if scale is None:
+            scale = dates[0].scale if dates else Date.DEFAULT_SCALE
+
+        if type(scale) is str:
+            scale = get_scale(scale.upper())
+
+        d, s = [], []
+        for date in dates:
+            if date.scale is not scale:
+                date = date.change_scale(scale.name)
+            d.append(date.d)
+            s.append(date.s)
+
+        return cls(d, s, scale=scale)
+
+    @classmethod
+    def range(cls, start, stop, step, inclusive=False):
+        """Array equivalent of :py:meth:`Date.range`
+
+        Args:
+            start (Date):
+            stop (Date or datetime.timedelta):
+            step (timedelta):
+        Keyword Args:
+            inclusive (bool): If ``False``, the stopping date is not included.
+                This is the same behavior as the built-in :py:func:`range`.
+        Return:
+            DateArray
+        """
+
+        if not step:
+            raise ValueError("Null step")
+
+        if isinstance(stop, timedelta):
+            stop = start + stop
+
+        span = stop - start
+
+        if span and (span.total_seconds() > 0) != (step.total_seconds() > 0):
+            raise ValueError("start/stop order not coherent with step")
+
+        nb, remainder = divmod(span, step)
+        if inclusive or remainder:
+            nb += 1
+
+        s = start.s + np.arange(nb) * step.total_seconds()
+
+        return cls(np.full(nb, start.d), s, scale=start.scale)
+
+    def __len__(self):
+        return len(self._d)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Date(int(self._d[index]), float(self._s[index]), scale=self.scale)
+        else:
+            return self._new(self._d[index], self._s[index])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):  # pragma: no cover
+        if len(self):
+            return "<{} [{} ... {}] ({} dates)>".format(
+                self.__class__.__name__, self.start, self.stop, len(self)
+            )
+        return "<{} [] (0 dates)>".format(self.__class__.__name__)
+
+    def __add__(self, other):
+        if isinstance(other, timedelta):
+            return self.__class__(
+                self._d, self._s + other.total_seconds(), scale=self.scale
+            )
+        else:
+            raise TypeError("Unknown operation with {}".format(type(other)))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Subtraction of a timedelta gives a new DateArray, subtraction
+        of a Date or DateArray gives the differences in seconds, as an array
+        of float
+        """
+        if isinstance(other, timedelta):
+            return self.__add__(-other)
+        elif isinstance(other, (Date, DateArray)):
+            d1, s1 = self._ref
+            if isinstance(other, Date):
+                d2, s2 = other._d, other._s
+            else:
+                d2, s2 = other._ref
+            return (d1 - d2) * 86400.0 + (s1 - s2)
+        else:
+            raise TypeError("Unknown operation with {}".format(type(other)))
+
+    def __gt__(self, other):
+        return self._mjd > other._mjd
+
+    def __ge__(self, other):
+        return self._mjd >= other._mjd
+
+    def __lt__(self, other):
+        return self._mjd < other._mjd
+
+    def __le__(self, other):
+        return self._mjd <= other._mjd
+
+    def __eq__(self, other):
+        return self._mjd == other._mjd
+
+    def __ne__(self, other):
+        return self._mjd != other._mjd
+
+    __hash__ = None
+
+    @property
+    def start(self):
+        """First date of the array"""
+        return self[0]
+
+    @property
+    def stop(self):
+        """Last date of the array"""
+        return self[-1]
+
+    @property
+    def d(self):
+        return self._d
+
+    @property
+    def s(self):
+        return self._s
+
+    @property
+    def eop(self):
+        """Earth Orientation Parameters for each date, as an
+        :py:class:`~beyond.dates.eop.Eop` object whose attributes are arrays
+        """
+
+        if "eop" not in self._cache:
+            if len(self):
+                days, inverse = np.unique(self._d, return_inverse=True)
+                eops = [vars(EopDb.get(float(day))) for day in days]
+                values = {
+                    k: np.array([e[k] for e in eops], dtype=float)[inverse]
+                    for k in eops[0]
+                }
+            else:
+                # No date to retrieve EOP for, but the fields are still needed
+                eop = EopDb.get(self.J2000 - self.JD_MJD)
+                values = {k: np.zeros(0) for k in vars(eop)}
+
+            self._cache["eop"] = Eop(**values)
+
+        return self._cache["eop"]
+
+    @property
+    def _offset(self):
+        """Offset from the scale of the array to REF_SCALE, in seconds"""
+        if "offset" not in self._cache:
+            self._cache["offset"] = np.broadcast_to(
+                self.scale.offset(self.mjd, Date.REF_SCALE, self.eop), self._s.shape
+            )
+        return self._cache["offset"]
+
+    @property
+    def _ref(self):
+        """Days and seconds in the REF_SCALE"""
+        if "ref" not in self._cache:
+            s = self._s + self._offset
+            self._cache["ref"] = (
+                self._d + (s // 86400).astype(np.int64),
+                s % 86400.0,
+            )
+        return self._cache["ref"]
+
+    @property
+    def _mjd(self):
+        """
+        Return:
+            numpy.ndarray: Dates in terms of MJD in the REF_SCALE timescale
+        """
+        d, s = self._ref
+        return d + s / 86400.0
+
+    @property
+    def mjd(self):
+        """Dates in terms of MJD
+
+        Return:
+            numpy.ndarray
+        """
+        return self._d + self._s / 86400.0
+
+    @property
+    def jd(self):
+        """Dates in terms of Julian Date
+
+        Return:
+            numpy.ndarray
+        """
+        return self.mjd + self.JD_MJD
+
+    @property
+    def julian_century(self):
+        """Julian centuries of the dates relatively to their scale
+
+        Return:
+            numpy.ndarray
+        """
+        return Date._julian_century(self.jd)
+
+    def change_scale(self, new_scale):
+        """
+        Args:
+            new_scale (str)
+        Return:
+            DateArray
+
+        Contrary to :py:meth:`Date.change_scale`, the result is not rounded
+        to the microsecond.
+        """
+        if type(new_scale) is str:
+            new_scale = get_scale(new_scale.upper())
+
+        offset = self.scale.offset(self._mjd, new_scale.name, self.eop)
+
+        return self.__class__(self._d, self._s + offset, scale=new_scale)
+
+
 # This part is here to allow matplotlib to display Date objects directly
 # in the plot, without any other conversion by the developer
 # If matplotlib is importable, then a converter class is registered
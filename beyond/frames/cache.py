@@ -0,0 +1,153 @@
+"""Cache of frame transformations
+
+When converting many objects at the same epochs (e.g. a catalog screening),
+the rotation matrices and center offsets are identical for all objects.
+They are kept in a bounded cache, keyed on the date, the Earth Orientation
+Parameters of this date, the configuration of the models (see the
+``frames.iau2010`` section) and the source and target of the transformation.
+
+The cache is enabled by default, and its size is controlled via the
+``frames.cache`` section of the :ref:`configuration <configuration>`
+
+.. code-block:: python
+
+    from beyond.config import config
+
+    config.set("frames", "cache", "maxsize", 10000)  # number of entries
+    config.set("frames", "cache", "maxbytes", 2 ** 20)  # memory budget in bytes
+    config.set("frames", "cache", "enabled", False)
+
+It is also possible to scope the cache to a portion of code. The cache is
+then emptied when leaving the context
+
+.. code-block:: python
+
+    from beyond.frames.cache import frame_cache
+
+    with frame_cache.scope():
+        for orb in catalog:
+            orb.frame = "ITRF"
+
+    # Statistics
+    print(frame_cache.info().hit_rate)
+
+    # Disable the cache
+    with frame_cache.scope(enabled=False):
+        ...
+
+Arrays of dates are never cached, nor are the transformations depending on
+an orbit (see :py:func:`~beyond.frames.frames.orbit2frame`), as it may be
+modified in place.
+"""
+
+from contextlib import contextmanager
+
+from ..config import config
+from ..dates import Date
+from ..utils.memoize import LruCache
+from ..utils.node import Node
+
+__all__ = ["FrameCache", "frame_cache"]
+
+
+class FrameCache(LruCache):
+    """Bounded cache of frame transformations"""
+
+    DEFAULT_MAXSIZE = 100000
+    DEFAULT_MAXBYTES = 32 * 2 ** 20
+
+    def __init__(self):
+        super().__init__(section=("frames", "cache"))
+        self._enabled = None
+        self._generation = Node.generation
+
+    @property
+    def enabled(self):
+        if self._enabled is not None:
+            return self._enabled
+        return config.get("frames", "cache", "enabled", fallback=True)
+
+    @contextmanager
+    def scope(self, enabled=True):
+        """Context manager enabling (or disabling) the cache.
+
+        When the cache is enabled by this context, it is emptied (statistics
+        included) at the start and at the exit of the context.
+
+        Args:
+            enabled (bool): Set to ``False`` to disable the cache within the context
+        """
+
+        previous = self._enabled
+        self._enabled = enabled
+        if enabled:
+            self.clear()
+        try:
+            yield self
+        finally:
+            self._enabled = previous
+            if enabled:
+                self.clear()
+
+    def fetch(self, date, key, func):
+        """Retrieve a transformation, or compute it
+
+        Args:
+            date (Date): Date of the transformation
+            key (tuple): Description of the transformation (source, target, etc.)
+            func (callable): Function to call, without arguments, if the
+                transformation is not in the cache
+        Return:
+            numpy.ndarray: the output of ``func``, read-only if it is cached
+        """
+
+        if not isinstance(date, Date) or not self.enabled:
+            return func()
+
+        # Any modification of the graphs of orientations or centers
+        # may change the transformations
+        if self._generation != Node.generation:
+            self._data.clear()
+            self.currbytes = 0
+            self._generation = Node.generation
+
+        # The Earth Orientation Parameters of a date don't change, and are
+        # only read once
+        try:
+            eop = date._cache["eop_key"]
+        except KeyError:
+            eop = date._cache["eop_key"] = tuple(vars(date.eop).values())
+
+        # The configuration of the models changes the transformations as well.
+        # The section is read directly, as Config.get() is comparatively slow
+        try:
+            section = config["frames"]["iau2010"]
+        except KeyError:
+            settings = None
+        else:
+            settings = (
+                section.get("xys"),
+                section.get("xys_step"),
+                section.get("xys_points"),
+            )
+
+        key = (date, eop, settings) + key
+
+        try:
+            return self[key]
+        except KeyError:
+            pass
+
+        value = func()
+        # As the same value is given to all callers, it should not be modified
+        value.flags.writeable = False
+        self[key] = value
+
+        return value
+
+
+frame_cache = FrameCache()
+"""Cache of frame transformations used by
+:py:meth:`Orientation.convert_to() <beyond.frames.orient.Orientation.convert_to>`
+and :py:meth:`Center.convert_to() <beyond.frames.center.Center.convert_to>`
+"""
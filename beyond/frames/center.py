@@ -1,10 +1,12 @@
 import numpy as np
 
 from .. import constants
+from ..dates import DateArray
 from ..utils.node import Node
 from ..utils.matrix import expand
 
 from . import orient
+from .cache import frame_cache
 
 
 class Center:
@@ -14,10 +16,15 @@ class Center:
     or an arbitraty point in space
     """
 
+    volatile = False
+    """If ``True``, the offset of this center is an orbit, which may be modified
+    in place, and the transformations involving it are never cached"""
+
     def __init__(self, name, body=None):
         self.name = name
         self.node = Node(name)
         self.body = body
+        self._volatiles = {}
 
     def __repr__(self):
         return "<{} '{}' at {}>".format(
@@ -48,17 +55,55 @@ class Center:
         """Compute the offset between to centers, in the given orientation.
 
         Args:
-            date (Date) :
+            date (Date or DateArray) :
             new_center (Center or str) :
             orientation (Orientation) :
         Return:
             numpy.ndarray : cartesian coordinates of the center relative
-                to the new_center.
+                to the new_center. Of shape (N, 6) for a DateArray.
+
+        The result is kept in the :py:data:`~beyond.frames.cache.frame_cache`.
         """
 
         if isinstance(new_center, Center):
             new_center = new_center.name
 
+        if isinstance(orientation, orient.Orientation):
+            orientation_name = orientation.name
+        else:
+            orientation_name = orientation
+
+        if self._is_volatile(new_center):
+            return self._convert_to(date, new_center, orientation)
+
+        return frame_cache.fetch(
+            date,
+            ("center", self.name, new_center, orientation_name),
+            lambda: self._convert_to(date, new_center, orientation),
+        )
+
+    def _is_volatile(self, new_center):
+        """Check if the path to another center goes through a center whose
+        offset is an orbit (see :py:attr:`volatile`)
+
+        The result is kept until the graph of centers is modified.
+        """
+
+        generation, volatile = self._volatiles.get(new_center, (None, None))
+
+        if generation != Node.generation:
+            volatile = False
+            for a, b in self.node.steps(new_center):
+                for name in (f"{a}_to_{b}", f"{b}_to_{a}"):
+                    method = getattr(self, name, None)
+                    if getattr(getattr(method, "__self__", None), "volatile", False):
+                        volatile = True
+            self._volatiles[new_center] = (Node.generation, volatile)
+
+        return volatile
+
+    def _convert_to(self, date, new_center, orientation):
+
         out = np.zeros(6)
 
         for a, b in self.node.steps(new_center):
@@ -72,7 +117,7 @@ class Center:
             else:
                 raise ValueError(f"Unknown transformation {a} <-> {b}")
 
-            out += np.asarray(offset)
+            out = out + np.asarray(offset)
 
         return out
 
@@ -83,12 +128,21 @@ class Center:
         This method if here to be renamed when the class is instanciated.
         """
 
+        m = self.orientation.convert_to(date, orientation)
+
+        if isinstance(date, DateArray):
+            if hasattr(self.offset, "propagate"):
+                res = np.array([self.offset.propagate(d) for d in date])
+            else:
+                res = np.asarray(self.offset)
+            return np.einsum("...ij,...j->...i", m, res)
+
         if hasattr(self.offset, "propagate"):
             res = self.offset.propagate(date)
         else:
             res = self.offset
 
-        return self.orientation.convert_to(date, orientation) @ res
+        return m @ res
 
 
 Earth = Center("Earth", body=constants.Earth)
@@ -10,6 +10,7 @@ import logging
 import numpy as np
 
 from ..config import config
+from ..dates import Date, DateArray
 from ..errors import UnknownFrameError, UnknownBodyError
 from ..constants import Earth
 from ..utils.matrix import rot3, expand
@@ -113,6 +114,32 @@ class Frame:
         new_orb.form = orbit.form
         return new_orb
 
+    def transform_array(self, coords, dates, new_frame):
+        """Change the frame of reference of multiple states at once
+
+        Args:
+            coords (numpy.ndarray): Cartesian coordinates of the states,
+                of shape (N, 6)
+            dates (Date, DateArray or list of Date): Date of each state. If a
+                single Date is provided, it applies to all the states
+            new_frame (str or Frame): Frame to convert the states into
+        Return:
+            numpy.ndarray: Cartesian coordinates in the new frame, of shape (N, 6)
+        """
+
+        if isinstance(new_frame, str):
+            new_frame = get_frame(new_frame)
+
+        coords = np.asarray(coords, dtype=float)
+
+        if not isinstance(dates, (Date, DateArray)):
+            dates = DateArray.from_dates(dates)
+
+        offset = self.center.convert_to(dates, new_frame.center, new_frame.orientation)
+        m = self.orientation.convert_to(dates, new_frame.orientation)
+
+        return np.einsum("...ij,...j->...i", m, coords) + offset
+
 
 EME2000 = Frame("EME2000", orient.EME2000, center.Earth)
 """EME2000 inertial frame (also known a J2000)"""
@@ -173,6 +200,10 @@ class HillFrame(Frame):
         """
         raise RuntimeError("Hill frame is untransformable")
 
+    def transform_array(self, coords, dates, new_frame):
+        """See :py:meth:`transform`"""
+        raise RuntimeError("Hill frame is untransformable")
+
 
 Hill = HillFrame()
 """Hill frame, for the :class:`Clohessy-Wiltshire propagator <beyond.propagators.cw.ClohessyWiltshire>`.
@@ -217,5 +248,6 @@ def orbit2frame(name, ref_orbit, orientation=None, parent=EME2000, exists_warnin
         ref_orbit.frame.orientation,
         ref_orbit,
     )
+    center_obj.volatile = True
 
     return Frame(name, orientation, center_obj, exists_warning)
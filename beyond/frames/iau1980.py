@@ -6,7 +6,6 @@
 from pathlib import Path
 
 import numpy as np
-from math import sin, cos, radians
 
 from ..utils.matrix import rot1, rot2, rot3
 from ..utils.memoize import memoize
@@ -14,11 +13,16 @@ from ..utils.memoize import memoize
 
 @memoize
 def _tab(max_i=None):
-    """Extraction and caching of IAU1980 nutation coefficients"""
+    """Extraction and caching of IAU1980 nutation coefficients
+
+    Return:
+        2-tuple of numpy.ndarray: Integer multipliers of the fundamental arguments
+        of shape (n, 5), and the A, B, C, D coefficients of shape (n, 4)
+    """
 
     filepath = Path(__file__).parent / "data" / "tab5.1.txt"
 
-    result = []
+    integers, reals = [], []
     with filepath.open() as fhd:
         i = 0
         for line in fhd.read().splitlines():
@@ -26,21 +30,29 @@ def _tab(max_i=None):
                 continue
 
             fields = line.split()
-            result.append(
-                ([int(x) for x in fields[:5]], [float(x) for x in fields[6:]])
-            )
+            integers.append([int(x) for x in fields[:5]])
+            reals.append([float(x) for x in fields[6:]])
 
             i += 1
             if max_i and i >= max_i:
                 break
 
-    return result
+    # The multipliers are stored as floats to avoid a conversion at each
+    # matrix product
+    return np.array(integers, dtype=float), np.array(reals)
 
 
 def rate(date):
-    """Return the rotation rate vector of the earth for a given date"""
+    """Return the rotation rate vector of the earth for a given date
+
+    Args:
+        date (Date or DateArray)
+    Return:
+        numpy.ndarray: of shape (3,), or (N, 3) for a DateArray
+    """
     lod = date.eop.lod / 1000.0
-    return np.array([0, 0, 7.292115146706979e-5 * (1 - lod / 86400.0)])
+    omega = 7.292115146706979e-5 * (1 - lod / 86400.0)
+    return np.stack(np.broadcast_arrays(0.0, 0.0, omega), axis=-1)
 
 
 def _earth_orientation(date):
@@ -78,12 +90,12 @@ def _nutation(date, eop_correction=True, terms=106):
     """Model 1980 of nutation as described in Vallado p. 224
 
     Args:
-        date (beyond.utils.date.Date)
+        date (Date or DateArray)
         eop_correction (bool): set to ``True`` to include model correction
             from 'finals' files.
         terms (int)
     Return:
-        tuple : 3-elements, all floats in degrees
+        tuple : 3-elements, all floats (or arrays for a DateArray) in degrees
             1. ̄ε
             2. Δψ
             3. Δε
@@ -144,16 +156,15 @@ def _nutation(date, eop_correction=True, terms=106):
         + 2.2e-6 * ttt ** 3
     )
 
-    delta_psi = 0.0
-    delta_eps = 0.0
-    for integers, reals in _tab(terms):
-        a1, a2, a3, a4, a5 = integers
-        A, B, C, D = reals
+    integers, reals = _tab(terms)
+    A, B, C, D = reals.T
 
-        a_p = a1 * m_m + a2 * m_s + a3 * u_m_m + a4 * d_s + a5 * om_m
+    # Arguments of each term, of shape (terms,) or (terms, N)
+    a_p = np.radians(integers @ np.array([m_m, m_s, u_m_m, d_s, om_m]))
+    sin_p, cos_p = np.sin(a_p), np.cos(a_p)
 
-        delta_psi += (A + B * ttt) * sin(radians(a_p)) / 36000000.0
-        delta_eps += (C + D * ttt) * cos(radians(a_p)) / 36000000.0
+    delta_psi = (A @ sin_p + (B @ sin_p) * ttt) / 36000000.0
+    delta_eps = (C @ cos_p + (D @ cos_p) * ttt) / 36000000.0
 
     if eop_correction:
         delta_eps += date.eop.deps / 3600000.0
@@ -178,8 +189,7 @@ def equinox(date, eop_correction=True, terms=106, kinematic=True):
 
     equin = delta_psi * 3600.0 * np.cos(np.deg2rad(epsilon_bar))
 
-    if date.d >= 50506 and kinematic:
-        # Starting 1992-02-27, we apply the effect of the moon
+    if kinematic:
         ttt = date.change_scale("TT").julian_century
         om_m = (
             125.04455501
@@ -188,10 +198,13 @@ def equinox(date, eop_correction=True, terms=106, kinematic=True):
             + 2.139e-6 * ttt ** 3
         )
 
-        equin += 0.00264 * np.sin(np.deg2rad(om_m)) + 6.3e-5 * np.sin(
+        moon = 0.00264 * np.sin(np.deg2rad(om_m)) + 6.3e-5 * np.sin(
             np.deg2rad(2 * om_m)
         )
 
+        # Starting 1992-02-27, we apply the effect of the moon
+        equin += np.where(date.d >= 50506, moon, 0.0)
+
     # print("equinox = {}\n".format(equin / 3600))
     return equin / 3600.0
 
@@ -200,12 +213,12 @@ def _sideral(date, longitude=0.0, model="mean", eop_correction=True, terms=106):
     """Get the sideral time at a defined date
 
     Args:
-        date (Date):
+        date (Date or DateArray):
         longitude (float): Longitude of the observer (in degrees)
             East positive/West negative.
         model (str): 'mean' or 'apparent' for GMST and GAST respectively
     Return:
-        float: Sideral time in degrees
+        float or numpy.ndarray: Sideral time in degrees
 
     GMST: Greenwich Mean Sideral Time
     LST: Local Sideral Time (Mean)
@@ -1,11 +1,30 @@
 """Implementation of the IAU 2010 Earth orientation model
+
+The computation of the X, Y, s coordinates of the Celestial Intermediate Pole
+is the most expensive part of the model. When converting a lot of states spanning
+a few days, it is possible to replace the full IAU2000A series by an interpolation
+on precomputed tables
+
+.. code-block:: python
+
+    from beyond.config import config
+
+    config.set("frames", "iau2010", "xys", "interpolated")
+
+The tables are anchored at J2000 (TT) and built lazily when needed. With the default
+settings (a node every half day and 10 points Lagrange interpolation) the difference
+with the full series stays below 0.01 micro-arcsecond (5e-14 rad) on X and Y, far
+beyond the accuracy of the IAU2000A model itself. With a one day step, it stays
+below 1 micro-arcsecond.
 """
 
 from pathlib import Path
+from math import factorial
 
 import numpy as np
-from math import sin, cos
 
+from ..config import config
+from ..errors import ConfigError
 from ..utils.matrix import rot1, rot2, rot3
 from ..utils.memoize import memoize
 
@@ -14,7 +33,13 @@ __all__ = ["sideral", "precesion_nutation", "earth_orientation", "rate"]
 
 @memoize
 def _tab():
-    """Extraction and caching of IAU2000 nutation coefficients"""
+    """Extraction and caching of IAU2000 nutation coefficients
+
+    Return:
+        list: For each of X, Y and s, a list indexed by the power of t, of 3-tuples
+        containing the sine amplitudes, the cosine amplitudes and the matrix of
+        integer multipliers of the fundamental arguments (one row per term)
+    """
 
     elements = ["tab5.2a.txt", "tab5.2b.txt", "tab5.2d.txt"]  # x  # y  # s
 
@@ -39,12 +64,16 @@ def _tab():
                     continue
 
                 # The first field is only an index
-                fields = line.split()[1:]
-                fields[:2] = [float(x) for x in fields[:2]]
-                fields[2:] = [int(x) for x in fields[2:]]
-                result.append(fields)
+                result.append(line.split()[1:])
+
+        series = []
+        for result in total:
+            # The multipliers are integers, but they are stored as floats
+            # to avoid a conversion at each matrix product
+            coefs = np.array(result, dtype=float).reshape(-1, 16)
+            series.append((coefs[:, 0], coefs[:, 1], coefs[:, 2:]))
 
-        out.append(total)
+        out.append(series)
 
     return out
 
@@ -80,14 +109,30 @@ def sideral(date):
 
 
 def rate(date):
-    """Return the rotation rate vector of the earth for a given date"""
+    """Return the rotation rate vector of the earth for a given date
+
+    Args:
+        date (Date or DateArray)
+    Return:
+        numpy.ndarray: of shape (3,), or (N, 3) for a DateArray
+    """
     lod = date.eop.lod / 1000.0
-    return np.array([0, 0, 7.292115146706979e-5 * (1 - lod / 86400.0)])
+    omega = 7.292115146706979e-5 * (1 - lod / 86400.0)
+    return np.stack(np.broadcast_arrays(0.0, 0.0, omega), axis=-1)
 
 
 def _planets(date):
+    return _fundamental_arguments(date.change_scale("TT").julian_century)
 
-    ttt = date.change_scale("TT").julian_century
+
+def _fundamental_arguments(ttt):
+    """Fundamental arguments of the nutation theory
+
+    Args:
+        ttt (float or numpy.ndarray): Julian centuries since J2000, in TT scale
+    Return:
+        numpy.ndarray: of shape (14,) or (14, N), in radians
+    """
 
     M_moon = (
         485868.249036
@@ -163,6 +208,23 @@ def _planets(date):
     return planets
 
 
+def _series(coefs, planets):
+    """Non-polynomial part of a series, for one power of t
+
+    Args:
+        coefs (tuple): sine amplitudes, cosine amplitudes and multipliers, as
+            provided by :py:func:`_tab`
+        planets (numpy.ndarray): fundamental arguments, of shape (14,) or (14, N)
+    Return:
+        float or numpy.ndarray: in micro-arcsecond
+    """
+
+    sin_amp, cos_amp, mult = coefs
+    args = mult @ planets
+
+    return sin_amp @ np.sin(args) + cos_amp @ np.cos(args)
+
+
 def _xysxy2(date):
     """Here we deviate from what has been done everywhere else. Instead of taking the formulas
     available in the Vallado, we take those described in the files tab5.2{a,b,d}.txt.
@@ -170,15 +232,25 @@ def _xysxy2(date):
     The result should be equivalent, but they are the last iteration of the IAU2000A as of June 2016
 
     Args:
-        date (Date)
+        date (Date or DateArray)
     Return:
-        3-tuple of float: Values of X, Y, s + XY/2 in arcsecond
+        3-tuple of float or numpy.ndarray: Values of X, Y, s + XY/2 in arcsecond
     """
 
-    planets = _planets(date)
-    x_tab, y_tab, s_tab = _tab()
+    return _xysxy2_series(date.change_scale("TT").julian_century)
 
-    ttt = date.change_scale("TT").julian_century
+
+def _xysxy2_series(ttt):
+    """Full series evaluation of X, Y, s + XY/2
+
+    Args:
+        ttt (float or numpy.ndarray): Julian centuries since J2000, in TT scale
+    Return:
+        3-tuple of float or numpy.ndarray: Values of X, Y, s + XY/2 in arcsecond
+    """
+
+    planets = _fundamental_arguments(ttt)
+    x_tab, y_tab, s_tab = _tab()
 
     # Units: micro-arcsecond
     X = (
@@ -208,39 +280,101 @@ def _xysxy2(date):
         + 15.62 * ttt ** 5
     )
 
-    for j in range(5):
+    for j, (x_j, y_j, s_j) in enumerate(zip(x_tab, y_tab, s_tab)):
+        X += _series(x_j, planets) * ttt ** j
+        Y += _series(y_j, planets) * ttt ** j
+        s_xy2 += _series(s_j, planets) * ttt ** j
 
-        _x, _y, _s = 0, 0, 0
-        for Axs, Axc, *p_coefs in x_tab[j]:
-            ax_p = np.dot(p_coefs, planets)
-            _x += Axs * sin(ax_p) + Axc * cos(ax_p)
+    # Conversion to arcsecond
+    return X * 1e-6, Y * 1e-6, s_xy2 * 1e-6
 
-        for Ays, Ayc, *p_coefs in y_tab[j]:
-            ay_p = np.dot(p_coefs, planets)
-            _y += Ays * sin(ay_p) + Ayc * cos(ay_p)
 
-        for Ass, Asc, *p_coefs in s_tab[j]:
-            as_p = np.dot(p_coefs, planets)
-            _s += Ass * sin(as_p) + Asc * cos(as_p)
+_XYS_BLOCK = 128
+"""Number of nodes of each interpolation table"""
 
-        X += _x * ttt ** j
-        Y += _y * ttt ** j
-        s_xy2 += _s * ttt ** j
 
-    # Conversion to arcsecond
-    return X * 1e-6, Y * 1e-6, s_xy2 * 1e-6
+@memoize
+def _xys_table(step, block):
+    """Table of X, Y, s + XY/2 on a block of nodes of the interpolation grid
+
+    The grid is anchored at J2000 (TT) with a node every ``step`` days.
+
+    Args:
+        step (float): grid step, in days
+        block (int): index of the block
+    Return:
+        numpy.ndarray: of shape (_XYS_BLOCK, 3), in arcsecond
+    """
+
+    nodes = (block * _XYS_BLOCK + np.arange(_XYS_BLOCK)) * step / 36525
+    return np.array(_xysxy2_series(nodes)).T
+
+
+def _xysxy2_interp(date):
+    """Lagrange interpolation of X, Y, s + XY/2 on precomputed tables
+
+    The step of the grid and the number of interpolation points are set
+    by the ``frames.iau2010.xys_step`` (in days, defaults to 0.5) and
+    ``frames.iau2010.xys_points`` (defaults to 10) configuration variables.
+
+    Args:
+        date (Date or DateArray)
+    Return:
+        3-tuple of float or numpy.ndarray: Values of X, Y, s + XY/2 in arcsecond
+    """
+
+    step = config.get("frames", "iau2010", "xys_step", fallback=0.5)
+    points = config.get("frames", "iau2010", "xys_points", fallback=10)
+
+    ttt = date.change_scale("TT").julian_century
+
+    # Position on the grid, in number of steps since J2000
+    x = np.atleast_1d(ttt * 36525 / step)
+
+    # The point to interpolate is always between the two middle nodes
+    first = np.floor(x).astype(int) - (points // 2 - 1)
+    nodes = first[:, None] + np.arange(points)
+
+    # Lagrange weights for equally spaced nodes
+    diffs = (x - first)[:, None] - np.arange(points)
+    weights = np.empty(diffs.shape)
+    for j in range(points):
+        denom = (-1) ** (points - 1 - j) * factorial(j) * factorial(points - 1 - j)
+        weights[:, j] = np.prod(np.delete(diffs, j, axis=1), axis=1) / denom
+
+    # Retrieval of tabulated values, block by block
+    blocks = nodes // _XYS_BLOCK
+    values = np.empty(nodes.shape + (3,))
+    for block in np.unique(blocks):
+        mask = blocks == block
+        table = _xys_table(step, int(block))
+        values[mask] = table[nodes[mask] - block * _XYS_BLOCK]
+
+    X, Y, s_xy2 = np.einsum("ij,ijk->ki", weights, values)
+
+    if np.ndim(ttt) == 0:
+        return X[0], Y[0], s_xy2[0]
+
+    return X, Y, s_xy2
 
 
 def _xys(date):
     """Get The X, Y and s coordinates
 
     Args:
-        date (Date):
+        date (Date or DateArray):
     Return:
-        3-tuple of float: Values of X, Y and s, in radians
+        3-tuple of float or numpy.ndarray: Values of X, Y and s, in radians
     """
 
-    X, Y, s_xy2 = _xysxy2(date)
+    model = config.get("frames", "iau2010", "xys", fallback="exact")
+
+    if model == "exact":
+        X, Y, s_xy2 = _xysxy2(date)
+    elif model == "interpolated":
+        X, Y, s_xy2 = _xysxy2_interp(date)
+    else:
+        raise ConfigError("Unknown config value for 'frames.iau2010.xys'")
 
     # convert milli-arcsecond to arcsecond
     dX, dY = date.eop.dx / 1000.0, date.eop.dy / 1000.0
@@ -261,13 +395,16 @@ def precesion_nutation(date):
     d = np.arctan(np.sqrt((X ** 2 + Y ** 2) / (1 - X ** 2 - Y ** 2)))
     a = 1 / (1 + np.cos(d))
 
-    return (
-        np.array(
-            [
-                [1 - a * X ** 2, -a * X * Y, X],
-                [-a * X * Y, 1 - a * Y ** 2, Y],
-                [-X, -Y, 1 - a * (X ** 2 + Y ** 2)],
-            ]
-        )
-        @ rot3(s)
+    m = np.array(
+        [
+            [1 - a * X ** 2, -a * X * Y, X],
+            [-a * X * Y, 1 - a * Y ** 2, Y],
+            [-X, -Y, 1 - a * (X ** 2 + Y ** 2)],
+        ]
     )
+
+    if m.ndim == 3:
+        # Stack of matrices
+        m = np.moveaxis(m, -1, 0)
+
+    return m @ rot3(s)
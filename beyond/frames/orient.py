@@ -1,54 +1,171 @@
 import numpy as np
 
+from ..dates import DateArray
 from ..utils.node import Node
 from ..utils.matrix import rot2, rot3, expand
 from . import iau1980, iau2010, local
+from .cache import frame_cache
+
+
+def _constant(func):
+    """Decorator marking a transformation as independent of the date.
+
+    The result of such a transformation is computed only once, when the
+    transformation chain using it is built (see :py:meth:`Orientation.convert_to`).
+    """
+    func.constant = True
+    return func
 
 
 class Orientation(Node):
     """Rotation matrix generator for frame transformation handling"""
 
+    volatile = False
+    """If ``True``, the transformations of this orientation depend on an orbit,
+    which may be modified in place, and are never cached"""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self._plans = {}
+
     def convert_to(self, date, new_orient):
         """Provide the rotation matrix to transform a vector in a given orientation (self)
         to another (new_orient)
 
         Args:
-            date (Date):
+            date (Date or DateArray):
             new_orient (str or Orientation)
         return:
-            numpy.ndarray: 6x6 rotation matrix
+            numpy.ndarray: 6x6 rotation matrix, or stack of (N, 6, 6) matrices
+            for a DateArray
+
+        The result is kept in the :py:data:`~beyond.frames.cache.frame_cache`.
         """
 
-        if isinstance(new_orient, self.__class__):
+        if isinstance(new_orient, Orientation):
             new_orient = new_orient.name
 
-        m = np.identity(6)
+        if self._is_volatile(new_orient):
+            return self._convert_to(date, new_orient)
+
+        return frame_cache.fetch(
+            date,
+            ("orientation", self.name, new_orient),
+            lambda: self._convert_to(date, new_orient),
+        )
+
+    def _convert_to(self, date, new_orient):
+
+        m, m2 = None, None
+
+        for step, transpose in self._plan(new_orient):
+
+            if callable(step):
+                r1, r2 = step(date)
+                if transpose:
+                    r1 = np.swapaxes(r1, -1, -2)
+                    if r2 is not None:
+                        r2 = np.swapaxes(r2, -1, -2)
+            else:
+                r1, r2 = step
+
+            if m is None:
+                m, m2 = r1, r2
+                continue
+
+            # Composition of the 6x6 matrices [[r1, 0], [r2, r1]] @ [[m, 0], [m2, m]]
+            # performed on 3x3 blocks
+            if r2 is not None:
+                r2 = r2 @ m
+            if m2 is not None:
+                m2 = r1 @ m2 if r2 is None else r2 + r1 @ m2
+            else:
+                m2 = r2
+
+            m = r1 @ m
+
+        if m is None:
+            return np.identity(6)
+
+        M = expand(m)
+        if m2 is not None:
+            M[..., 3:, :3] = m2
+
+        return M
+
+    def _plan(self, new_orient):
+        """Retrieve the chain of transformations leading to another orientation.
 
+        The chain is resolved once, and kept until the graph of orientations
+        is modified. Consecutive transformations independent of the date
+        (see :py:func:`_constant`) are folded into a single pair of matrices.
+
+        Args:
+            new_orient (str): Name of the targeted orientation
+        Return:
+            list of 2-tuple: Each element is either a transformation method with
+            a flag indicating if its result should be transposed, or a constant
+            pair of matrices (with a ``None`` flag)
+        """
+
+        generation, plan, _ = self._plans.get(new_orient, (None, None, None))
+
+        if generation == Node.generation:
+            return plan
+
+        plan = []
         for a, b in self.steps(new_orient):
             direct = f"{a}_to_{b}"
             reverse = f"{b}_to_{a}"
 
             if hasattr(self, direct):
-                m1, m2 = getattr(self, direct)(date)
+                step, transpose = getattr(self, direct), False
             elif hasattr(self, reverse):
-                m1, m2 = getattr(self, reverse)(date)
+                step, transpose = getattr(self, reverse), True
+            else:
+                raise ValueError(f"Unknown transformation {a} <-> {b}")
+
+            if not getattr(step, "constant", False):
+                plan.append((step, transpose))
+                continue
+
+            m1, m2 = step(None)
+            if transpose:
                 m1 = m1.T
                 if m2 is not None:
                     m2 = m2.T
-            else:
-                raise ValueError(f"Unknown transformation {a} <-> {b}")
 
-            M = expand(m1)
+            if plan and not callable(plan[-1][0]):
+                # Folding with the previous constant step
+                (p1, p2), _ = plan.pop()
+                if m2 is not None:
+                    m2 = m2 @ p1
+                if p2 is not None:
+                    m2 = m1 @ p2 if m2 is None else m2 + m1 @ p2
+                m1 = m1 @ p1
 
-            if m2 is not None:
-                M[3:, :3] = m2
+            plan.append(((m1, m2), None))
 
-            m = M @ m
+        volatile = any(
+            getattr(getattr(step, "__self__", None), "volatile", False)
+            for step, _ in plan
+            if callable(step)
+        )
+        self._plans[new_orient] = (Node.generation, plan, volatile)
+
+        return plan
 
-        return m
+    def _is_volatile(self, new_orient):
+        """Check if the transformation to another orientation depends on an
+        orbit (see :py:attr:`volatile`)
+        """
+        self._plan(new_orient)
+        return self._plans[new_orient][2]
 
     def _rate2mat(self, rate):
-        """Create a 3x3 matrix from a rate vector"""
+        """Create a 3x3 matrix from a rate vector (or a stack of matrices from
+        an array of rate vectors of shape (N, 3))
+        """
 
         # Each line of the rotation matrix is constructed by computing the cross product
         # of the rate vector by the unit vector, which gives
@@ -61,8 +178,20 @@ class Orientation(Node):
         # ).T
         # This is equivatent to the following, which has the benefit of not requiring
         # extra computation
-        return np.array(
-            [[0, -rate[2], rate[1]], [rate[2], 0, -rate[0]], [-rate[1], rate[0], 0]]
+        if np.ndim(rate) == 1:
+            return np.array(
+                [[0, -rate[2], rate[1]], [rate[2], 0, -rate[0]], [-rate[1], rate[0], 0]]
+            )
+
+        x, y, z = np.moveaxis(rate, -1, 0)
+        zero = np.zeros_like(x)
+        return np.stack(
+            [
+                np.stack([zero, -z, y], axis=-1),
+                np.stack([z, zero, -x], axis=-1),
+                np.stack([-y, x, zero], axis=-1),
+            ],
+            axis=-2,
         )
 
     def TEME_to_TOD(self, date):
@@ -94,6 +223,7 @@ class Orientation(Node):
     def CIRF_to_GCRF(self, date):
         return iau2010.precesion_nutation(date), None
 
+    @_constant
     def G50_to_EME2000(self, date):
         return (
             np.array(
@@ -106,6 +236,7 @@ class Orientation(Node):
             None,
         )
 
+    @_constant
     def GCRF_to_EME2000(self, date):
         return (
             np.array(
@@ -161,6 +292,7 @@ class TopocentricOrientation(Orientation):
 
         self.parent + self
 
+    @_constant
     def _to_parent(self, date):
         lat, lon, _ = self.latlonalt
         # the 'rot3(np.pi)' is here to place the X axis along the north direction
@@ -171,6 +303,8 @@ class TopocentricOrientation(Orientation):
 class LocalOrbitalOrientation(Orientation):
     """Local Orbital Orientation"""
 
+    volatile = True
+
     def __init__(self, name, statevector, orient, parent):
         """
         Args:
@@ -193,6 +327,9 @@ class LocalOrbitalOrientation(Orientation):
 
     def _to_parent(self, date):
 
+        if isinstance(date, DateArray):
+            return np.array([self._to_parent(d)[0] for d in date]), None
+
         if hasattr(self.statevector, "propagate"):
             sv = self.statevector.propagate(date).copy(
                 form="cartesian", frame=self.parent
@@ -20,6 +20,25 @@ from .commons import (
 from .cov import load_cov
 
 
+def _order(method, degree):
+    """Number of points used for interpolation, from the INTERPOLATION and
+    INTERPOLATION_DEGREE fields
+
+    As Hermite interpolation uses both positions and velocities,
+    a polynomial of degree 2n-1 only needs n points.
+    """
+    if method == Ephem.HERMITE:
+        return (degree + 1) // 2
+    return degree + 1
+
+
+def _degree(ephem):
+    """Value of the INTERPOLATION_DEGREE field of an ephemeris"""
+    if ephem.method == Ephem.HERMITE:
+        return 2 * ephem.order - 1
+    return ephem.order - 1
+
+
 def loads(string, fmt):
     """
     Args:
@@ -163,7 +182,7 @@ def _loads_kvn(string):
         # In case there is no recommendation for interpolation
         # default to a Lagrange 8th order
         method = ephem_dict.get("INTERPOLATION", "Lagrange").lower()
-        order = int(ephem_dict.get("INTERPOLATION_DEGREE", 7)) + 1
+        order = _order(method, int(ephem_dict.get("INTERPOLATION_DEGREE", 7)))
         ephem = Ephem(ephem_dict["orbits"], method=method, order=order)
 
         ephem.name = ephem_dict["OBJECT_NAME"]
@@ -226,10 +245,11 @@ def _loads_xml(string):
                         "Impossible to attach a covariance matrix to an orbit object"
                     )
 
+            method = metadata.get("INTERPOLATION", "Lagrange").text.lower()
             ephem = Ephem(
                 ephem,
-                method=metadata.get("INTERPOLATION", "Lagrange").text.lower(),
-                order=int(metadata.get("INTERPOLATION_DEGREE", 7).text) + 1,
+                method=method,
+                order=_order(method, int(metadata.get("INTERPOLATION_DEGREE", 7).text)),
             )
             ephem.name = metadata["OBJECT_NAME"].text
             ephem.cospar_id = metadata["OBJECT_ID"].text
@@ -258,7 +278,7 @@ def _dumps_kvn(data, **kwargs):
             "INTERPOLATION": data.method.upper(),
         }
         if data.method != data.LINEAR:
-            extras["INTERPOLATION_DEGREE"] = "{}".format(data.order - 1)
+            extras["INTERPOLATION_DEGREE"] = "{}".format(_degree(data))
 
         meta = dump_kvn_meta_odm(data, extras=extras, **kwargs)
 
@@ -322,7 +342,7 @@ def _dumps_xml(data, **kwargs):
             "INTERPOLATION": data.method.upper(),
         }
         if data.method != data.LINEAR:
-            extras["INTERPOLATION_DEGREE"] = str(data.order - 1)
+            extras["INTERPOLATION_DEGREE"] = str(_degree(data))
 
         dump_xml_meta_odm(segment, data, extras=extras, **kwargs)
 
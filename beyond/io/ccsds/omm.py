@@ -1,8 +1,10 @@
 import numpy as np
 import lxml.etree as ET
 
+from sgp4.earth_gravity import wgs72
+
 from ...orbits import Orbit
-from ...propagators.sgp4 import Sgp4, wgs72
+from ...propagators.sgp4 import Sgp4
 
 from .cov import load_cov, dump_cov
 from .commons import (
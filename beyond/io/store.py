@@ -0,0 +1,181 @@
+"""Binary ephemeris files, readable through memory-mapping
+
+Ephemerides too large to be comfortably loaded in memory, or shared by
+multiple processes, may be stored in a simple binary format and opened with
+:py:class:`numpy.memmap`. Only the parts of the file actually used (e.g. the
+few points around an interpolation date) are read from disk.
+
+.. code-block:: python
+
+    from beyond.io import store
+
+    store.dump(ephem, "fleet.eph")
+
+    ephem = store.load("fleet.eph")
+    ephem.propagate(date)  # reads only the points surrounding 'date'
+    sub = ephem[1000:2000]  # no data read nor copied
+
+    # Conversions from and to CCSDS OEM
+    store.from_oem("fleet.oem", "fleet.eph")
+    store.to_oem("fleet.eph", "fleet.oem")
+
+The file is made of a header followed by four columns, in little-endian
+byte order:
+
+- the days of each date (int64)
+- the seconds in the day of each date (float64)
+- the elapsed time since the first point, in seconds (float64)
+- the state vectors (6 float64 per point)
+
+The header is a line identifying the format, followed by the metadata of
+the ephemeris (frame, form, timescale, interpolation method, etc.) encoded
+in JSON, padded with spaces to a multiple of 64 bytes.
+
+The ephemerides loaded by :py:func:`load` are read-only: changing their
+frame or form creates new arrays in memory, leaving the file untouched.
+"""
+
+import json
+
+import numpy as np
+
+from ..dates import DateArray
+from ..orbits.ephem import Ephem
+from . import ccsds
+
+__all__ = ["dump", "load", "from_oem", "to_oem"]
+
+MAGIC = b"BEYOND-EPHEM 1\n"
+ALIGN = 64
+
+
+def dump(ephem, filename):
+    """Write an ephemeris in a binary file
+
+    Args:
+        ephem (Ephem): Ephemeris to write. All the points should share the
+            same frame and form.
+        filename (str or pathlib.Path): Path of the file
+    """
+
+    name = getattr(ephem, "name", None)
+    cospar_id = getattr(ephem, "cospar_id", None)
+
+    if not ephem.columnar:
+        ephem = Ephem(ephem, columnar=True, method=ephem.method, order=ephem.order)
+
+    dates = DateArray.from_dates(ephem.dates)
+    d, s = dates.d, dates.s
+    t = (d - d[0]) * 86400.0 + (s - s[0])
+
+    step = None
+    if len(t) > 1:
+        dt = np.diff(t)
+        if dt[0] > 0 and np.abs(dt - dt[0]).max() <= Ephem.STEP_TOLERANCE:
+            step = float(t[-1] / (len(t) - 1))
+
+    header = {
+        "count": len(ephem),
+        "scale": dates.scale.name,
+        "frame": ephem.frame.name,
+        "form": ephem.form.name,
+        "method": ephem.method,
+        "order": ephem.order,
+        "step": step,
+        "name": name,
+        "cospar_id": cospar_id,
+    }
+
+    text = MAGIC + json.dumps(header).encode() + b"\n"
+    text += b" " * (-len(text) % ALIGN)
+
+    with open(filename, "wb") as fp:
+        fp.write(text)
+        fp.write(np.ascontiguousarray(d, dtype="<i8").tobytes())
+        fp.write(np.ascontiguousarray(s, dtype="<f8").tobytes())
+        fp.write(np.ascontiguousarray(t, dtype="<f8").tobytes())
+        fp.write(np.ascontiguousarray(ephem[:, :], dtype="<f8").tobytes())
+
+
+def load(filename):
+    """Open a binary ephemeris file
+
+    The file is memory-mapped, and only read when the data are accessed.
+
+    Args:
+        filename (str or pathlib.Path): Path of the file
+    Return:
+        Ephem: Columnar ephemeris
+    Raise:
+        ValueError: if the file is not a binary ephemeris
+    """
+
+    with open(filename, "rb") as fp:
+        if fp.readline() != MAGIC:
+            raise ValueError("'{}' is not a binary ephemeris file".format(filename))
+        header = json.loads(fp.readline())
+        offset = fp.tell()
+
+    offset += -offset % ALIGN
+    n = header["count"]
+
+    def column(dtype, start, shape):
+        return np.memmap(
+            filename, dtype=dtype, mode="r", offset=offset + start * 8, shape=shape
+        )
+
+    d = column("<i8", 0, (n,))
+    s = column("<f8", n, (n,))
+    t = column("<f8", 2 * n, (n,))
+    coords = column("<f8", 3 * n, (n, 6))
+
+    ephem = Ephem.from_array(
+        coords,
+        DateArray(d, s, scale=header["scale"], normalize=False),
+        header["form"],
+        header["frame"],
+        method=header["method"],
+        order=header["order"],
+        times=(t, header["step"]),
+    )
+    # Absent attributes keep the default values of the writers (e.g. CCSDS)
+    for key in ("name", "cospar_id"):
+        if header[key] is not None:
+            setattr(ephem, key, header[key])
+
+    return ephem
+
+
+def from_oem(oem_filename, filename):
+    """Convert a CCSDS OEM file into a binary ephemeris file
+
+    Args:
+        oem_filename (str or pathlib.Path): Path of the OEM file, in KVN or XML
+        filename (str or pathlib.Path): Path of the binary file to create
+    Raise:
+        ValueError: if the OEM contains more than one segment
+    """
+
+    with open(oem_filename) as fp:
+        ephem = ccsds.loads(fp.read())
+
+    if isinstance(ephem, list):
+        raise ValueError("Only single-segment OEM can be converted")
+
+    dump(ephem, filename)
+
+
+def to_oem(filename, oem_filename, **kwargs):
+    """Convert a binary ephemeris file into a CCSDS OEM file
+
+    Args:
+        filename (str or pathlib.Path): Path of the binary file
+        oem_filename (str or pathlib.Path): Path of the OEM file to create
+    Any other keyword argument is given to :py:func:`beyond.io.ccsds.dumps`
+    (e.g. ``fmt="xml"``)
+    """
+
+    ephem = load(filename)
+
+    with open(oem_filename, "w") as fp:
+        fp.write(ccsds.dumps(ephem, **kwargs))
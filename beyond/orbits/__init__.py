@@ -1,3 +1,4 @@
 from .orbit import Orbit
 from .statevector import StateVector
 from .ephem import Ephem
+from .cheb import ChebEphem
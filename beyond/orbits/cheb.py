@@ -0,0 +1,386 @@
+"""Compression of ephemerides into Chebyshev polynomials
+
+Similarly to the type 3 segments of the SPICE SPK files, a :py:class:`ChebEphem`
+splits the time span of an ephemeris into segments, each of them storing the
+coefficients of the Chebyshev polynomials approximating the six cartesian
+components of the state vector.
+
+.. code-block:: python
+
+    ephem = orb.ephem(start=Date(2021, 1, 1), stop=timedelta(days=30), step=timedelta(seconds=60))
+
+    cheb = ChebEphem.from_ephem(ephem, tol=0.1)  # 10 cm
+    cheb.propagate(Date(2021, 1, 12, 3, 14))
+
+    cheb.save("fleet.npz")
+    cheb = ChebEphem.load("fleet.npz")
+
+The segments are found by recursively halving the time span of the ephemeris
+until the polynomials of each segment match the ephemeris within tolerance,
+at its points and halfway between them.
+"""
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from .forms import CART
+from .ephem import Ephem
+from .statevector import StateVector
+from ..dates import Date, DateArray, timedelta
+from ..frames.frames import orbit2frame, get_frame
+from ..propagators.listeners import Speaker
+
+__all__ = ["ChebEphem"]
+
+
+class ChebEphem(Speaker):
+    """Ephemeris stored as piecewise Chebyshev polynomials
+
+    It exposes the same interface as :py:class:`~beyond.orbits.ephem.Ephem` for
+    propagation (:py:meth:`propagate`, :py:meth:`iter`, :py:meth:`ephem`,
+    :py:meth:`as_frame`), the state vectors being provided in cartesian form.
+    """
+
+    DEFAULT_DEGREE = 12
+    """Degree of the polynomials of each segment"""
+
+    def __init__(self, start, bounds, coefs, frame, step=None):
+        """
+        Args:
+            start (Date): Reference date of the ephemeris
+            bounds (numpy.ndarray): (K+1,) bounds of the segments, in seconds
+                since ``start``
+            coefs (numpy.ndarray): (K, degree+1, 6) coefficients of the Chebyshev
+                polynomials of each segment
+            frame (str or Frame): Reference frame of the state vectors
+            step (timedelta): Step of the original ephemeris, used by
+                :py:meth:`iter` when no step is provided
+        """
+
+        if isinstance(frame, str):
+            frame = get_frame(frame)
+
+        self._start = start
+        self.bounds = np.asarray(bounds, dtype=float)
+        self.coefs = np.asarray(coefs, dtype=float)
+        self.frame = frame
+        self.step = step
+
+    @classmethod
+    def from_ephem(cls, ephem, tol=1.0, vtol=None, degree=None):
+        """Fit an ephemeris with piecewise Chebyshev polynomials
+
+        Args:
+            ephem (Ephem): Ephemeris to compress
+            tol (float): Maximum error on the position, in meters
+            vtol (float): Maximum error on the velocity, in m/s. Default to
+                ``tol / 1000``
+            degree (int): Degree of the polynomials. Default to
+                :py:attr:`DEFAULT_DEGREE`
+        Return:
+            ChebEphem
+        Raise:
+            ValueError: if the tolerance can't be met, even with segments
+                spanning only ``degree + 1`` to ``2 * degree`` points of the ephemeris
+        """
+
+        degree = cls.DEFAULT_DEGREE if degree is None else degree
+        vtol = tol / 1000 if vtol is None else vtol
+
+        if len(ephem) < degree + 1:
+            raise ValueError(
+                "len(ephem) < degree + 1 : impossible to fit the ephemeris"
+            )
+
+        if ephem.form != CART:
+            ephem = ephem.copy(form=CART)
+
+        dates = DateArray.from_dates(ephem.dates)
+        start = dates[0]
+        t = dates - start
+        y = np.array(ephem[:, :], dtype=float)
+
+        # The ephemeris is also checked halfway between its points
+        dt = np.diff(t)
+        mid_dates = DateArray(dates.d[:-1], dates.s[:-1] + dt / 2, scale=dates.scale)
+        t_mid = t[:-1] + dt / 2
+        y_mid = ephem.interpolate_many(mid_dates)[:, :]
+
+        tolerance = np.array([tol] * 3 + [vtol] * 3)
+
+        bounds = [0]
+        coefs = []
+
+        # Segments to process, as [first point, last point], in chronological order
+        todo = [(0, len(t) - 1)]
+        while todo:
+            i, j = todo.pop()
+            a, b = t[i], t[j]
+
+            c = chebyshev.chebfit(cls._tau(t[i : j + 1], a, b), y[i : j + 1], degree)
+
+            error = np.abs(chebyshev.chebval(cls._tau(t[i : j + 1], a, b), c).T - y[i : j + 1])
+            error_mid = np.abs(
+                chebyshev.chebval(cls._tau(t_mid[i:j], a, b), c).T - y_mid[i:j]
+            )
+
+            if (error <= tolerance).all() and (error_mid <= tolerance).all():
+                bounds.append(j)
+                coefs.append(c)
+            elif j - i < 2 * degree:
+                raise ValueError(
+                    "Tolerance not reached with polynomials of degree {}".format(degree)
+                )
+            else:
+                k = (i + j) // 2
+                todo.append((k, j))
+                todo.append((i, k))
+
+        step = None
+        if np.ptp(dt) < 1e-6:
+            step = timedelta(seconds=dt[0])
+
+        return cls(start, t[bounds], np.array(coefs), ephem.frame, step=step)
+
+    @staticmethod
+    def _tau(t, a, b):
+        """Mapping of times from the [a, b] interval to [-1, 1]"""
+        return 2 * (t - a) / (b - a) - 1
+
+    def __len__(self):
+        """Number of segments"""
+        return len(self.coefs)
+
+    @property
+    def start(self):
+        """Date of the start of the ephemeris"""
+        return self._start
+
+    @property
+    def stop(self):
+        """Date of the end of the ephemeris"""
+        return self._start + timedelta(seconds=self.bounds[-1])
+
+    @property
+    def form(self):
+        """Form of the state vectors"""
+        return CART
+
+    @property
+    def degree(self):
+        """Degree of the polynomials"""
+        return self.coefs.shape[1] - 1
+
+    def _evaluate(self, x):
+        """Evaluation of the polynomials
+
+        Args:
+            x (numpy.ndarray): (M,) times, in seconds since :py:attr:`start`
+        Return:
+            numpy.ndarray: (M, 6) state vectors
+        """
+
+        seg = np.clip(np.searchsorted(self.bounds, x, side="right") - 1, 0, len(self) - 1)
+        tau = self._tau(x, self.bounds[seg], self.bounds[seg + 1])
+
+        # Dates are grouped by segment, so each polynomial is evaluated
+        # once on all the dates it covers
+        order = np.argsort(seg, kind="stable")
+        limits = np.searchsorted(seg[order], np.arange(len(self) + 1))
+
+        result = np.empty((len(x), 6))
+        for k in np.unique(seg):
+            idx = order[limits[k] : limits[k + 1]]
+            result[idx] = chebyshev.chebval(tau[idx], self.coefs[k]).T
+
+        return result
+
+    def _seconds(self, date):
+        """Elapsed time between the start of the ephemeris and a given date,
+        in seconds
+        """
+        # The reference timescale avoids the rounding of Date.change_scale()
+        return (date._d - self.start._d) * 86400.0 + (date._s - self.start._s)
+
+    def _check_range(self, x):
+        if len(x) and (x.min() < 0 or x.max() > self.bounds[-1]):
+            raise ValueError(
+                "Dates not in range [{}, {}]".format(self.start, self.stop)
+            )
+
+    def propagate(self, date):
+        """Compute the state vector at a given date
+
+        Args:
+            date (Date):
+        Return:
+            StateVector:
+        Raise:
+            ValueError: when date is not in the range of the ephemeris
+        """
+
+        x = np.array([self._seconds(date)])
+        self._check_range(x)
+
+        return StateVector(self._evaluate(x)[0], date, CART, self.frame)
+
+    interpolate = propagate
+    """Alias of :py:meth:`propagate`"""
+
+    def interpolate_many(self, dates, return_index=False):
+        """Compute the state vectors at multiple dates at once
+
+        Args:
+            dates (DateArray or iterable of Date):
+            return_index (bool): If ``True``, also return the index of each
+                date in the resulting ephemeris
+        Return:
+            Ephem: columnar ephemeris, in chronological order. See
+            :py:meth:`Ephem.interpolate_many() <beyond.orbits.ephem.Ephem.interpolate_many>`
+        Raise:
+            ValueError: when a date is not in the range of the ephemeris
+        """
+
+        if not isinstance(dates, DateArray):
+            dates = DateArray.from_dates(dates)
+
+        perm = np.lexsort((dates.s, dates.d))
+        dates = dates[perm]
+        index = np.empty_like(perm)
+        index[perm] = np.arange(len(perm))
+
+        x = dates - self.start
+        self._check_range(x)
+
+        new = Ephem.from_array(self._evaluate(x), dates, CART, self.frame)
+        return (new, index) if return_index else new
+
+    def iter(
+        self, *, dates=None, start=None, stop=None, step=None, strict=True, **kwargs
+    ):
+        """Ephemeris generator
+
+        Keyword Arguments:
+            dates (list of :py:class:`~beyond.dates.date.Date`): Dates from which iterate over
+            start (Date or None): Date of the first point. Default to :py:attr:`start`
+            stop (Date, timedelta or None): Date of the last point. Default to :py:attr:`stop`
+            step (timedelta or None): Step to use during the computation. Use the step
+                of the original ephemeris if `None`
+            listeners (list of:py:class:`~beyond.orbits.listeners.Listener`):
+            strict (bool): If True, the method will return a ValueError if ``start`` or ``stop`` is
+                not in the range of the ephemeris. If False, it will take the closest point in each
+                case.
+        Yield:
+            :py:class:`StateVector`:
+        Raise:
+            ValueError
+
+        See :py:meth:`Ephem.iter() <beyond.orbits.ephem.Ephem.iter>`
+        """
+
+        listeners = kwargs.get("listeners", [])
+
+        self.clear_listeners(listeners)
+
+        if dates is None:
+            if start is None:
+                start = self.start
+            elif start < self.start:
+                if strict:
+                    raise ValueError(
+                        "Start date not in range [{}, {}]".format(self.start, self.stop)
+                    )
+                start = self.start
+
+            if stop is None:
+                stop = self.stop
+            else:
+                if isinstance(stop, timedelta):
+                    stop = start + stop
+                if stop > self.stop:
+                    if strict:
+                        raise ValueError(
+                            "Stop date not in range [{}, {}]".format(
+                                self.start, self.stop
+                            )
+                        )
+                    stop = self.stop
+
+            if step is None:
+                step = self.step
+                if step is None:
+                    raise ValueError("No step provided")
+
+            dates = Date.range(start, stop, step, inclusive=True)
+
+        for date in dates:
+            orb = self.propagate(date)
+
+            # Listeners
+            for listen_orb in self.listen(orb, listeners):
+                yield listen_orb
+
+            yield orb
+
+    def ephemeris(self, *args, **kwargs):
+        """Same as :py:meth:`self.iter() <iter>`
+
+        Implemented to expose the same methods as :py:class:`Orbit`
+        """
+        return self.iter(*args, **kwargs)
+
+    def ephem(self, *args, **kwargs):
+        """Create an Ephem object
+
+        Take the same keyword arguments as :py:meth:`ephemeris`
+
+        Return:
+            Ephem:
+        """
+
+        return Ephem(self.ephemeris(*args, **kwargs))
+
+    def as_frame(self, name, **kwargs):  # pragma: no cover
+        """Register the ephemeris as a frame
+
+        see :py:func:`beyond.frames.frames.orbit2frame` for details of the arguments
+        """
+        return orbit2frame(name, self, **kwargs)
+
+    def save(self, file):
+        """Save the ephemeris in the NumPy ``.npz`` format
+
+        Args:
+            file (str, pathlib.Path or file-like object):
+        """
+
+        np.savez(
+            file,
+            bounds=self.bounds,
+            coefs=self.coefs,
+            start=np.array([self.start.d, self.start.s]),
+            scale=self.start.scale.name,
+            frame=self.frame.name,
+            step=self.step.total_seconds() if self.step is not None else np.nan,
+        )
+
+    @classmethod
+    def load(cls, file):
+        """Load an ephemeris saved by :py:meth:`save`
+
+        Args:
+            file (str, pathlib.Path or file-like object):
+        Return:
+            ChebEphem
+        """
+
+        with np.load(file) as data:
+            d, s = data["start"]
+            step = float(data["step"])
+            return cls(
+                Date(int(d), float(s), scale=str(data["scale"])),
+                data["bounds"],
+                data["coefs"],
+                str(data["frame"]),
+                step=None if np.isnan(step) else timedelta(seconds=step),
+            )
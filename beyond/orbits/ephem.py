@@ -2,11 +2,68 @@
 """
 
 import numpy as np
+from math import factorial
 from datetime import timedelta
 
 from .statevector import StateVector
+from .forms import CART, get_form
+from ..errors import OrbitError
+from ..utils.memoize import memoize
+from ..dates import DateArray
 from ..propagators.listeners import Speaker
-from ..frames.frames import orbit2frame
+from ..frames.frames import orbit2frame, get_frame
+
+
+@memoize
+def _barycentric_weights(n):
+    """Weights of the barycentric Lagrange interpolation for n equally
+    spaced points
+
+    w_j = (-1)^j C(n-1, j)
+    """
+    return np.array(
+        [
+            (-1) ** j * (factorial(n - 1) // (factorial(j) * factorial(n - 1 - j)))
+            for j in range(n)
+        ],
+        dtype=float,
+    )
+
+
+class _Orbits(list):
+    """List of the orbits of an ephemeris, counting its modifications in
+    order to invalidate the values computed from it
+    """
+
+    version = 0
+
+
+def _modifier(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_Orbits, _name, _modifier(_name))
 
 
 class Ephem(Speaker):
@@ -23,29 +80,180 @@ class Ephem(Speaker):
         ephem.form = 'spherical'
         latitudes = ephem[:,1]
         longitudes = ephem[:,2]
+
+    By default, the ephemeris is a list of :py:class:`StateVector` objects. In
+    *columnar* mode (see :py:meth:`from_array` and the ``columnar`` argument), the
+    coordinates are stored in a single (N, 6) array and the dates in a
+    :py:class:`~beyond.dates.date.DateArray`, all the points sharing the same form,
+    frame and metadata. The :py:class:`StateVector` objects are then only created
+    when accessed, and slicing the ephemeris does not copy any data.
+
+    .. code-block:: python
+
+        ephem = Ephem.from_array(coords, dates, "cartesian", "EME2000")
+        ephem[:, 0]  # view on the X column
+        ephem[100:200]  # Ephem object sharing the data of the original one
     """
 
     LINEAR = "linear"
     LAGRANGE = "lagrange"
+    HERMITE = "hermite"
     DEFAULT_ORDER = 8
 
-    def __init__(self, orbits, method=None, order=None):
-        self._orbits = list(sorted(orbits, key=lambda x: x.date))
+    STEP_TOLERANCE = 1e-6
+    """Maximum deviation of the time between two points, in seconds, for the
+    step of an ephemeris to be considered constant"""
+
+    def __init__(self, orbits, method=None, order=None, columnar=False):
+        """
+        Args:
+            orbits (iterable of StateVector): Points of the ephemeris
+            method (str): Interpolation method
+            order (int): Interpolation order
+            columnar (bool): If ``True``, the points are stored as columns. This
+                requires all the points to share the same form and frame, and
+                only the date and coordinates of each point are kept.
+        """
+
+        orbits = _Orbits(orbits)
+        if any(a.date > b.date for a, b in zip(orbits[:-1], orbits[1:])):
+            orbits.sort(key=lambda x: x.date)
+
         self.method = self.LAGRANGE if method is None else method
         self.order = order if isinstance(order, int) else self.DEFAULT_ORDER
 
+        self._orbits = orbits
+        self._array = None
+        self._time_cache = None
+
+        if columnar and orbits:
+            form, frame = orbits[0].form, orbits[0].frame
+            if any(orb.form != form or orb.frame != frame for orb in orbits):
+                raise ValueError("Columnar ephemeris should have a single form and frame")
+
+            self._set_columns(
+                np.array([orb.base for orb in orbits]),
+                DateArray.from_dates(orb.date for orb in orbits),
+                {"form": form, "frame": frame},
+            )
+
+    @classmethod
+    def from_array(
+        cls, coords, dates, form, frame, method=None, order=None, times=None, **kwargs
+    ):
+        """Create a columnar ephemeris
+
+        Args:
+            coords (numpy.ndarray): (N, 6) array of coordinates. It is not copied
+                if already an array of floats in chronological order
+            dates (DateArray or iterable of Date): Dates of each point
+            form (str or Form): Form of the coordinates
+            frame (str or Frame): Reference frame of the coordinates
+            method (str): Interpolation method
+            order (int): Interpolation order
+            times (tuple): Elapsed time since the first point for each point
+                (in seconds) and constant step (``None`` if not constant), if
+                already known. The points are then assumed to be in
+                chronological order.
+        Any other keyword argument is given to each :py:class:`StateVector`
+        created from the ephemeris
+        Return:
+            Ephem:
+        """
+
+        coords = np.asarray(coords, dtype=float)
+
+        if not isinstance(dates, DateArray):
+            dates = DateArray.from_dates(dates)
+
+        if coords.ndim != 2 or coords.shape[1] != 6 or len(coords) != len(dates):
+            raise OrbitError(
+                "Coordinates should be of shape ({}, 6), got {}".format(
+                    len(dates), coords.shape
+                )
+            )
+
+        d, s = dates.d, dates.s
+        if times is None and np.any(
+            (d[1:] < d[:-1]) | ((d[1:] == d[:-1]) & (s[1:] < s[:-1]))
+        ):
+            idx = np.lexsort((s, d))
+            coords, dates = coords[idx], dates[idx]
+
+        if isinstance(form, str):
+            form = get_form(form)
+
+        if isinstance(frame, str):
+            frame = get_frame(frame)
+
+        kwargs.update(form=form, frame=frame)
+
+        new = cls.__new__(cls)
+        new.method = cls.LAGRANGE if method is None else method
+        new.order = order if isinstance(order, int) else cls.DEFAULT_ORDER
+        new._orbits = None
+        new._set_columns(coords, dates, kwargs)
+
+        if times is not None:
+            new._time_cache = (dates,) + tuple(times)
+
+        return new
+
+    def _set_columns(self, array, dates, meta):
+        self._orbits = None
+        self._array = array
+        self._dates = dates
+        self._meta = meta
+        self._time_cache = None
+
+    def _view(self, array, dates):
+        """Columnar ephemeris sharing the properties of this one"""
+        new = self.__class__.__new__(self.__class__)
+        new.method = self.method
+        new.order = self.order
+        new._set_columns(array, dates, self._meta)
+        return new
+
+    @property
+    def columnar(self):
+        """``True`` if the points are stored as columns"""
+        return self._array is not None
+
+    def _orbit(self, index):
+        """Creation of the StateVector object of a columnar ephemeris"""
+        meta = self._meta.copy()
+        return StateVector(
+            self._array[index],
+            self._dates[index],
+            meta.pop("form"),
+            meta.pop("frame"),
+            **meta,
+        )
+
+    def _date(self, index):
+        if self.columnar:
+            return self._dates[index]
+        return self._orbits[index].date
+
     def __iter__(self):
         self._i = -1
         return self
 
     def __next__(self):
         self._i += 1
-        if self._i >= len(self._orbits):
+        if self._i >= len(self):
             raise StopIteration
-        return self._orbits[self._i]
+        return self[self._i]
 
     def __getitem__(self, index):
-        if isinstance(index, (slice, int)):
+        if self.columnar:
+            if isinstance(index, (int, np.integer)):
+                return self._orbit(index)
+            elif isinstance(index, slice):
+                return self._view(self._array[index], self._dates[index])
+            else:
+                return self._array[index]
+        elif isinstance(index, (slice, int)):
             # retrieve a defined Orbit object
             return self._orbits[index]
         else:
@@ -53,21 +261,29 @@ class Ephem(Speaker):
             return np.array(self._orbits)[index]
 
     def __len__(self):
+        if self.columnar:
+            return len(self._array)
         return len(self._orbits)
 
     @property
     def start(self):
         """Date of the first element"""
+        if self.columnar:
+            return self._dates[0]
         return self._orbits[0].date
 
     @property
     def stop(self):
         """Date of the last element"""
+        if self.columnar:
+            return self._dates[-1]
         return self._orbits[-1].date
 
     @property
     def dates(self):
         """Generator yielding Dates of each Orbit object of the ephem"""
+        if self.columnar:
+            return iter(self._dates)
         return (o.date for o in self)
 
     # @property
@@ -79,32 +295,115 @@ class Ephem(Speaker):
     @property
     def frame(self):
         """Get the frame of the first point"""
+        if self.columnar:
+            return self._meta["frame"]
         return self._orbits[0].frame
 
     @frame.setter
-    def frame(self, frame):  # pragma: no cover
-        """Change the frames of all points"""
-        for orb in self:
-            orb.frame = frame
+    def frame(self, frame):
+        """Change the frames of all points
+
+        All the points are converted at once (see
+        :py:meth:`Frame.transform_array() <beyond.frames.frames.Frame.transform_array>`),
+        unless the ephemeris mixes frames or forms, or carries covariances.
+        """
+
+        if isinstance(frame, str):
+            frame = get_frame(frame)
+
+        if self.columnar:
+            self._set_frame_columns(frame)
+            return
+
+        old_frame = self.frame
+        form = self.form
+
+        if any(
+            orb.frame != old_frame or orb.form != form or orb.cov is not None
+            for orb in self._orbits
+        ):
+            for orb in self._orbits:
+                orb.frame = frame
+            return
+
+        if frame == old_frame:
+            return
+
+        if form != CART:
+            for orb in self._orbits:
+                orb.form = CART
+
+        try:
+            coords = old_frame.transform_array(
+                np.array(self._orbits),
+                DateArray.from_dates(orb.date for orb in self._orbits),
+                frame,
+            )
+
+            for orb, coord in zip(self._orbits, coords):
+                orb.base.setfield(coord, dtype=float)
+                orb._data["frame"] = frame
+        finally:
+            if form != CART:
+                for orb in self._orbits:
+                    orb.form = form
+
+    def _set_frame_columns(self, frame):
+        """Frame change of a columnar ephemeris
+
+        The result is stored in a new array, leaving untouched the
+        ephemerides sharing the data of this one
+        """
+
+        if frame == self.frame:
+            return
+
+        form = self.form
+        self.form = CART
+        try:
+            array = self.frame.transform_array(self._array, self._dates, frame)
+            self._set_columns(array, self._dates, dict(self._meta, frame=frame))
+        finally:
+            self.form = form
 
     @property
     def form(self):  # pragma: no cover
         """Get the form of the first point"""
+        if self.columnar:
+            return self._meta["form"]
         return self._orbits[0].form
 
     @form.setter
     def form(self, form):  # pragma: no cover
         """Change the form of all points"""
-        for orb in self:
-            orb.form = form
+
+        if not self.columnar:
+            for orb in self:
+                orb.form = form
+            return
+
+        if isinstance(form, str):
+            form = get_form(form)
+
+        if form == self.form:
+            return
+
+        array = np.array([orb.form(orb, form) for orb in self]).reshape(-1, 6)
+        self._set_columns(array, self._dates, dict(self._meta, form=form))
 
     def interpolate(self, date, method=None, order=None):
         """Interpolate data at a given date
 
+        The ``HERMITE`` method uses both positions and velocities of each
+        point, and needs about half as many points as the ``LAGRANGE``
+        method for the same accuracy. The velocities should then be
+        the derivatives of the positions.
+
         Args:
             date (Date):
             method (str): Method of interpolation to use
-            order (int): In case of ``LAGRANGE`` method is used
+            order (int): Number of points used by the ``LAGRANGE`` and
+                ``HERMITE`` methods
         Return:
             Orbit:
         Raise:
@@ -117,21 +416,9 @@ class Ephem(Speaker):
                 "Date '{}' not in range [{}, {}]".format(date, self.start, self.stop)
             )
 
-        prev_idx = 0
-        ephem = self
-
-        # Binary search of the orbit step just before the desired date
-        while True:
-            idx = len(ephem)
-            if idx == 1:
-                break
-            k = idx // 2
-
-            if date > ephem[k].date:
-                prev_idx += k
-                ephem = ephem[k:]
-            else:
-                ephem = ephem[:k]
+        _, t, step = self._times
+        x = self._seconds(date)
+        prev_idx = int(self._prev_index(np.array([x]))[0])
 
         method = method if method is not None else self.method
         order = order if order is not None else self.order
@@ -141,11 +428,11 @@ class Ephem(Speaker):
             y0 = self[prev_idx]
             y1 = self[prev_idx + 1]
 
-            result = y0[:] + (y1[:] - y0[:]) * (date.mjd - y0.date.mjd) / (
-                y1.date.mjd - y0.date.mjd
+            result = y0[:] + (y1[:] - y0[:]) * (x - t[prev_idx]) / (
+                t[prev_idx + 1] - t[prev_idx]
             )
 
-        elif method == self.LAGRANGE:
+        elif method in (self.LAGRANGE, self.HERMITE):
 
             stop = prev_idx + 1 + order // 2 + order % 2
             start = prev_idx - order // 2 + 1
@@ -157,13 +444,37 @@ class Ephem(Speaker):
 
             # selection of the subset of data, of length 'order' around the desired value
             subset = self[start:stop]
-            date_subset = np.array([x.date.mjd for x in subset])
-
-            result = np.zeros(6)
 
             if len(subset) < order:
                 raise ValueError("len(ephem) < order : impossible to interpolate")
 
+        else:
+            raise ValueError("Unkown interpolation method", method)
+
+        if method == self.HERMITE:
+
+            orb = self[prev_idx]
+            t_sub = t[start : start + len(subset)] - x
+            y_sub = np.array([x.copy(form=CART).base for x in subset])
+
+            result = self._hermite(np.zeros(1), t_sub[None], y_sub[None])[0]
+
+            new = StateVector(result, date, CART, orb.frame)
+            new.form = orb.form
+            return new
+
+        elif method == self.LAGRANGE and step is not None:
+
+            y_sub = np.array([x.base for x in subset])
+            u = np.array([(x - t[start]) / step])
+            result = self._barycentric(u, y_sub[None])[0]
+
+        elif method == self.LAGRANGE:
+
+            date_subset = t[start : start + len(subset)]
+
+            result = np.zeros(6)
+
             # Everything is on wikipedia
             #        k
             # L(x) = Σ y_j * l_j(x)
@@ -175,17 +486,267 @@ class Ephem(Speaker):
             for j in range(order):
                 # This mask is here to enforce the m != j in the lagrange polynomials
                 mask = date_subset != date_subset[j]
-                l_j = (date.mjd - date_subset[mask]) / (
+                l_j = (x - date_subset[mask]) / (
                     date_subset[j] - date_subset[mask]
                 )
                 result = result + l_j.prod() * subset[j]
 
+        orb = self[prev_idx]
+
+        return StateVector(result, date, orb.form, orb.frame)
+
+    def interpolate_many(self, dates, method=None, order=None, return_index=False):
+        """Interpolate data at multiple dates at once
+
+        Contrary to :py:meth:`interpolate`, the interpolation windows of all
+        the dates are located at once, and the interpolation is computed on
+        the whole set of dates.
+
+        As any ephemeris, the result is in chronological order, whatever the
+        order of ``dates``. The position of each date in the result is given
+        by the index returned when ``return_index`` is ``True``, so that
+        ``ephem[:, :][index]`` follows the order of ``dates``.
+
+        Args:
+            dates (DateArray or iterable of Date):
+            method (str): Method of interpolation to use
+            order (int): Number of points used by the ``LAGRANGE`` and
+                ``HERMITE`` methods
+            return_index (bool): If ``True``, also return the index of each
+                date in the resulting ephemeris
+        Return:
+            Ephem: Columnar ephemeris (see :py:meth:`from_array`). The
+            (M, 6) array of interpolated coordinates is accessible
+            via ``ephem[:, :]``. If ``return_index`` is ``True``, a tuple
+            of the ephemeris and of the (M,) array of indices.
+        Raise:
+            ValueError: when a date is not in the range of the ephemeris
+            ValueError: when the order of interpolation is insufficient
+        """
+
+        ref, t, step = self._times
+
+        if not isinstance(dates, DateArray):
+            dates = DateArray.from_dates(dates, scale=ref.scale)
+        elif dates.scale is not ref.scale:
+            dates = dates.change_scale(ref.scale)
+
+        # The computation is done on the dates in chronological order
+        perm = np.lexsort((dates.s, dates.d))
+        dates = dates[perm]
+        index = np.empty_like(perm)
+        index[perm] = np.arange(len(perm))
+
+        x = (dates.d - ref.d[0]) * 86400.0 + (dates.s - ref.s[0])
+
+        if len(x) and (x.min() < t[0] or x.max() > t[-1]):
+            raise ValueError(
+                "Dates not in range [{}, {}]".format(self.start, self.stop)
+            )
+
+        method = method if method is not None else self.method
+        order = order if order is not None else self.order
+
+        if self.columnar:
+            y = self._array
+        else:
+            y = np.array([o.base for o in self._orbits])
+
+        prev_idx = self._prev_index(x)
+
+        if method == self.LINEAR:
+            prev_idx = np.minimum(prev_idx, len(t) - 2)
+            t0, t1 = t[prev_idx], t[prev_idx + 1]
+            y0, y1 = y[prev_idx], y[prev_idx + 1]
+            result = y0 + (y1 - y0) * ((x - t0) / (t1 - t0))[:, None]
+
+        elif method in (self.LAGRANGE, self.HERMITE):
+
+            if len(t) < order:
+                raise ValueError("len(ephem) < order : impossible to interpolate")
+
+            # Windows of 'order' points around each date
+            start = np.clip(prev_idx - order // 2 + 1, 0, len(t) - order)
+            idx = start[:, None] + np.arange(order)
+            t_sub = t[idx]
+
         else:
             raise ValueError("Unkown interpolation method", method)
 
-        orb = ephem[0]
+        if method == self.HERMITE:
+            if self.form != CART:
+                y = np.array([orb.form(orb, CART) for orb in self]).reshape(-1, 6)
 
-        return StateVector(result, date, orb.form, orb.frame)
+            result = self._hermite(x, t_sub, y[idx])
+
+        elif method == self.LAGRANGE and step is not None:
+
+            result = self._barycentric((x - t[start]) / step, y[idx])
+
+        elif method == self.LAGRANGE:
+
+            # Basis polynomials (see interpolate() for the details)
+            #  l_j(x) = Π (x - x_m) / (x_j - x_m)
+            #          m != j
+            num = np.broadcast_to((x[:, None] - t_sub)[:, None, :], idx.shape + (order,))
+            den = t_sub[:, :, None] - t_sub[:, None, :]
+            diag = np.eye(order, dtype=bool)
+            l = np.where(diag, 1.0, num / np.where(diag, 1.0, den)).prod(axis=-1)
+
+            result = np.einsum("mj,mjk->mk", l, y[idx])
+
+        new = self.from_array(
+            result,
+            dates,
+            CART if method == self.HERMITE else self.form,
+            self.frame,
+            method=self.method,
+            order=self.order,
+        )
+
+        if method == self.HERMITE:
+            # The Hermite interpolation is computed in cartesian form
+            new.form = self.form
+
+        return (new, index) if return_index else new
+
+    @property
+    def _times(self):
+        """Dates of the points, elapsed time since the first point (in seconds)
+        and step between points (``None`` if not constant)
+
+        Computed at the first interpolation, and kept afterward until the
+        points are modified
+        """
+
+        if self._time_cache is not None and (
+            self.columnar or self._time_version == self._orbits.version
+        ):
+            return self._time_cache
+
+        if self.columnar:
+            ref = self._dates
+        else:
+            ref = DateArray.from_dates(o.date for o in self._orbits)
+            self._time_version = self._orbits.version
+
+        t = (ref.d - ref.d[0]) * 86400.0 + (ref.s - ref.s[0])
+
+        step = None
+        if len(t) > 1:
+            step = (t[-1] - t[0]) / (len(t) - 1)
+            if step <= 0 or np.abs(np.diff(t) - step).max() > self.STEP_TOLERANCE:
+                step = None
+
+        self._time_cache = ref, t, step
+
+        return self._time_cache
+
+    def _seconds(self, date):
+        """Elapsed time between the first point and a given date, in seconds"""
+        ref = self._times[0]
+        if date.scale is not ref.scale:
+            date = date.change_scale(ref.scale.name)
+        return (date.d - ref.d[0]) * 86400.0 + (date.s - ref.s[0])
+
+    def _prev_index(self, x):
+        """Index of the point just before each date
+
+        Args:
+            x (numpy.ndarray): Elapsed time since the first point, in seconds
+        Return:
+            numpy.ndarray: Indices, as integers
+        """
+
+        _, t, step = self._times
+
+        if step is None:
+            idx = np.searchsorted(t, x, side="left") - 1
+        else:
+            # With a constant step, the index is computed directly, then
+            # corrected for rounding errors
+            idx = np.clip(np.ceil(x / step).astype(int) - 1, 0, len(t) - 1)
+            idx = np.where(t[np.minimum(idx + 1, len(t) - 1)] < x, idx + 1, idx)
+            idx = np.where(t[idx] >= x, idx - 1, idx)
+
+        return np.maximum(idx, 0)
+
+    @staticmethod
+    def _barycentric(u, y):
+        """Lagrange interpolation on equally spaced points, with the
+        barycentric formula
+
+        Args:
+            u (numpy.ndarray): (M,) position of each date in its window, in
+                number of steps since the first point of the window
+            y (numpy.ndarray): (M, n, 6) points of each window
+        Return:
+            numpy.ndarray: (M, 6)
+        """
+
+        n = y.shape[1]
+        d = u[:, None] - np.arange(n)
+
+        # When a date falls exactly on a point, the point is taken as is
+        exact = d == 0
+        c = _barycentric_weights(n) / np.where(exact, 1.0, d)
+        c = np.where(exact.any(axis=-1)[:, None], exact, c)
+
+        return np.einsum("mj,mjk->mk", c, y) / c.sum(axis=-1)[:, None]
+
+    @staticmethod
+    def _hermite(x, t, y):
+        """Hermite interpolation of positions, using the velocities as derivatives
+
+        Args:
+            x (numpy.ndarray): (M,) times at which to interpolate, in seconds
+            t (numpy.ndarray): (M, n) times of the nodes of each window, in seconds
+            y (numpy.ndarray): (M, n, 6) cartesian state vectors at the nodes
+        Return:
+            numpy.ndarray: (M, 6) interpolated cartesian state vectors
+
+        The position is the polynomial of degree 2n-1 matching the positions
+        and velocities at the nodes, and the velocity is its derivative.
+        """
+
+        n = t.shape[-1]
+        diag = np.eye(n, dtype=bool)
+
+        # r[:, j, k] = (x - t_k) / (t_j - t_k) for k != j, and 1 for k == j
+        dx = x[:, None] - t
+        dt = t[:, :, None] - t[:, None, :]
+        dt = np.where(diag, 1.0, dt)
+        r = np.where(diag, 1.0, dx[:, None, :] / dt)
+
+        # Lagrange basis polynomials and their derivatives
+        #  l_j(x) = Π r_jk
+        #  l'_j(x) = Σ 1 / (t_j - t_m) Π r_jk
+        #           m!=j            k!=m
+        inv = np.where(diag, 0.0, 1.0 / dt)
+        l = r.prod(axis=-1)
+        dl = (inv * np.where(diag, 1.0, r[:, :, None, :]).prod(axis=-1)).sum(axis=-1)
+
+        # Derivative of each basis polynomial at its own node
+        c = inv.sum(axis=-1)
+
+        # Hermite basis
+        #  h_j(x) = (1 - 2 c_j (x - t_j)) l_j(x)²
+        #  k_j(x) = (x - t_j) l_j(x)²
+        a = 1 - 2 * c * dx
+        h = a * l ** 2
+        k = dx * l ** 2
+        dh = -2 * c * l ** 2 + 2 * a * l * dl
+        dk = l ** 2 + 2 * dx * l * dl
+
+        pos, vel = y[..., :3], y[..., 3:]
+
+        return np.concatenate(
+            [
+                np.einsum("mj,mji->mi", h, pos) + np.einsum("mj,mji->mi", k, vel),
+                np.einsum("mj,mji->mi", dh, pos) + np.einsum("mj,mji->mi", dk, vel),
+            ],
+            axis=-1,
+        )
 
     def propagate(self, date):
         """Alias of :py:meth:`interpolate`"""
@@ -344,11 +905,18 @@ class Ephem(Speaker):
             Ephem:
         """
 
-        return self.__class__(self.ephemeris(*args, **kwargs))
+        # Points of events detected by listeners carry their own information,
+        # which could not be kept in columns
+        columnar = self.columnar and not kwargs.get("listeners")
+
+        return self.__class__(self.ephemeris(*args, **kwargs), columnar=columnar)
 
     def copy(self, *, form=None, frame=None):  # pragma: no cover
         """Create a deep copy of the ephemeris, and allow frame and form changing"""
-        new = self.ephem()
+        if self.columnar:
+            new = self._view(self._array.copy(), self._dates)
+        else:
+            new = self.ephem()
         if frame:
             new.frame = frame
         if form:
@@ -235,6 +235,41 @@ class Form(Node):
 
             return H1
 
+    @classmethod
+    def M2E_array(cls, e, M):
+        """Vectorized conversion from Mean Anomaly to Eccentric anomaly,
+        for elliptic orbits only.
+
+        Each element follows the same iterations as :py:meth:`M2E`, which
+        stop independently for each of them.
+
+        Args:
+            e (numpy.ndarray): eccentricities, broadcastable with ``M``
+            M (numpy.ndarray): mean anomalies
+        Return:
+            numpy.ndarray: eccentric anomalies
+        """
+
+        tol = 1e-8
+
+        e, M = np.broadcast_arrays(np.asarray(e, dtype=float), np.asarray(M, dtype=float))
+        shape = M.shape
+        e, M = e.ravel(), M.ravel()
+
+        E = np.where(((-np.pi < M) & (M < 0)) | (M > np.pi), M - e, M + e)
+
+        def next_E(E, e, M):
+            return E + (M - E + e * sin(E)) / (1 - e * cos(E))
+
+        E1 = next_E(E, e, M)
+        active = np.flatnonzero(abs(E1 - E) >= tol)
+        while active.size:
+            E[active] = E1[active]
+            E1[active] = next_E(E[active], e[active], M[active])
+            active = active[abs(E1[active] - E[active]) >= tol]
+
+        return E1.reshape(shape)
+
     @classmethod
     def _e_e_sin_e(cls, e, E):
         x = (1 - e) * sin(E)
@@ -0,0 +1,152 @@
+"""Propagation of whole catalogs of TLEs
+
+Instead of creating an :py:class:`~beyond.orbits.orbit.Orbit`, a propagator
+and a :py:class:`~beyond.orbits.statevector.StateVector` for each object and
+each date, the TLEs are handed over to the sgp4 library by batches, and the
+results are stored in a single array.
+
+.. code-block:: python
+
+    from beyond.dates import Date, DateArray, timedelta
+    from beyond.propagators import catalog
+
+    with open("catalog.txt") as fp:
+        text = fp.read()
+
+    dates = DateArray.range(Date(2022, 1, 1), Date(2022, 1, 2), timedelta(minutes=1))
+
+    result = catalog.propagate(text, dates, frame="EME2000", processes=4)
+
+    result.states  # (N, M, 6) array of state vectors, in meters and m/s
+    result.errors  # (N, M) array of error codes of the sgp4 library
+    result.tles[12]  # TLE corresponding to result.states[12]
+
+The states that the library failed to compute (e.g. decayed objects) are set
+to NaN, and the reason may be retrieved from the error code with
+:py:data:`sgp4.api.SGP4_ERRORS`.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ..dates import Date, DateArray
+from ..frames.frames import get_frame
+from ..io.tle import Tle
+
+from sgp4.api import Satrec, SatrecArray, WGS72
+
+__all__ = ["CatalogStates", "propagate"]
+
+CHUNKSIZE = 1000
+"""Default number of objects propagated together"""
+
+
+class CatalogStates(namedtuple("CatalogStates", "tles dates frame states errors")):
+    """Result of the propagation of a catalog
+
+    Attributes:
+        tles (list of Tle): N propagated TLEs
+        dates (DateArray): M dates of propagation
+        frame (Frame): Reference frame of the states
+        states (numpy.ndarray): (N, M, 6) cartesian state vectors, NaN in case
+            of error
+        errors (numpy.ndarray): (N, M) error codes of the sgp4 library, 0
+            meaning success
+    """
+
+    __slots__ = ()
+
+    @property
+    def valid(self):
+        """(N, M) boolean mask of the successfully computed states"""
+        return self.errors == 0
+
+
+def _propagate_chunk(lines, jd, fr):
+    """Propagation of a chunk of TLEs
+
+    This function is called in the worker processes, so its arguments have to
+    be picklable, which the records of the sgp4 library are not.
+
+    Args:
+        lines (list of tuple of str): Two lines of each TLE
+        jd (numpy.ndarray): Julian days
+        fr (numpy.ndarray): Fractions of day
+    Return:
+        tuple: (n, M, 6) states in meters and m/s, and (n, M) error codes
+    """
+
+    satrecs = SatrecArray([Satrec.twoline2rv(*tle, WGS72) for tle in lines])
+    errors, p, v = satrecs.sgp4(jd, fr)
+
+    states = np.concatenate([p, v], axis=-1) * 1000
+    states[errors != 0] = np.nan
+
+    return states, errors
+
+
+def propagate(tles, dates, frame=None, chunksize=None, processes=None):
+    """Propagate a catalog of TLEs with the SGP4 model
+
+    Args:
+        tles (str or iterable of Tle): Text of the catalog, or TLEs already parsed
+        dates (DateArray or iterable of Date): Dates of propagation
+        frame (str or Frame): Reference frame of the states. Default to TEME
+        chunksize (int): Number of objects propagated together, in order to
+            bound the memory used by the intermediate results. Default to
+            :py:data:`CHUNKSIZE`
+        processes (int): Number of worker processes among which the chunks
+            are distributed. If ``None``, everything is computed in the
+            current process
+    Return:
+        CatalogStates
+    """
+
+    if isinstance(tles, str):
+        tles = Tle.from_string(tles)
+    tles = list(tles)
+
+    if not isinstance(dates, DateArray):
+        dates = DateArray.from_dates(dates)
+
+    # TLE epochs are expressed in UTC
+    utc = dates.change_scale("UTC") if dates.scale.name != "UTC" else dates
+    jd, fr = utc.d + Date.JD_MJD, utc.s / 86400.0
+
+    chunksize = CHUNKSIZE if chunksize is None else chunksize
+    lines = [tuple(tle.text.splitlines()[-2:]) for tle in tles]
+    chunks = [lines[i : i + chunksize] for i in range(0, len(lines), chunksize)]
+
+    states = np.empty((len(tles), len(dates), 6))
+    errors = np.zeros((len(tles), len(dates)), dtype=np.uint8)
+
+    if processes is None:
+        results = (_propagate_chunk(chunk, jd, fr) for chunk in chunks)
+    else:
+        pool = ProcessPoolExecutor(max_workers=processes)
+        results = pool.map(
+            _propagate_chunk, chunks, [jd] * len(chunks), [fr] * len(chunks)
+        )
+
+    try:
+        for i, (chunk_states, chunk_errors) in enumerate(results):
+            states[i * chunksize : (i + 1) * chunksize] = chunk_states
+            errors[i * chunksize : (i + 1) * chunksize] = chunk_errors
+    finally:
+        if processes is not None:
+            pool.shutdown()
+
+    teme = get_frame("TEME")
+    if frame is None:
+        frame = teme
+    elif isinstance(frame, str):
+        frame = get_frame(frame)
+
+    if frame is not teme and len(tles):
+        # The transformations depend only on the dates, and are computed once
+        # for all the objects
+        states = teme.transform_array(states, dates, frame)
+
+    return CatalogStates(tles, dates, frame, states, errors)
@@ -1,21 +1,13 @@
 import numpy as np
 
-from .base import AnalyticalPropagator
+from .kepler import Kepler
 from ..constants import Earth
 from ..dates import timedelta
 
 
-class J2(AnalyticalPropagator):
+class J2(Kepler):
     """Analytical propagator taking only the Earth-J2 effect into account"""
 
-    @property
-    def orbit(self):
-        return self._orbit if hasattr(self, "_orbit") else None
-
-    @orbit.setter
-    def orbit(self, orbit):
-        self._orbit = orbit.copy(form="keplerian_mean")
-
     def propagate(self, date):
 
         if type(date) is timedelta:  # pragma: no cover
@@ -43,3 +35,21 @@ class J2(AnalyticalPropagator):
         new.date = date
 
         return new.copy(form="cartesian")
+
+    @classmethod
+    def _rates(cls, elements, body):
+        """Secular rates of the mean keplerian elements due to J2
+
+        Computed once per orbit, see :py:meth:`Kepler._rates`
+        """
+
+        a, e, i = elements[:, :3].T
+        n = np.sqrt(body.mu / a ** 3)
+
+        com = n * body.r ** 2 * body.J2 / (a ** 2 * (1 - e ** 2) ** 2)
+
+        rates = np.zeros_like(elements)
+        rates[:, 3] = -3 / 2 * com * np.cos(i)
+        rates[:, 4] = 3 / 4 * com * (4 - 5 * np.sin(i) ** 2)
+        rates[:, 5] = 3 / 4 * com * np.sqrt(1 - e ** 2) * (2 - 3 * np.sin(i) ** 2) + n
+        return rates
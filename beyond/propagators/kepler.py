@@ -2,7 +2,8 @@ import numpy as np
 
 from .base import AnalyticalPropagator
 from ..constants import Earth
-from ..dates import timedelta
+from ..dates import Date, DateArray, timedelta
+from ..orbits.forms import Form
 
 
 class Kepler(AnalyticalPropagator):
@@ -32,3 +33,77 @@ class Kepler(AnalyticalPropagator):
         new[5] = (self.orbit[5] + delta) % (2 * np.pi)
 
         return new.copy(form="cartesian")
+
+    @classmethod
+    def _rates(cls, elements, body):
+        """Secular rates of the mean keplerian elements
+
+        Args:
+            elements (numpy.ndarray): (N, 6) mean keplerian elements
+            body (Body): central body
+        Return:
+            numpy.ndarray: (N, 6) time derivatives of the elements
+        """
+
+        rates = np.zeros_like(elements)
+        rates[:, 5] = np.sqrt(body.mu / elements[:, 0] ** 3)
+        return rates
+
+    @classmethod
+    def propagate_array(cls, elements, epoch, dates, body=Earth):
+        """Propagate many orbits to many dates at once
+
+        .. code-block:: python
+
+            from beyond.utils.constellation import WalkerDelta
+
+            walker = WalkerDelta(720, 36, 1)
+            elements = np.array([
+                [a, 0, i, raan, 0, nu] for raan, nu in walker.iter_fleet()
+            ])
+            dates = DateArray.range(epoch, epoch + timedelta(days=3), timedelta(minutes=1))
+            states = J2.propagate_array(elements, epoch, dates)  # (720, 4320, 6)
+
+        Args:
+            elements (numpy.ndarray): (N, 6) mean keplerian elements
+                (a, e, i, Ω, ω, M) of elliptic orbits
+            epoch (Date or DateArray): Epoch of the elements, common to all
+                orbits, or one per orbit
+            dates (DateArray or iterable of Date): (M,) dates of propagation
+            body (Body): central body
+        Return:
+            numpy.ndarray: (N, M, 6) cartesian state vectors, expressed in the
+            frame of the elements
+        Raise:
+            ValueError: if an orbit is not elliptic
+        """
+
+        elements = np.array(elements, dtype=float).reshape(-1, 6)
+
+        if (elements[:, 1] >= 1).any():
+            raise ValueError("Batch propagation is only available for elliptic orbits")
+
+        if not isinstance(dates, DateArray):
+            dates = DateArray.from_dates(dates)
+
+        # Elapsed time, in seconds, between the epoch of each orbit and each date
+        if isinstance(epoch, Date):
+            dt = (dates - epoch)[np.newaxis]
+        else:
+            (d1, s1), (d2, s2) = dates._ref, epoch._ref
+            dt = (d1 - d2[:, np.newaxis]) * 86400.0 + (s1 - s2[:, np.newaxis])
+
+        # (6, N, M) mean elements at each date
+        coord = (
+            elements.T[:, :, np.newaxis] + cls._rates(elements, body).T[:, :, np.newaxis] * dt
+        )
+        coord = np.broadcast_to(coord, (6, len(elements), len(dates))).copy()
+        coord[3:] %= 2 * np.pi
+
+        a, e, i, Ω, ω, M = coord
+        E = Form.M2E_array(e, M)
+        cos_ν = (np.cos(E) - e) / (1 - e * np.cos(E))
+        sin_ν = (np.sin(E) * np.sqrt(1 - e ** 2)) / (1 - e * np.cos(E))
+        coord[5] = np.arctan2(sin_ν, cos_ν) % (np.pi * 2)
+
+        return np.moveaxis(Form._keplerian_to_cartesian(coord, body), 0, -1)
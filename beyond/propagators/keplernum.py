@@ -1,13 +1,20 @@
-from numpy import zeros, array, sign, linalg
+import numpy as np
+from numpy import array, sign
+from numpy.polynomial import chebyshev
+from math import sqrt
 from collections import namedtuple
 import logging
 
 from .base import NumericalPropagator
-from ..dates import Date, timedelta
+from .listeners import Speaker
+from ..config import config
+from ..dates import Date, DateArray, timedelta
 from ..orbits.ephem import Ephem
+from ..orbits.statevector import StateVector
 from ..orbits.man import ImpulsiveMan, ContinuousMan
+from ..utils.memoize import LruCache
 
-__all__ = ["KeplerNum", "SOIPropagator"]
+__all__ = ["KeplerNum", "SOIPropagator", "Stats", "Checkpoints", "checkpoints"]
 
 log = logging.getLogger(__name__)
 
@@ -15,8 +22,8 @@ log = logging.getLogger(__name__)
 class KeplerNum(NumericalPropagator):
     """Keplerian motion numerical propagator
 
-    This propagator provide three methods of propagation ``euler``, ``rk4`` and
-    ``dopri``
+    This propagator provide the methods of propagation ``euler``, ``rk4``,
+    ``rkf54``, ``dopri54``, ``dop853`` and ``abm8``.
     See `Runge-Kutta methods <https://en.wikipedia.org/wiki/Runge%E2%80%93Kutta_methods>`__
     for details.
 
@@ -24,6 +31,45 @@ class KeplerNum(NumericalPropagator):
     state, and the lowest to determine the error and adapt the stepsize.
     For example RKF54 use order 5 for state computation, and order 4 for
     error estimation.
+
+    The step size of adaptive methods is controlled by a PI controller
+    [Gustafsson]_, and kept from one step to the next. It starts at ``step``,
+    and is bounded by ``min_step`` and ``max_step``. The statistics of the
+    last propagation (accepted and rejected steps, evaluations of the forces)
+    are available in :py:attr:`stats`.
+
+    .. [Gustafsson] K. Gustafsson, "Control theoretic techniques for stepsize
+        selection in explicit Runge-Kutta methods", ACM TOMS 17, 1991
+
+    For long propagations, ``dop853`` allows larger steps for the same
+    accuracy, and the multistep method ``abm8`` reuses the derivatives of the
+    previous steps, with only two evaluations of the forces per step
+    (predictor and corrector). The first steps of the multistep method, and
+    the ones following an impulsive maneuver or a change of step size, are
+    computed with ``dop853``. As the derivatives of the previous steps are
+    assumed to be smooth, continuous maneuvers are best handled with a
+    Runge-Kutta method.
+
+    By default, the propagation is done at the step size of the propagator,
+    and the results are interpolated at the requested dates, which requires
+    to keep the whole trajectory in memory. With ``dense=True``, the requested
+    dates and the search of events by listeners are instead served by a
+    continuous extension of each step, computed from its intermediate stages
+    (with four more evaluations per step for ``dop853``, or by cubic Hermite
+    interpolation for methods lacking one, at the cost of one more evaluation
+    per step). The propagation is then done in constant memory.
+
+    The points computed from the epoch of the orbit are kept in
+    :py:data:`checkpoints`, so the successive propagations of the same orbit
+    (for example with many calls to :py:meth:`propagate`) resume from the
+    last computed point instead of restarting from the epoch. This does not
+    apply to the dense output mode.
+
+    The positions of the bodies other than the center of the frame of
+    propagation are not computed at each evaluation of the forces, but
+    interpolated by Chebyshev polynomials (see :py:attr:`PERTURBERS_SPAN` and
+    :py:attr:`PERTURBERS_DEGREE`), fitted on first use and kept as long as
+    the orbit of the propagator is unchanged.
     """
 
     RK4 = "rk4"
@@ -38,8 +84,34 @@ class KeplerNum(NumericalPropagator):
     DOPRI54 = "dopri54"
     """Dormand-Prince 5th order adaptive stepsize integrator"""
 
+    DOP853 = "dop853"
+    """Dormand-Prince 8th order adaptive stepsize integrator"""
+
+    ABM8 = "abm8"
+    """Adams-Bashforth-Moulton 8th order fixed stepsize multistep integrator"""
+
     FRAME = "EME2000"
 
+    SAFETY = 0.9
+    """Safety factor applied to the optimal step size of adaptive methods"""
+
+    FAC_MIN = 0.2
+    """Minimum ratio between two successive step sizes"""
+
+    FAC_MAX = 10
+    """Maximum ratio between two successive step sizes"""
+
+    BETA = 0.04
+    """Weight of the error of the previous step in the step size control"""
+
+    PERTURBERS_SPAN = timedelta(hours=6)
+    """Duration of each piece of the interpolation of the positions of the
+    perturbing bodies"""
+
+    PERTURBERS_DEGREE = 12
+    """Degree of the Chebyshev polynomials interpolating the positions of the
+    perturbing bodies"""
+
     # Butcher tableau of the different methods available
     BUTCHER = {
         EULER: {"a": array([]), "b": array([1]), "c": array([0])},
@@ -47,6 +119,10 @@ class KeplerNum(NumericalPropagator):
             "a": [[], array([1 / 2]), array([0, 1 / 2]), array([0, 0, 1])],
             "b": array([1 / 6, 1 / 3, 1 / 3, 1 / 6]),
             "c": array([0, 1 / 2, 1 / 2, 1]),
+            # Third order continuous extension
+            "p": array(
+                [[1, -3 / 2, 2 / 3], [0, 1, -2 / 3], [0, 1, -2 / 3], [0, -1 / 2, 2 / 3]]
+            ),
         },
         RKF54: {
             "a": [
@@ -60,6 +136,7 @@ class KeplerNum(NumericalPropagator):
             "b": array([16 / 135, 0, 6656 / 12825, 28561 / 56430, -9 / 50, 2 / 55]),
             "b_star": array([25 / 216, 0, 1408 / 2565, 2197 / 4104, -1 / 5, 0]),
             "c": array([0, 1 / 4, 3 / 8, 12 / 13, 1, 1 / 2]),
+            "order": 5,
         },
         DOPRI54: {
             "a": [
@@ -84,17 +161,448 @@ class KeplerNum(NumericalPropagator):
                 ]
             ),
             "c": array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1]),
+            "order": 5,
+            # Fourth order continuous extension (Shampine, 1986)
+            "p": array(
+                [
+                    [
+                        1,
+                        -8048581381 / 2820520608,
+                        8663915743 / 2820520608,
+                        -12715105075 / 11282082432,
+                    ],
+                    [0, 0, 0, 0],
+                    [
+                        0,
+                        131558114200 / 32700410799,
+                        -68118460800 / 10900136933,
+                        87487479700 / 32700410799,
+                    ],
+                    [
+                        0,
+                        -1754552775 / 470086768,
+                        14199869525 / 1410260304,
+                        -10690763975 / 1880347072,
+                    ],
+                    [
+                        0,
+                        127303824393 / 49829197408,
+                        -318862633887 / 49829197408,
+                        701980252875 / 199316789632,
+                    ],
+                    [
+                        0,
+                        -282668133 / 205662961,
+                        2019193451 / 616988883,
+                        -1453857185 / 822651844,
+                    ],
+                    [
+                        0,
+                        40617522 / 29380423,
+                        -110615467 / 29380423,
+                        69997945 / 29380423,
+                    ],
+                ]
+            ),
+        },
+        DOP853: {
+            "a": [
+                [],
+                array([0.05260015195876773]),
+                array([0.0197250569845379, 0.0591751709536137]),
+                array([0.02958758547680685, 0, 0.08876275643042054]),
+                array([0.2413651341592667, 0, -0.8845494793282861, 0.924834003261792]),
+                array(
+                    [
+                        0.037037037037037035,
+                        0,
+                        0,
+                        0.17082860872947386,
+                        0.12546768756682242,
+                    ]
+                ),
+                array(
+                    [
+                        0.037109375,
+                        0,
+                        0,
+                        0.17025221101954405,
+                        0.06021653898045596,
+                        -0.017578125,
+                    ]
+                ),
+                array(
+                    [
+                        0.03709200011850479,
+                        0,
+                        0,
+                        0.17038392571223998,
+                        0.10726203044637328,
+                        -0.015319437748624402,
+                        0.008273789163814023,
+                    ]
+                ),
+                array(
+                    [
+                        0.6241109587160757,
+                        0,
+                        0,
+                        -3.3608926294469414,
+                        -0.868219346841726,
+                        27.59209969944671,
+                        20.154067550477894,
+                        -43.48988418106996,
+                    ]
+                ),
+                array(
+                    [
+                        0.47766253643826434,
+                        0,
+                        0,
+                        -2.4881146199716677,
+                        -0.590290826836843,
+                        21.230051448181193,
+                        15.279233632882423,
+                        -33.28821096898486,
+                        -0.020331201708508627,
+                    ]
+                ),
+                array(
+                    [
+                        -0.9371424300859873,
+                        0,
+                        0,
+                        5.186372428844064,
+                        1.0914373489967295,
+                        -8.149787010746927,
+                        -18.52006565999696,
+                        22.739487099350505,
+                        2.4936055526796523,
+                        -3.0467644718982196,
+                    ]
+                ),
+                array(
+                    [
+                        2.273310147516538,
+                        0,
+                        0,
+                        -10.53449546673725,
+                        -2.0008720582248625,
+                        -17.9589318631188,
+                        27.94888452941996,
+                        -2.8589982771350235,
+                        -8.87285693353063,
+                        12.360567175794303,
+                        0.6433927460157636,
+                    ]
+                ),
+            ],
+            "b": array(
+                [
+                    0.054293734116568765,
+                    0,
+                    0,
+                    0,
+                    0,
+                    4.450312892752409,
+                    1.8915178993145003,
+                    -5.801203960010585,
+                    0.3111643669578199,
+                    -0.1521609496625161,
+                    0.20136540080403034,
+                    0.04471061572777259,
+                ]
+            ),
+            "b_star": array(
+                [
+                    0.04117368912237389,
+                    0,
+                    0,
+                    0,
+                    0,
+                    5.675469339128614,
+                    2.3872768489717506,
+                    -7.465581142465571,
+                    0.6614932157077935,
+                    -0.48634006837553356,
+                    0.11944219431891463,
+                    0.06706592359165889,
+                ]
+            ),
+            "b_star_3": array(
+                [
+                    0.2440944881889764,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0.7338466882816118,
+                    0,
+                    0,
+                    0.022058823529411766,
+                ]
+            ),
+            "c": array(
+                [
+                    0,
+                    0.05260015195876773,
+                    0.0789002279381516,
+                    0.1183503419072274,
+                    0.2816496580927726,
+                    0.3333333333333333,
+                    0.25,
+                    0.3076923076923077,
+                    0.6512820512820513,
+                    0.6,
+                    0.8571428571428571,
+                    1.0,
+                ]
+            ),
+            "order": 8,
+            # Seventh order continuous extension (Hairer), requiring four more
+            # stages, the first being the derivative at the end of the step
+            "a_dense": [
+                array(
+                    [
+                        0.054293734116568765,
+                        0,
+                        0,
+                        0,
+                        0,
+                        4.450312892752409,
+                        1.8915178993145003,
+                        -5.801203960010585,
+                        0.3111643669578199,
+                        -0.1521609496625161,
+                        0.20136540080403034,
+                        0.04471061572777259,
+                    ]
+                ),
+                array(
+                    [
+                        0.056167502283047954,
+                        0,
+                        0,
+                        0,
+                        0,
+                        0,
+                        0.25350021021662483,
+                        -0.2462390374708025,
+                        -0.12419142326381637,
+                        0.15329179827876568,
+                        0.00820105229563469,
+                        0.007567897660545699,
+                        -0.008298,
+                    ]
+                ),
+                array(
+                    [
+                        0.03183464816350214,
+                        0,
+                        0,
+                        0,
+                        0,
+                        0.028300909672366776,
+                        0.053541988307438566,
+                        -0.05492374857139099,
+                        0,
+                        0,
+                        -0.00010834732869724932,
+                        0.0003825710908356584,
+                        -0.00034046500868740456,
+                        0.1413124436746325,
+                    ]
+                ),
+                array(
+                    [
+                        -0.42889630158379194,
+                        0,
+                        0,
+                        0,
+                        0,
+                        -4.697621415361164,
+                        7.683421196062599,
+                        4.06898981839711,
+                        0.3567271874552811,
+                        0,
+                        0,
+                        0,
+                        -0.0013990241651590145,
+                        2.9475147891527724,
+                        -9.15095847217987,
+                    ]
+                ),
+            ],
+            "c_dense": array([1.0, 0.1, 0.2, 0.7777777777777778]),
+            "p": array(
+                [
+                    [
+                        1.0,
+                        -10.266057073759306,
+                        48.161850968566455,
+                        -114.93304874997834,
+                        147.4644687566977,
+                        -97.06685363011368,
+                        25.69393346270375,
+                    ],
+                    [0, 0, 0, 0, 0, 0, 0],
+                    [0, 0, 0, 0, 0, 0, 0],
+                    [0, 0, 0, 0, 0, 0, 0],
+                    [0, 0, 0, 0, 0, 0, 0],
+                    [
+                        0,
+                        13.917653631776606,
+                        -154.78787266663718,
+                        522.9219089608218,
+                        -456.25918840208794,
+                        -75.5319373213575,
+                        154.18974869023643,
+                    ],
+                    [
+                        0,
+                        2.605603751993609,
+                        -21.622822384626517,
+                        2.535182028966773,
+                        292.25417465990404,
+                        -505.40999933296894,
+                        231.5293791760455,
+                    ],
+                    [
+                        0,
+                        -15.018944223519684,
+                        160.09447708973045,
+                        -474.3071826037643,
+                        135.9603691617384,
+                        545.1091945264187,
+                        -357.6391179106141,
+                    ],
+                    [
+                        0,
+                        3.050527683318488,
+                        -38.54396729189063,
+                        174.47140009219885,
+                        -337.05134702387716,
+                        291.7898750908326,
+                        -93.40532418362432,
+                    ],
+                    [
+                        0,
+                        -1.3278744327655212,
+                        16.661770430049543,
+                        -74.44027814126304,
+                        140.75210016191608,
+                        -119.2562021040512,
+                        37.45832313645163,
+                    ],
+                    [
+                        0,
+                        2.8445336326728796,
+                        -36.558295489910115,
+                        170.69007169147514,
+                        -345.9748485480495,
+                        313.299553623578,
+                        -104.0996495089623,
+                    ],
+                    [
+                        0,
+                        0.7657106259527866,
+                        -9.906995535619368,
+                        46.8029919188744,
+                        -96.5198694669957,
+                        88.74316650017616,
+                        -29.8402934266605,
+                    ],
+                    [
+                        0,
+                        -1.0889903364513334,
+                        14.097013042320004,
+                        -66.68230591294363,
+                        137.96299063474373,
+                        -127.82216401767991,
+                        43.53345659001114,
+                    ],
+                    [
+                        0,
+                        18.148505520854727,
+                        -127.63310949253875,
+                        357.3419516129657,
+                        -500.7031507909224,
+                        349.17035710882897,
+                        -96.32455395918828,
+                    ],
+                    [
+                        0,
+                        -9.194632392478356,
+                        93.3567459327894,
+                        -282.6272618704363,
+                        361.14007718803333,
+                        -201.85219053352347,
+                        39.17726167561544,
+                    ],
+                    [
+                        0,
+                        -4.436036387594894,
+                        56.68120539776666,
+                        -261.7734290269171,
+                        520.9742236688994,
+                        -461.1727999101397,
+                        149.72683625798564,
+                    ],
+                ]
+            ),
+        },
+        ABM8: {
+            # Runge-Kutta method used for the first steps, until enough
+            # previous steps are available
+            "starter": DOP853,
+            "predictor": array(
+                [
+                    434241,
+                    -1152169,
+                    2183877,
+                    -2664477,
+                    2102243,
+                    -1041723,
+                    295767,
+                    -36799,
+                ]
+            )
+            / 120960,
+            "corrector": array(
+                [36799, 139849, -121797, 123133, -88547, 41499, -11351, 1375]
+            )
+            / 120960,
         },
     }
 
-    def __init__(self, step, bodies, *, method=RK4, frame=FRAME, tol=1e-3):
+    def __init__(
+        self,
+        step,
+        bodies,
+        *,
+        method=RK4,
+        frame=FRAME,
+        tol=1e-3,
+        dense=False,
+        min_step=None,
+        max_step=None
+    ):
         """
         Args:
-            step (datetime.timedelta): Step size of the propagator
+            step (datetime.timedelta): Step size of the propagator (initial
+                step size for adaptive stepsize methods)
             bodies (tuple): List of bodies to take into account
             method (str): Integration method (see class attributes)
             frame (str): Frame to use for the propagation
             tol (float): Error tolerance for adaptive stepsize methods
+            dense (bool): If ``True``, use dense output (see class docstring)
+            min_step (datetime.timedelta): Minimum step size for adaptive
+                stepsize methods. If ``None``, there is no limit.
+            max_step (datetime.timedelta): Maximum step size for adaptive
+                stepsize methods. If ``None``, ``step`` is used.
         """
 
         self.step = step
@@ -102,11 +610,26 @@ class KeplerNum(NumericalPropagator):
         self.method = method.lower()
         self.frame = frame
         self.tol = tol
+        self.dense = dense
+        self.min_step = min_step
+        self.max_step = max_step
+        self.stats = Stats()
+        self._prev_error = 1e-4
+        self._history = None
 
     def copy(self):
-        return self.__class__(
-            self.step, self.bodies, method=self.method, frame=self.frame
+        new = self.__class__(
+            self.step,
+            self.bodies,
+            method=self.method,
+            frame=self.frame,
+            tol=self.tol,
+            dense=self.dense,
+            min_step=self.min_step,
+            max_step=self.max_step,
         )
+        new._prev_error = self._prev_error
+        return new
 
     @property
     def orbit(self):
@@ -115,74 +638,292 @@ class KeplerNum(NumericalPropagator):
     @orbit.setter
     def orbit(self, orbit):
         self._orbit = orbit.copy(form="cartesian", frame=self.frame)
+        self._history = None
+        self._perturbers = {}
 
     @property
     def butcher(self):
         return self.BUTCHER[self.method]
 
-    def _accel(self, orb):
-        """Newton's Law of Universal Gravitation"""
+    def iter(self, **kwargs):
+        # Reset of the statistics, of the step size controller and of the
+        # derivatives kept by multistep methods
+        self.stats = Stats()
+        self._prev_error = 1e-4
+        self._history = None
+        yield from super().iter(**kwargs)
 
-        new_body = zeros(6)
-        new_body[:3] = orb[3:]
+    def _bound(self, step):
+        """Limit a step size to the bounds of the propagator, keeping its sign"""
 
+        size = abs(step)
+        if self.min_step is not None:
+            size = max(size, abs(self.min_step))
+        size = min(size, abs(self.step if self.max_step is None else self.max_step))
+
+        return size if step >= timedelta(0) else -size
+
+    def _seconds(self, date):
+        """Elapsed time since the epoch of the orbit, in seconds"""
+
+        epoch = self.orbit.date
+        if date.scale.name != epoch.scale.name:
+            date = date.change_scale(epoch.scale.name)
+
+        return (date.d - epoch.d) * 86400.0 + (date.s - epoch.s)
+
+    def _date(self, t):
+        """Date corresponding to an elapsed time since the epoch of the orbit
+
+        Args:
+            t (float): Elapsed time, in seconds
+        Return:
+            Date
+        """
+
+        epoch = self.orbit.date
+        days, sec = divmod(epoch.s + t, 86400)
+        return Date(epoch.d + int(days), sec, scale=epoch.scale)
+
+    @property
+    def _meta(self):
+        """Metadata of the orbit (name, maneuvers, etc.) shared by the points
+        created by the propagator
+        """
+        return {
+            k: v
+            for k, v in self.orbit._data.items()
+            if k not in ("date", "form", "frame", "propagator")
+        }
+
+    def _statevector(self, t, y, date=None):
+        """Creation of a StateVector object from a raw state"""
+        return StateVector(
+            y,
+            self._date(t) if date is None else date,
+            self.orbit.form,
+            self.orbit.frame,
+            **self._meta
+        )
+
+    def _forces(self):
+        """Forces to apply during a step, sorted by the need to know the
+        date of evaluation
+
+        The position of the body at the center of the frame of propagation is
+        always null, and does not need to be computed. The other bodies have
+        to be propagated at each evaluation, and the continuous maneuvers
+        checked.
+
+        Return:
+            tuple: gravitational parameter of the central body (``None`` if
+            the center of the frame is not among :py:attr:`bodies`), list of
+            other bodies, and list of continuous maneuvers
+        """
+
+        frame = self.orbit.frame
+        name = getattr(getattr(frame.center, "body", None), "name", None)
+
+        central = None
+        others = []
         for body in self.bodies:
-            # retrieve the position of the body at the given date
-            orb_body = body.propagate(orb.date)
-            orb_body.frame = orb.frame
+            if central is None and body.name == name:
+                central = body.µ
+            else:
+                others.append(body)
 
+        thrusts = [
+            man for man in self.orbit.maneuvers if isinstance(man, ContinuousMan)
+        ]
+
+        return central, others, thrusts
+
+    def _accel(self, forces, t, y, out):
+        """Newton's Law of Universal Gravitation
+
+        Args:
+            forces (tuple): Output of :py:meth:`_forces`
+            t (float): Elapsed time since the epoch of the orbit, in seconds
+            y (numpy.ndarray): Position and velocity
+            out (numpy.ndarray): Array in which the derivative of ``y`` is
+                written
+        Return:
+            numpy.ndarray: ``out``
+        """
+
+        central, others, thrusts = forces
+
+        out[:3] = y[3:]
+        out[3:] = 0
+
+        if central is not None:
+            diff = -y[:3]
+            out[3:] += central * diff / sqrt(diff @ diff) ** 3
+
+        # Date objects are only created if a force depends on time
+        date = self._date(t) if thrusts else None
+
+        for body in others:
             # Compute induced attraction to the object of interest
-            diff = orb_body[:3] - orb[:3]
-            norm = linalg.norm(diff) ** 3
-            new_body[3:] += body.µ * diff / norm
+            diff = self._body_position(body, t) - y[:3]
+            out[3:] += body.µ * diff / sqrt(diff @ diff) ** 3
+
+        for man in thrusts:
+            if man.check(date):
+                out[3:] += man.accel(self._statevector(t, y).as_orbit(self))
 
+        return out
+
+    def _body_position(self, body, t):
+        """Position of a perturbing body in the frame of propagation
+
+        The position is interpolated by Chebyshev polynomials, each fitted
+        over a piece of :py:attr:`PERTURBERS_SPAN` at its first use, from
+        :py:attr:`PERTURBERS_DEGREE` + 1 computed positions of the body.
+
+        Args:
+            body (Body)
+            t (float): Elapsed time since the epoch of the orbit, in seconds
+        Return:
+            numpy.ndarray: Position of the body
+        """
+
+        span = self.PERTURBERS_SPAN.total_seconds()
+        index, x = divmod(t, span)
+
+        try:
+            coefs = self._perturbers[body.name, index]
+        except KeyError:
+            # Chebyshev nodes, over the [-1, 1] interval
+            n = self.PERTURBERS_DEGREE + 1
+            nodes = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+
+            positions = []
+            for node in nodes:
+                orb = body.propagate(self._date((index + (node + 1) / 2) * span))
+                orb.frame = self.orbit.frame
+                positions.append(orb[:3])
+
+            coefs = chebyshev.chebfit(nodes, positions, n - 1)
+            self._perturbers[body.name, index] = coefs
+
+        return chebyshev.chebval(2 * x / span - 1, coefs)
+
+    def _make_step(self, t, y, step):
+        """Compute the next step with the selected method
+
+        The computation is done on raw arrays, the intermediate stages being
+        stored in a preallocated buffer.
+
+        Args:
+            t (float): Elapsed time since the epoch of the orbit, in seconds
+            y (numpy.ndarray): Position and velocity at ``t``
+            step (timedelta): Step size
+        Return:
+            tuple: Real step size (may be reduced for adaptive stepsize
+            methods), position and velocity at the end of the step, and step
+            size proposed for the next step
+        """
+
+        forces = self._forces()
+
+        if "predictor" in self.butcher:
+            step, y_n_1, next_step = self._multistep(forces, t, y, step)
+        else:
+            step, y_n_1, next_step = self._rk_step(forces, self.butcher, t, y, step)
+
+        h = step.total_seconds()
         for man in self.orbit.maneuvers:
-            if isinstance(man, ContinuousMan) and man.check(orb.date):
-                new_body[3:] += man.accel(orb)
+            if isinstance(man, ImpulsiveMan) and man.check(self._date(t), step):
+                y_n_1[3:] += man.dv(self._statevector(t + h, y_n_1), step=step)
+                # The derivatives of the previous steps are not relevant anymore
+                self._history = None
 
-        return new_body
+        return step, y_n_1, next_step
 
-    def _make_step(self, orb, step):
-        """Compute the next step with the selected method"""
+    def _rk_step(self, forces, butcher, t, y, step):
+        """Compute the next step with a Runge-Kutta method
+
+        Args:
+            forces (tuple): Output of :py:meth:`_forces`
+            butcher (dict): Butcher tableau of the method
+            t (float): Elapsed time since the epoch of the orbit, in seconds
+            y (numpy.ndarray): Position and velocity at ``t``
+            step (timedelta): Step size
+        Return:
+            tuple: same as :py:meth:`_make_step`
+        """
 
-        aa, bb, cc = self.butcher["a"], self.butcher["b"], self.butcher["c"]
-        b_star = self.butcher.get("b_star")
+        aa, bb, cc = butcher["a"], butcher["b"], butcher["c"]
+        b_star = butcher.get("b_star")
+        b_star_3 = butcher.get("b_star_3")
 
-        y_n = orb.copy()
+        ks = np.empty((len(bb), 6))
 
         MAX_ITER = 10
 
         for i in range(MAX_ITER):
 
-            ks = [self._accel(y_n)]
-            i += 1
-            for a, c in zip(aa[1:], cc[1:]):
-                y_n_prime = y_n + a @ ks * step.total_seconds()
-                y_n_prime.date += step * c
-                ks.append(self._accel(y_n_prime))
+            h = step.total_seconds()
 
-            y_n_1 = y_n + step.total_seconds() * bb @ ks
-            y_n_1.date = y_n.date + step
+            self._accel(forces, t, y, ks[0])
+            for j, (a, c) in enumerate(zip(aa[1:], cc[1:]), 1):
+                self._accel(forces, t + c * h, y + a @ ks[:j] * h, ks[j])
+
+            self.stats.evaluations += len(bb)
+
+            y_n_1 = y + h * bb @ ks
 
             # Error estimation, in cases where adaptive stepsize methods are used
             if b_star is None:
                 # This is not an adaptive stepsize method, there is no need to iterate
                 # here
+                self.stats.accepted += 1
+                next_step = step
                 break
 
-            error = step.total_seconds() * (bb - self.butcher["b_star"]) @ ks
-
-            p_error = linalg.norm(error[:3])
-            # v_eps = linalg.norm(error[3:])
-
-            if p_error <= self.tol:
-                # The target accuracy is met, the current step size is sufficient
+            error = h * (bb - b_star) @ ks
+
+            # Error relative to the tolerance
+            p_error = sqrt(error[:3] @ error[:3]) / self.tol
+            # v_eps = sqrt(error[3:] @ error[3:])
+
+            if b_star_3 is not None and p_error:
+                # Combination with a lower order estimation, less prone to
+                # underestimate the error with large step sizes (Hairer)
+                error_3 = h * (bb - b_star_3) @ ks
+                p_error_3 = sqrt(error_3[:3] @ error_3[:3]) / self.tol
+                p_error = p_error ** 2 / sqrt(p_error ** 2 + 0.01 * p_error_3 ** 2)
+
+            k = butcher["order"]
+
+            at_min = self.min_step is not None and abs(step) <= abs(self.min_step)
+
+            if p_error <= 1 or at_min:
+                # The target accuracy is met (or the step size can't be reduced
+                # anymore), the current step size is sufficient.
+                self.stats.accepted += 1
+
+                # PI control of the next step size
+                if p_error == 0:
+                    fac = self.FAC_MAX
+                else:
+                    fac = (
+                        self.SAFETY
+                        * p_error ** (self.BETA * 0.75 - 1 / k)
+                        * self._prev_error ** self.BETA
+                    )
+                # No increase of the step size right after a rejection
+                fac = min(self.FAC_MAX if i == 0 else 1, max(self.FAC_MIN, fac))
+                self._prev_error = max(p_error, 1e-4)
+
+                next_step = self._bound(step * fac)
                 break
 
             # Modify the step size
-            step = min(
-                self.step, step * (self.tol / (2 * p_error)) ** (1 / (len(bb) - 1))
-            )
+            self.stats.rejected += 1
+            fac = max(self.FAC_MIN, self.SAFETY * p_error ** (-1 / k))
+            step = self._bound(step * fac)
         else:
             raise RuntimeError(
                 "{} : No convergence in step size after {} iterations.".format(
@@ -190,11 +931,261 @@ class KeplerNum(NumericalPropagator):
                 )
             )
 
-        for man in self.orbit.maneuvers:
-            if isinstance(man, ImpulsiveMan) and man.check(orb.date, step):
-                y_n_1[3:] += man.dv(y_n_1, step=step)
+        # Kept for dense output
+        self._stages = ks
+        self._weights = bb
+
+        return step, y_n_1, next_step
 
-        return step, y_n_1
+    def _multistep(self, forces, t, y, step):
+        """Compute the next step with an Adams-Bashforth-Moulton method, in
+        PECE mode (prediction, evaluation, correction, evaluation)
+
+        The derivatives at the start of the previous steps are kept in
+        :py:attr:`_history`. As long as not enough of them are available with
+        the same step size, the step is computed by the starting Runge-Kutta
+        method.
+
+        Args:
+            forces (tuple): Output of :py:meth:`_forces`
+            t (float): Elapsed time since the epoch of the orbit, in seconds
+            y (numpy.ndarray): Position and velocity at ``t``
+            step (timedelta): Step size
+        Return:
+            tuple: same as :py:meth:`_make_step`
+        """
+
+        predictor = self.butcher["predictor"]
+        corrector = self.butcher["corrector"]
+        n = len(predictor)
+        h = step.total_seconds()
+
+        if self._history is not None and self._history[:2] == (t, step):
+            derivatives = self._history[2]
+        else:
+            derivatives = np.empty((0, 6))
+
+        if len(derivatives) < n - 1:
+            # The starting steps are computed at fixed step size
+            starter = self.BUTCHER[self.butcher["starter"]]
+            starter = {k: starter[k] for k in ("a", "b", "c")}
+            step, y_n_1, next_step = self._rk_step(forces, starter, t, y, step)
+            f = self._stages[0]
+        else:
+            # Derivatives at the start of the current step and of the
+            # previous ones, then at the end of the step for the predicted
+            # state
+            ks = np.empty((n + 1, 6))
+            self._accel(forces, t, y, ks[0])
+            ks[1:n] = derivatives
+
+            y_p = y + h * predictor @ ks[:n]
+            self._accel(forces, t + h, y_p, ks[n])
+
+            bb = np.zeros(n + 1)
+            bb[: n - 1] = corrector[1:]
+            bb[n] = corrector[0]
+            y_n_1 = y + h * bb @ ks
+
+            self.stats.evaluations += 2
+            self.stats.accepted += 1
+            next_step = step
+            f = ks[0]
+
+            # Kept for dense output
+            self._stages = ks
+            self._weights = bb
+
+        derivatives = np.vstack([f, derivatives])[: n - 1]
+        self._history = (t + h, step, derivatives)
+
+        return step, y_n_1, next_step
+
+    def _checkpoints_key(self, direction):
+        """Key of the points computed from the epoch of the orbit in
+        :py:data:`checkpoints`
+
+        Maneuvers and bodies are compared by identity. As with the orbit,
+        modifying them in place after a propagation is not taken into
+        account.
+        """
+
+        orbit = self.orbit
+        return (
+            self.__class__,
+            self.method,
+            self.step,
+            self.tol,
+            self.min_step,
+            self.max_step,
+            tuple(self.bodies),
+            tuple(orbit.maneuvers),
+            orbit.frame.name,
+            orbit.date.d,
+            orbit.date.s,
+            orbit.date.scale.name,
+            tuple(np.array(orbit)),
+            direction,
+        )
+
+    def _trajectory(self, t, count=1):
+        """Points computed from the epoch of the orbit, up to a given time
+
+        The points already computed by a previous propagation of the same
+        orbit are retrieved from :py:data:`checkpoints`, and the propagation
+        resumes from the last of them if needed.
+
+        Args:
+            t (float): Elapsed time since the epoch of the orbit, in seconds
+            count (int): Minimum number of points
+        Return:
+            tuple: lists of times and states, from the epoch to the first
+            point at or beyond ``t``
+        """
+
+        direction = -1 if t < 0 else 1
+        key = self._checkpoints_key(direction) if checkpoints.enabled else None
+
+        try:
+            trajectory = checkpoints[key]
+        except KeyError:
+            trajectory = Trajectory(
+                np.array(self.orbit),
+                (self.step * direction, self._prev_error, self._history),
+            )
+
+        times = trajectory.times
+        extended = False
+
+        while (t - times[-1]) * direction > 0 or len(times) < count:
+            # Restoration of the state of the integrator after the last point
+            _step, self._prev_error, self._history = trajectory.controls[-1]
+            real_step, y, _step = self._make_step(
+                times[-1], trajectory.states[-1], _step
+            )
+            trajectory.append(
+                times[-1] + real_step.total_seconds(),
+                y,
+                (_step, self._prev_error, self._history),
+            )
+            extended = True
+
+        if key is not None and (extended or key not in checkpoints):
+            # Storing the trajectory again updates its size in the cache
+            checkpoints[key] = trajectory
+
+        n = max(count, np.searchsorted(np.array(times) * direction, t * direction) + 1)
+        _, self._prev_error, self._history = trajectory.controls[n - 1]
+
+        return times[:n], trajectory.states[:n]
+
+    def _ephem(self, times, states):
+        """Ephemeris of the computed steps
+
+        Args:
+            times (list of float): Elapsed time since the epoch of the orbit
+            states (list of numpy.ndarray): Position and velocity at each time
+        Return:
+            Ephem: Columnar ephemeris, whose points share the metadata of
+            the orbit (name, maneuvers, etc.)
+        """
+
+        epoch = self.orbit.date
+        dates = DateArray(epoch.d, epoch.s + np.array(times), scale=epoch.scale)
+
+        return Ephem.from_array(
+            np.array(states), dates, self.orbit.form, self.orbit.frame, **self._meta
+        )
+
+    def _iter_dense(self, start, stop, step, dates, listeners):
+        """Propagation with dense output
+
+        Only the current step is kept in memory. The outputs, and the points
+        checked by the listeners (the outputs and the end of each step), are
+        computed by the continuous extension of the current step.
+
+        Args:
+            start (Date): Start of the propagation
+            stop (Date): End of the propagation
+            step (timedelta): Step of the outputs. If ``None``, the outputs
+                are the points computed by the integrator, and ``stop``
+            dates (iterable of Date): Dates of the outputs, overriding
+                ``start``, ``stop`` and ``step``
+            listeners (list of Listener)
+        Yield:
+            StateVector
+        """
+
+        dense = DenseOutput(self)
+        t_start, t_stop = self._seconds(start), self._seconds(stop)
+
+        if t_start != dense.t:
+            # Position the start of the real extrapolation when requested
+            # by extrapolation or retropolation
+            dense.next_step = sign(t_start) * self.step
+            while not dense.contains(t_start):
+                dense.step()
+            dense.start(t_start)
+
+        if dates is not None:
+            outputs = iter(dates)
+        elif step is not None:
+            outputs = iter(Date.range(start, stop, step, inclusive=True))
+        else:
+            # The outputs are the points computed by the integrator
+            outputs = None
+
+        def next_output():
+            date = next(outputs, None)
+            return date, None if date is None else self._seconds(date)
+
+        if outputs is not None:
+            output, t_output = next_output()
+
+        dense.clear_listeners(listeners)
+
+        orb = dense.statevector(t_start, start)
+        yield from dense.listen(orb, listeners)
+        if outputs is None or t_output == t_start:
+            yield orb
+            if outputs is not None:
+                output, t_output = next_output()
+
+        direction = 1 if t_stop >= t_start else -1
+        dense.next_step = self.step * direction
+
+        while (t_stop - dense.t) * direction > 0:
+
+            if outputs is not None and output is None:
+                break
+
+            dense.step()
+            t = dense.t
+
+            if outputs is not None:
+                while output is not None and dense.contains(t_output, strict=True):
+                    orb = dense.statevector(t_output, output)
+                    yield from dense.listen(orb, listeners)
+                    yield orb
+                    output, t_output = next_output()
+
+            if outputs is not None and t_output == t:
+                orb = dense.statevector(t, output)
+                yield from dense.listen(orb, listeners)
+                yield orb
+                output, t_output = next_output()
+            elif outputs is None:
+                if (t_stop - t) * direction >= 0:
+                    orb = dense.statevector(t)
+                else:
+                    # The last step goes beyond the end of the propagation
+                    orb = dense.statevector(t_stop, stop)
+                yield from dense.listen(orb, listeners)
+                yield orb
+            elif listeners:
+                # The listeners are checked at the end of each step, in order
+                # to keep the search of events within the current step
+                yield from dense.listen(dense.statevector(t), listeners)
 
     def _iter(self, **kwargs):
 
@@ -215,46 +1206,50 @@ class KeplerNum(NumericalPropagator):
         if step is self.step:
             step = None
 
-        orb = self.orbit
-
-        if start != orb.date:
+        if self.dense:
+            if kwargs.get("real_steps", False):
+                step = None
+            for orb in self._iter_dense(start, stop, step, dates, listeners):
+                yield orb.as_orbit(self.copy())
+            return
+
+        # The propagation is done on raw arrays, with time expressed as
+        # seconds since the epoch of the orbit. Date and StateVector objects
+        # are only created for the output
+        t = 0.0
+        y = np.array(self.orbit)
+        t_start = self._seconds(start)
+        t_stop = self._seconds(stop)
+
+        if t_start != t:
             # Position the start of the real extrapolation when requested
             # by extrapolation or retropolation
 
-            # Step size for initial extrapolation or retropolation
-            _step = sign((start - orb.date).total_seconds()) * self.step
-
-            ephem = [orb]
-
-            date = orb.date
-            mname = "__lt__" if _step.total_seconds() > 0 else "__gt__"
-            while getattr(date, mname)(start):
-                real_step, orb = self._make_step(orb, _step)
-                ephem.append(orb)
-                date += real_step
-
             # Provide enough extra steps to allow Ephem to interpolate
             # with order DEFAULT_ORDER
-            for i in range(Ephem.DEFAULT_ORDER - len(ephem)):
-                real_step, orb = self._make_step(orb, _step)
-                ephem.append(orb)
+            times, states = self._trajectory(t_start, Ephem.DEFAULT_ORDER)
 
-            ephem = Ephem(ephem)
             # Interpolation of the ephemeris to get the desired start date
-            orb = ephem.propagate(start)
+            t = t_start
+            y = np.array(self._ephem(times, states).propagate(start))
 
         # In order to compute the propagation with the reference step size
         # (ie self.step), but give the result at the requested step size
         # (ie step), we use an Ephem object for interpolation
-        ephem = [orb]
+        if t == 0:
+            # The propagation starts at the epoch of the orbit
+            times, states = self._trajectory(max(t_stop, 0.0))
+        else:
+            times, states = [t], [y]
 
-        date = start
-        while date < stop:
-            real_step, orb = self._make_step(orb, self.step)
-            ephem.append(orb)
-            date += real_step
+            _step = self.step
+            while t < t_stop:
+                real_step, y, _step = self._make_step(t, y, _step)
+                t += real_step.total_seconds()
+                times.append(t)
+                states.append(y)
 
-        ephem = Ephem(ephem)
+        ephem = self._ephem(times, states)
 
         if kwargs.get("real_steps", False):
             ephem_iter = ephem.iter(dates=dates, listeners=listeners)
@@ -265,6 +1260,212 @@ class KeplerNum(NumericalPropagator):
             yield orb.as_orbit(self.copy())
 
 
+class Stats:
+    """Statistics of a propagation"""
+
+    def __init__(self):
+        self.accepted = 0
+        """Number of accepted steps"""
+        self.rejected = 0
+        """Number of rejected steps (adaptive stepsize methods only)"""
+        self.evaluations = 0
+        """Number of evaluations of the forces"""
+
+    def __repr__(self):  # pragma: no cover
+        return "<Stats accepted={} rejected={} evaluations={}>".format(
+            self.accepted, self.rejected, self.evaluations
+        )
+
+
+class Trajectory:
+    """Points computed by a :py:class:`KeplerNum` propagator from the epoch of
+    its orbit, in one direction of time
+    """
+
+    def __init__(self, y, control):
+        """
+        Args:
+            y (numpy.ndarray): State at the epoch of the orbit
+            control (tuple): State of the integrator at the epoch
+        """
+
+        self.times = [0.0]
+        """Elapsed time since the epoch of the orbit"""
+        self.states = [y]
+        """Position and velocity at each time"""
+        self.controls = [control]
+        """State of the integrator after each point: step size proposed for
+        the next step, error of the last step and derivatives of the previous
+        steps (multistep methods only)"""
+        self.nbytes = 8 + y.nbytes
+        """Approximate memory used by the points"""
+
+    def append(self, t, y, control):
+        """Add a point at the end of the trajectory"""
+
+        self.times.append(t)
+        self.states.append(y)
+        self.controls.append(control)
+
+        self.nbytes += 8 + y.nbytes
+        if control[2] is not None:
+            self.nbytes += control[2][2].nbytes
+
+
+class Checkpoints(LruCache):
+    """Bounded cache of the points computed by :py:class:`KeplerNum`
+    propagators, for each initial orbit, set of maneuvers and configuration
+    of the propagator
+
+    Its size is controlled by the ``propagators.keplernum`` section of the
+    :ref:`configuration <configuration>`.
+    """
+
+    DEFAULT_MAXSIZE = 64
+    DEFAULT_MAXBYTES = 64 * 2 ** 20
+
+    def __init__(self):
+        super().__init__(section=("propagators", "keplernum"))
+
+    @property
+    def enabled(self):
+        return config.get("propagators", "keplernum", "enabled", fallback=True)
+
+
+checkpoints = Checkpoints()
+"""Points already computed by :py:class:`KeplerNum` propagators"""
+
+
+class DenseOutput(Speaker):
+    """Continuous extension of the last step computed by a
+    :py:class:`KeplerNum` propagator
+
+    The state at a time :math:`t_n + \\theta h` of the step is
+    :math:`y_n + \\sum_j Q_j \\theta^j`, where the coefficients :math:`Q_j`
+    are computed from the intermediate stages of the step.
+    """
+
+    def __init__(self, propagator):
+        """
+        Args:
+            propagator (KeplerNum): Propagator, whose orbit is the starting
+                point of the propagation
+        """
+
+        self.propagator = propagator
+        self.t = 0.0
+        """Elapsed time since the epoch of the orbit, at the end of the step"""
+        self.y = np.array(propagator.orbit)
+        """State at the end of the step"""
+
+        self.t_n = self.t
+        self.y_n = self.y
+        self.h = 0.0
+        self.q = np.zeros((0, 6))
+
+        self.next_step = propagator.step
+        """Step size of the next step"""
+
+    def step(self):
+        """Compute the next step, starting from the end of the current one"""
+
+        prop = self.propagator
+        real_step, y_n_1, self.next_step = prop._make_step(
+            self.t, self.y, self.next_step
+        )
+        h = real_step.total_seconds()
+        ks = prop._stages
+
+        p = prop.butcher.get("p")
+        if "a_dense" in prop.butcher:
+            # Additional stages of the continuous extension
+            forces = prop._forces()
+            extra = np.empty((len(prop.butcher["a_dense"]), 6))
+            for j, (a, c) in enumerate(
+                zip(prop.butcher["a_dense"], prop.butcher["c_dense"])
+            ):
+                stages = np.vstack([ks, extra[:j]])
+                prop._accel(forces, self.t + c * h, self.y + h * a @ stages, extra[j])
+            prop.stats.evaluations += len(extra)
+            ks = np.vstack([ks, extra])
+        elif p is None:
+            # Cubic Hermite interpolation, between the states and derivatives
+            # at both ends of the step
+            bb = prop._weights
+            p = np.zeros((len(bb) + 1, 3))
+            p[:-1, 1:] = bb[:, None] * [3, -2]
+            p[0] += [1, -2, 1]
+            p[-1] = [0, -1, 1]
+
+            end = np.empty(6)
+            prop._accel(prop._forces(), self.t + h, self.y + h * bb @ ks, end)
+            prop.stats.evaluations += 1
+            ks = np.vstack([ks, end])
+
+        self.t_n, self.y_n, self.h = self.t, self.y, h
+        self.q = h * p.T @ ks
+        self.t, self.y = self.t + h, y_n_1
+
+    def start(self, t):
+        """Restart the propagation from a given time within the step"""
+
+        self.y = self(t)
+        self.t = t
+        self.t_n, self.y_n, self.h = self.t, self.y, 0.0
+        self.q = np.zeros((0, 6))
+
+    def contains(self, t, strict=False):
+        """Check if a time is within the step
+
+        Args:
+            t (float): Elapsed time since the epoch of the orbit
+            strict (bool): If ``True``, the ends of the step are excluded
+        Return:
+            bool
+        """
+
+        if not self.h:
+            return not strict and t == self.t
+
+        x = (t - self.t_n) * sign(self.h)
+        if strict:
+            return 0 < x < abs(self.h)
+        return 0 <= x <= abs(self.h)
+
+    def __call__(self, t):
+        """Position and velocity at a given time of the step
+
+        Args:
+            t (float): Elapsed time since the epoch of the orbit
+        Return:
+            numpy.ndarray
+        """
+
+        if t == self.t:
+            # The end of the step may include impulsive maneuvers
+            return self.y
+        elif t == self.t_n:
+            return self.y_n
+
+        theta = (t - self.t_n) / self.h
+        return self.y_n + theta ** np.arange(1, len(self.q) + 1) @ self.q
+
+    def statevector(self, t, date=None):
+        """StateVector at a given time of the step
+
+        Args:
+            t (float): Elapsed time since the epoch of the orbit
+            date (Date): Date corresponding to ``t``, if already known
+        Return:
+            StateVector
+        """
+        return self.propagator._statevector(t, self(t), date)
+
+    def propagate(self, date):
+        """Used by listeners to search for events within the step"""
+        return self.statevector(self.propagator._seconds(date), date)
+
+
 SOI = namedtuple("SOI", "radius frame")
 
 
@@ -286,7 +1487,18 @@ class SOIPropagator(KeplerNum):
     }
 
     def __init__(
-        self, central_step, alt_step, central, alt, *, method=KeplerNum.RK4, frame=None
+        self,
+        central_step,
+        alt_step,
+        central,
+        alt,
+        *,
+        method=KeplerNum.RK4,
+        frame=None,
+        tol=1e-3,
+        dense=False,
+        min_step=None,
+        max_step=None
     ):
         """
         Args:
@@ -300,6 +1512,13 @@ class SOIPropagator(KeplerNum):
             frame (str): Frame of the resulting extrapolation. If ``None``, the
                 result will change frame depending on the sphere of influence
                 it is in
+            tol (float): Error tolerance for adaptive stepsize methods
+            dense (bool): If ``True``, use dense output (see :py:class:`KeplerNum`)
+            min_step (datetime.timedelta): Minimum step size for adaptive
+                stepsize methods
+            max_step (datetime.timedelta): Maximum step size for adaptive
+                stepsize methods. If ``None``, the step of the active sphere
+                of influence is used.
         """
 
         self.alt_step = alt_step
@@ -310,6 +1529,13 @@ class SOIPropagator(KeplerNum):
         self.out_frame = frame
         self.frame = frame
         self.active = central.name
+        self.dense = dense
+        self.tol = tol
+        self.min_step = min_step
+        self.max_step = max_step
+        self.stats = Stats()
+        self._prev_error = 1e-4
+        self._history = None
 
     @property
     def orbit(self):
@@ -320,16 +1546,24 @@ class SOIPropagator(KeplerNum):
         soi = self._soi(orbit)
         self._change_soi(soi)
         self._orbit = orbit.copy(form="cartesian", frame=self.frame)
+        self._history = None
+        self._perturbers = {}
 
     def copy(self):
-        return self.__class__(
+        new = self.__class__(
             self.central_step,
             self.alt_step,
             self.central,
             self.alt,
             method=self.method,
             frame=self.out_frame,
+            tol=self.tol,
+            dense=self.dense,
+            min_step=self.min_step,
+            max_step=self.max_step,
         )
+        new._prev_error = self._prev_error
+        return new
 
     def _soi(self, orb):
         """Evaluate the need for SOI transition, by comparing the radial distance
@@ -1,16 +1,29 @@
+import weakref
 from datetime import timedelta
 
+import numpy as np
+
 from .base import AnalyticalPropagator
-from ..io.tle import Tle
+from ..dates import Date, DateArray
+from ..errors import OrbitError
 from ..orbits.statevector import StateVector
+from ..utils.memoize import LruCache
+
+from sgp4.api import Satrec, SatrecArray, SGP4_ERRORS, WGS72
 
-from sgp4.earth_gravity import wgs72
-from sgp4.io import twoline2rv
+records = LruCache(section=("propagators", "sgp4"))
+"""Records of the sgp4 library already initialized, for each orbit. Its size
+is controlled by the ``propagators.sgp4.maxsize`` configuration variable
+"""
 
 
 class Sgp4(AnalyticalPropagator):
     """Interface to the `sgp4 <https://github.com/brandon-rhodes/python-sgp4/>`__
     library
+
+    When many dates are requested at once (via :py:meth:`iter`), they are
+    handed over to the library in a single call. Many satellites may also be
+    propagated together with :py:meth:`propagate_array`.
     """
 
     @property
@@ -26,15 +39,111 @@ class Sgp4(AnalyticalPropagator):
         """
 
         self._orbit = orbit
-        tle = Tle.from_orbit(orbit)
-        lines = tle.text.splitlines()
 
-        if len(lines) == 3:
-            _, line1, line2 = lines
+    @property
+    def satrec(self):
+        """Record of the sgp4 library, see :py:meth:`_satrec`"""
+        return self._satrec(self.orbit)
+
+    @classmethod
+    def _satrec(cls, orbit):
+        """Record of the sgp4 library corresponding to an orbit
+
+        Records are kept in :py:data:`records` for each orbit, so the
+        propagator may be seeded over and over by the same orbits (for example
+        when many copies of an orbit share the same propagator) at no cost.
+
+        The values of the orbit are stored along with each record, which is
+        created anew if the orbit has been modified in place since.
+
+        Args:
+            orbit (Orbit)
+        Return:
+            sgp4.api.Satrec
+        """
+
+        signature = cls._signature(orbit)
+
+        try:
+            ref, sig, satrec = records[id(orbit)]
+        except KeyError:
+            pass
         else:
-            line1, line2 = lines
+            if ref() is orbit and sig == signature:
+                return satrec
+
+        satrec = cls._sgp4init(orbit)
+        records[id(orbit)] = (weakref.ref(orbit), signature, satrec)
+
+        return satrec
+
+    @staticmethod
+    def _signature(orbit):
+        """Values of an orbit used to initialize a record of the sgp4 library"""
+        return (
+            orbit.base.tobytes(),
+            orbit.form.name,
+            orbit.frame.name,
+            orbit.date.d,
+            orbit.date.s,
+            orbit.date.scale.name,
+            orbit.bstar,
+            orbit.ndot,
+            orbit.ndotdot,
+            getattr(orbit, "norad_id", 0),
+        )
+
+    @staticmethod
+    def _sgp4init(orbit):
+        """Initialize a record of the sgp4 library directly from the elements
+        of an orbit in TLE form, without formatting them as text
+
+        Args:
+            orbit (Orbit)
+        Return:
+            sgp4.api.Satrec
+        """
+
+        norad_id = getattr(orbit, "norad_id", 0)
+        orbit = orbit.copy(form="TLE", frame="TEME")
+        i, Ω, e, ω, M, n = orbit
+
+        satrec = Satrec()
+        satrec.sgp4init(
+            WGS72,
+            "i",
+            int(norad_id) if str(norad_id).isdigit() else 0,
+            # Days since 1949-12-31T00:00:00
+            (orbit.date.d - 33281) + orbit.date.s / 86400.0,
+            orbit.bstar,
+            orbit.ndot / 2 * 2 * np.pi / 1440.0 ** 2,  # rad/min²
+            orbit.ndotdot / 6 * 2 * np.pi / 1440.0 ** 3,  # rad/min³
+            e,
+            ω,
+            i,
+            M,
+            n * 60,  # rad/min
+            Ω,
+        )
+
+        return satrec
+
+    @staticmethod
+    def _jd(dates, scale):
+        """Conversion of dates into the two-part julian dates expected by the
+        sgp4 library
+
+        Args:
+            dates (Date or DateArray):
+            scale (Scale): timescale of the epoch of the TLE
+        Return:
+            tuple: julian dates and fractions of day
+        """
 
-        self.tle = twoline2rv(line1, line2, wgs72)
+        if dates.scale.name != scale.name:
+            dates = dates.change_scale(scale.name)
+
+        return dates.d + Date.JD_MJD, dates.s / 86400.0
 
     def propagate(self, date):
         """Propagate the initialized orbit
@@ -43,21 +152,86 @@ class Sgp4(AnalyticalPropagator):
             date (Date or datetime.timedelta)
         Return:
             Orbit
+        Raise:
+            OrbitError: if the sgp4 library reports an error
         """
 
         if type(date) is timedelta:
             date = self.orbit.date + date
 
-        # Convert the date to a tuple usable by the sgp4 library
-        _date = [float(x) for x in "{:%Y %m %d %H %M %S.%f}".format(date).split()]
-        p, v = self.tle.propagate(*_date)
+        error, p, v = self.satrec.sgp4(*self._jd(date, self.orbit.date.scale))
+
+        if error:
+            raise OrbitError(SGP4_ERRORS[error])
 
         # Convert from km to meters
-        result = [x * 1000 for x in p + v]
+        return self._statevector(np.array(p + v) * 1000, date)
 
+    def _statevector(self, coord, date):
         res_dict = self.orbit._data.copy()
         res_dict["date"] = date
         res_dict["form"] = "cartesian"
         res_dict.pop("propagator")
 
-        return StateVector(result, **res_dict)
+        return StateVector(coord, **res_dict)
+
+    def _iter(self, **kwargs):
+
+        dates = kwargs.get("dates")
+
+        if dates is None:
+            dates = Date.range(
+                kwargs["start"], kwargs["stop"], kwargs["step"], inclusive=True
+            )
+
+        dates = list(dates)
+        if not dates:
+            return
+
+        jd, fr = self._jd(DateArray.from_dates(dates), self.orbit.date.scale)
+        errors, p, v = self.satrec.sgp4_array(jd, fr)
+
+        # Convert from km to meters
+        coords = np.hstack([p, v]) * 1000
+
+        for date, error, coord in zip(dates, errors, coords):
+            if error:
+                raise OrbitError(SGP4_ERRORS[error])
+            yield self._statevector(coord, date)
+
+    @classmethod
+    def propagate_array(cls, orbits, dates):
+        """Propagate many orbits to many dates at once
+
+        .. code-block:: python
+
+            tles = list(Tle.from_string(text))
+            dates = DateArray.range(start, stop, timedelta(minutes=1))
+
+            states = Sgp4.propagate_array([tle.orbit() for tle in tles], dates)
+
+        Args:
+            orbits (list of Orbit): N orbits in TLE form
+            dates (DateArray or iterable of Date): M dates of propagation
+        Return:
+            numpy.ndarray: (N, M, 6) cartesian state vectors in TEME, in
+            meters and meters per second. The states that the sgp4 library
+            fails to compute (e.g. decayed satellites) are set to NaN.
+        """
+
+        orbits = list(orbits)
+        satrecs = [cls._satrec(orbit) for orbit in orbits]
+
+        if not isinstance(dates, DateArray):
+            dates = DateArray.from_dates(dates)
+
+        if not satrecs:
+            return np.empty((0, len(dates), 6))
+
+        jd, fr = cls._jd(dates, orbits[0].date.scale)
+        errors, p, v = SatrecArray(satrecs).sgp4(jd, fr)
+
+        coords = np.concatenate([p, v], axis=-1) * 1000
+        coords[errors != 0] = np.nan
+
+        return coords
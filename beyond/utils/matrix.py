@@ -7,61 +7,61 @@
 import numpy as np
 
 
+def _matrix(theta, rows):
+    """Build a 3x3 matrix from its elements. If theta is an array of shape (N,),
+    the result is a stack of matrices of shape (N, 3, 3)
+    """
+
+    if np.ndim(theta) == 0:
+        return np.array(rows)
+
+    elements = np.broadcast_arrays(*[x for row in rows for x in row])
+    return np.stack(elements, axis=-1).reshape(np.shape(theta) + (3, 3))
+
+
 def rot1(theta):
     """
     Args:
-        theta (float): Angle in radians
+        theta (float or numpy.ndarray): Angle in radians
     Return:
-        Rotation matrix of angle theta around the X-axis
+        Rotation matrix of angle theta around the X-axis. If theta is an array
+        of shape (N,), a stack of matrices of shape (N, 3, 3) is returned.
     """
-    return np.array(
-        [
-            [1, 0, 0],
-            [0, np.cos(theta), np.sin(theta)],
-            [0, -np.sin(theta), np.cos(theta)],
-        ]
-    )
+    c, s = np.cos(theta), np.sin(theta)
+    return _matrix(theta, [[1, 0, 0], [0, c, s], [0, -s, c]])
 
 
 def rot2(theta):
     """
     Args:
-        theta (float): Angle in radians
+        theta (float or numpy.ndarray): Angle in radians
     Return:
-        Rotation matrix of angle theta around the Y-axis
+        Rotation matrix of angle theta around the Y-axis. If theta is an array
+        of shape (N,), a stack of matrices of shape (N, 3, 3) is returned.
     """
-    return np.array(
-        [
-            [np.cos(theta), 0, -np.sin(theta)],
-            [0, 1, 0],
-            [np.sin(theta), 0, np.cos(theta)],
-        ]
-    )
+    c, s = np.cos(theta), np.sin(theta)
+    return _matrix(theta, [[c, 0, -s], [0, 1, 0], [s, 0, c]])
 
 
 def rot3(theta):
     """
     Args:
-        theta (float): Angle in radians
+        theta (float or numpy.ndarray): Angle in radians
     Return:
-        Rotation matrix of angle theta around the Z-axis
+        Rotation matrix of angle theta around the Z-axis. If theta is an array
+        of shape (N,), a stack of matrices of shape (N, 3, 3) is returned.
     """
-    return np.array(
-        [
-            [np.cos(theta), np.sin(theta), 0],
-            [-np.sin(theta), np.cos(theta), 0],
-            [0, 0, 1],
-        ]
-    )
+    c, s = np.cos(theta), np.sin(theta)
+    return _matrix(theta, [[c, s, 0], [-s, c, 0], [0, 0, 1]])
 
 
 def expand(m):
     """Duplicate a 3x3 matrix diagonaly into a 6x6 matrix
 
     Args:
-        m1 (numpy.ndarray) : 3x3 matrix
+        m (numpy.ndarray) : 3x3 matrix, or stack of matrices of shape (N, 3, 3)
     Return:
-        numpy.ndarray : 6x6
+        numpy.ndarray : 6x6, or (N, 6, 6)
 
     Example:
 
@@ -75,8 +75,8 @@ def expand(m):
      [ 0.  0.  0.  0.  0.  1.]]
     """
 
-    out = np.identity(6)
-    out[:3, :3] = m
-    out[3:, 3:] = m
+    out = np.zeros(np.shape(m)[:-2] + (6, 6))
+    out[..., :3, :3] = m
+    out[..., 3:, 3:] = m
 
     return out
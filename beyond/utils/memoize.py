@@ -1,20 +1,221 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+"""Bounded caches and memoization decorator
+
+The size and time-to-live of the caches created by :py:func:`memoize` may be
+controlled via the ``memoize`` section of the :ref:`configuration <configuration>`.
+
+.. code-block:: python
+
+    from beyond.config import config
+
+    config.set("memoize", "maxsize", 10000)  # number of entries per function
+    config.set("memoize", "ttl", 3600)  # in seconds
+"""
+
+import sys
+import time
 import functools
+from collections import OrderedDict, namedtuple
+
+from ..config import config
+
+__all__ = ["LruCache", "CacheInfo", "memoize"]
+
+
+class CacheInfo(
+    namedtuple("CacheInfo", "hits misses evictions maxsize currsize maxbytes currbytes")
+):
+    """Statistics of a cache"""
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """Ratio of hits over the total number of lookups"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
 
+class LruCache:
+    """Mapping with a bounded size, discarding the Least Recently Used
+    entries first. Entries may also be given a time-to-live.
 
-def memoize(obj):
-    """Memoize decorator, as seen on
-    `here <https://wiki.python.org/moin/PythonDecoratorLibrary#Memoize>`_
+    The number of hits, misses and evictions is recorded.
+
+    The memory used by the values (as given by the ``nbytes`` attribute of
+    numpy arrays, or by :py:func:`sys.getsizeof` otherwise) may also be bounded.
     """
-    cache = obj._cache = {}
+
+    DEFAULT_MAXSIZE = 4096
+    """Number of entries kept when neither the constructor nor the configuration
+    provide a maximum size"""
+
+    DEFAULT_MAXBYTES = None
+    """Memory budget when neither the constructor nor the configuration
+    provide one"""
+
+    def __init__(self, maxsize=None, ttl=None, maxbytes=None, section=("memoize",)):
+        """
+        Args:
+            maxsize (int): Maximum number of entries. If ``None`` the value is taken
+                from the ``maxsize`` configuration variable, with a fallback
+                to :py:attr:`DEFAULT_MAXSIZE`. A negative value disables the bound.
+            ttl (float): Time-to-live of each entry, in seconds. If ``None`` the
+                value is taken from the ``ttl`` configuration variable.
+                Without both, entries never expire.
+            maxbytes (int): Maximum memory used by the values, in bytes. If ``None``
+                the value is taken from the ``maxbytes`` configuration variable,
+                with a fallback to :py:attr:`DEFAULT_MAXBYTES`.
+            section (tuple of str): Section of the configuration in which to look
+                for the variables above
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._maxbytes = maxbytes
+        self._section = section
+        self.currbytes = 0
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self):
+        if self._maxsize is not None:
+            return self._maxsize
+        return config.get(*self._section, "maxsize", fallback=self.DEFAULT_MAXSIZE)
+
+    @property
+    def ttl(self):
+        if self._ttl is not None:
+            return self._ttl
+        return config.get(*self._section, "ttl")
+
+    @property
+    def maxbytes(self):
+        if self._maxbytes is not None:
+            return self._maxbytes
+        return config.get(*self._section, "maxbytes", fallback=self.DEFAULT_MAXBYTES)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __getitem__(self, key):
+        """Retrieve a value and mark it as the most recently used
+
+        Raise:
+            KeyError: if the key is absent or has expired
+        """
+
+        try:
+            value, expiry, size = self._data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+
+        if expiry is not None and expiry < time.monotonic():
+            del self._data[key]
+            self.currbytes -= size
+            self.evictions += 1
+            self.misses += 1
+            raise KeyError(key)
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        ttl = self.ttl
+        expiry = time.monotonic() + ttl if ttl is not None else None
+
+        size = getattr(value, "nbytes", None)
+        if size is None:
+            size = sys.getsizeof(value)
+
+        if key in self._data:
+            self.currbytes -= self._data[key][2]
+
+        self._data[key] = (value, expiry, size)
+        self._data.move_to_end(key)
+        self.currbytes += size
+
+        maxsize = self.maxsize
+        if maxsize is None or maxsize < 0:
+            maxsize = float("inf")
+        maxbytes = self.maxbytes
+        if maxbytes is None:
+            maxbytes = float("inf")
+
+        while len(self._data) > maxsize or self.currbytes > maxbytes:
+            *_, size = self._data.popitem(last=False)[1]
+            self.currbytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Empty the cache and reset the statistics"""
+        self._data.clear()
+        self.currbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self):
+        """
+        Return:
+            CacheInfo: Statistics of the cache
+        """
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.maxsize,
+            len(self._data),
+            self.maxbytes,
+            self.currbytes,
+        )
+
+
+def memoize(obj=None, *, maxsize=None, ttl=None):
+    """Memoize decorator, backed by a :py:class:`LruCache`
+
+    Can be used bare (``@memoize``) or with arguments (``@memoize(maxsize=10)``).
+
+    The cache is keyed on the hash of the arguments. Calls with unhashable arguments
+    (e.g. arrays) are not cached. The decorated function gains ``cache_info()`` and
+    ``cache_clear()`` methods, as with :py:func:`functools.lru_cache`.
+
+    Args:
+        maxsize (int): see :py:class:`LruCache`
+        ttl (float): see :py:class:`LruCache`
+    """
+
+    if obj is None:
+        return functools.partial(memoize, maxsize=maxsize, ttl=ttl)
+
+    cache = LruCache(maxsize, ttl)
 
     @functools.wraps(obj)
     def memoizer(*args, **kwargs):
-        key = str(args) + str(kwargs)
-        if key not in cache:
-            cache[key] = obj(*args, **kwargs)
-        return cache[key]
+        key = (args, tuple(sorted(kwargs.items())))
+
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments
+            return obj(*args, **kwargs)
+
+        value = cache[key] = obj(*args, **kwargs)
+        return value
+
+    memoizer.cache = cache
+    memoizer.cache_info = cache.info
+    memoizer.cache_clear = cache.clear
 
     return memoizer
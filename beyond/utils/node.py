@@ -5,12 +5,16 @@
 hierarchy or in a graph.
 """
 
-from collections import OrderedDict
+import warnings
+from collections import OrderedDict, deque
 
 
 class Route:
-    """Class used by :py:class:`Node` to describe where to find
-    another node.
+    """Class describing where to find another node
+
+    .. deprecated::
+        Only kept for compatibility with :py:attr:`Node.routes`. Use
+        :py:meth:`Node.path` instead.
     """
 
     def __init__(self, direction, steps):
@@ -52,6 +56,12 @@ class Node:
         # [E, F, A, B] or [E, D, C, B]
     """
 
+    generation = 0
+    """Counter incremented each time a link is created between two nodes.
+    It allows to invalidate any information derived from the structure of
+    the graph
+    """
+
     def __init__(self, name):
         """
         Args:
@@ -63,64 +73,136 @@ class Node:
 
         self.neighbors = OrderedDict()
         """List of all direct neighbors in the graph.
-        OrderedDict is only used as OrderedSet, so only the keys of the dict matter
+        The values of the dict are the ranks of creation of each link
         """
 
-        self.routes = {}
-        """Route mapping. What direction to follow in order to reach a
-        particular target
-        """
+        self._names = {}
+        """Direct neighbors, by name"""
+
+        self._hubs = {}
+        """Direct neighbors having neighbors of their own, with the rank
+        of creation of the link"""
+
+        self._paths = {}
+        self._generation = None
 
     def __add__(self, other):
-        self.neighbors[other] = None
-        other.neighbors[self] = None
-        self._update()
+        # Paths are computed lazily, so adding a node only requires
+        # to update the direct neighborhood of both nodes
+        Node.generation += 1
+
+        for a, b in ((self, other), (other, self)):
+            if b not in a.neighbors:
+                a.neighbors[b] = Node.generation
+                a._names[b.name] = b
+
+        for node, new in ((self, other), (other, self)):
+            if len(node.neighbors) == 2:
+                # The node was a leaf until now
+                for neighbor, rank in node.neighbors.items():
+                    neighbor._hubs[node] = rank
+            elif len(node.neighbors) > 2:
+                new._hubs[node] = node.neighbors[new]
+
         return other
 
     @property
     def list(self):
-        return [self.path(node_name)[-1] for node_name in self.routes.keys()] + [self]
+        """All the nodes reachable from this one, including itself"""
+
+        nodes = {self: None}
+        queue = deque([self])
+        while queue:
+            for neighbor in queue.popleft().neighbors:
+                if neighbor not in nodes:
+                    nodes[neighbor] = None
+                    queue.append(neighbor)
+
+        return list(nodes)[1:] + [self]
+
+    @property
+    def routes(self):
+        """Route mapping. What direction to follow in order to reach a
+        particular target
+
+        .. deprecated::
+            The routes are not stored anymore, and this mapping is computed
+            at each access. Use :py:meth:`path` or :py:meth:`steps` instead.
+        """
+
+        warnings.warn(
+            "Node.routes is deprecated, use Node.path() instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        routes = {}
+        for node in self.list[:-1]:
+            path = self.path(node.name)
+            routes[node.name] = Route(path[1], len(path) - 1)
+
+        return routes
 
-    def _update(self, already_updated=None):
+    def _memo(self):
+        """Cache of paths from this node, reset at each modification of the graph"""
 
-        self.routes = {}
-        for node in self.neighbors:
-            self.routes[node.name] = Route(node, 1)
+        if self._generation != Node.generation:
+            self._paths = {}
+            self._generation = Node.generation
 
-            # Retrieve route from neighbors
-            for name, route in node.routes.items():
+        return self._paths
 
-                # check if the node actually at hand (name) is not already
-                # a direct neighbor of self
-                if name in [self.name] + [x.name for x in self.neighbors]:
-                    continue
+    def _search(self, goal):
+        """Breadth-first search of a node
 
-                # check if the node actually at hand (name) is not already
-                # integrated in the self.routes or if it already is, if the
-                # path is shorter
-                if (
-                    name in self.routes.keys()
-                    and self.routes[name].steps <= route.steps
-                ):
-                    continue
+        Neighbors are explored from the most recently linked to the oldest.
+        The search stops as soon as the goal is discovered.
 
-                self.routes[name] = Route(node, route.steps + 1)
+        Args:
+            goal (str): Name of the targeted node
+        Return:
+            list of Node
+        """
+
+        if len(self.neighbors) == 1:
+            # Any path from a leaf goes through its only neighbor
+            neighbor = next(iter(self.neighbors))
+            if neighbor.name != goal:
+                return [self] + neighbor.path(goal)
 
-        # This set serves as a shared lock, every object that is in this set
-        # won't be updated by others. This is to avoid infinite recursions
-        if already_updated is None:
-            already_updated = set()
+        parents = {self: None}
+        queue = deque([self])
+        found = None
 
-        already_updated.add(self)
+        while queue:
+            node = queue.popleft()
+
+            if goal in node._names and node._names[goal] not in parents:
+                found = node._names[goal]
+                parents[found] = node
+                break
+
+            # Leaves are not explored, as they can't lead anywhere
+            for neighbor in sorted(node._hubs, key=node._hubs.get, reverse=True):
+                if neighbor not in parents:
+                    parents[neighbor] = node
+                    queue.append(neighbor)
+
+        if found is None:
+            raise ValueError("Unknown '{0}'".format(goal))
 
-        # Recursive update (with lock)
-        for node in self.neighbors:
-            if node not in already_updated:
-                node._update(already_updated)
+        path = []
+        while found is not None:
+            path.append(found)
+            found = parents[found]
+
+        return path[::-1]
 
     def path(self, goal):
         """Get the shortest way between two nodes of the graph
 
+        The result is kept until the next modification of the graph.
+
         Args:
             goal (str): Name of the targeted node
         Return:
@@ -133,30 +215,34 @@ class Node:
         if goal == self.name:
             return [self]
 
-        if goal not in self.routes:
-            raise ValueError("Unknown '{0}'".format(goal))
+        memo = self._memo()
+        if goal not in memo:
+            memo[goal] = self._search(goal)
 
-        obj = self
-        path = [obj]
-        while True:
-            obj = obj.routes[goal].direction
-            path.append(obj)
-            if obj.name == goal:
-                break
-        return path
+        return list(memo[goal])
 
     def steps(self, goal):
         """Get the list of individual relations leading to the targeted node
 
+        The result is kept until the next modification of the graph.
+
         Args:
             goal (str): Name of the targeted node
         Return:
             list of tuple of Node
         """
 
-        path = self.path(goal)
-        for i in range(len(path) - 1):
-            yield path[i], path[i + 1]
+        if isinstance(goal, Node):
+            goal = goal.name
+
+        memo = self._memo()
+        key = (goal, "steps")
+
+        if key not in memo:
+            path = self.path(goal)
+            memo[key] = list(zip(path[:-1], path[1:]))
+
+        return list(memo[key])
 
     def __str__(self):  # pragma: no cover
         return self.name
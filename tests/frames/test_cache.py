@@ -0,0 +1,116 @@
+import numpy as np
+from pytest import raises
+
+from beyond.config import config
+from beyond.dates import Date, timedelta
+from beyond.frames import orient
+from beyond.frames.frames import ITRF
+from beyond.frames.cache import frame_cache
+from beyond.frames.stations import create_station
+
+
+def test_cache(common_env):
+
+    date = Date(2018, 4, 5, 16, 50)
+
+    with frame_cache.scope():
+        m1 = orient.TEME.convert_to(date, orient.ITRF)
+        m2 = orient.TEME.convert_to(date, "ITRF")
+
+        assert m1 is m2
+        assert frame_cache.info().hits == 1
+        assert frame_cache.info().misses == 1
+        assert frame_cache.info().hit_rate == 0.5
+        assert frame_cache.info().currbytes == m1.nbytes
+
+        # Cached values are shared, and should not be modified
+        with raises(ValueError):
+            m1[0, 0] = 2
+
+        m3 = orient.TEME.convert_to(date + timedelta(microseconds=1), orient.ITRF)
+        assert m3 is not m1
+
+        # Modification of the graph
+        create_station("Cache", (43.604482, 1.443962, 172.0))
+        m4 = orient.TEME.convert_to(date, orient.ITRF)
+        assert m4 is not m1
+        assert np.all(m4 == m1)
+
+        offset = ITRF.center.convert_to(date, "Cache", orient.TEME)
+        assert ITRF.center.convert_to(date, "Cache", "TEME") is offset
+
+    assert frame_cache.info().currsize == 0
+
+    with frame_cache.scope(enabled=False):
+        m1 = orient.TEME.convert_to(date, orient.ITRF)
+        m2 = orient.TEME.convert_to(date, orient.ITRF)
+        assert m1 is not m2
+        assert frame_cache.info().currsize == 0
+
+    config.set("frames", "cache", "enabled", False)
+    try:
+        assert not frame_cache.enabled
+    finally:
+        del config["frames"]
+
+
+def test_cache_memory(common_env):
+
+    date = Date(2018, 4, 5, 16, 50)
+
+    config.set("frames", "cache", "maxbytes", 3 * 288)
+    try:
+        with frame_cache.scope():
+            for i in range(5):
+                orient.TEME.convert_to(date + timedelta(minutes=i), orient.ITRF)
+
+            assert frame_cache.info().currsize == 3
+            assert frame_cache.info().evictions == 2
+            assert frame_cache.info().currbytes <= 3 * 288
+    finally:
+        del config["frames"]
+
+
+def test_cache_config(common_env):
+
+    date = Date(2018, 4, 5, 16, 50)
+
+    with frame_cache.scope():
+        m1 = orient.GCRF.convert_to(date, orient.CIRF)
+
+        config.set("frames", "iau2010", "xys", "interpolated")
+        try:
+            m2 = orient.GCRF.convert_to(date, orient.CIRF)
+        finally:
+            del config["frames"]
+
+        # The configuration of the model is part of the key of the cache
+        assert m2 is not m1
+        assert not np.all(m2 == m1)
+        assert orient.GCRF.convert_to(date, orient.CIRF) is m1
+
+
+def test_cache_orbit(common_env, iss_tle):
+
+    from beyond.frames.frames import orbit2frame
+
+    sv = iss_tle.orbit().propagate(timedelta(0)).copy(frame="EME2000")
+    date = sv.date
+    frame = orbit2frame("CacheSat", sv, orientation="QSW")
+
+    with frame_cache.scope():
+        offset = frame.center.convert_to(date, "Earth", "EME2000")
+        m = frame.orientation.convert_to(date, "EME2000")
+
+        # The transformations depending on an orbit are not cached, as the
+        # orbit may be modified in place
+        sv[:3] += 1000.0
+        assert not np.all(frame.center.convert_to(date, "Earth", "EME2000") == offset)
+        sv[3] += 10.0
+        assert not np.all(frame.orientation.convert_to(date, "EME2000") == m)
+        assert not any("CacheSat" in key[3:] for key in frame_cache._data)
+
+        # Other transformations still are
+        size = frame_cache.info().currsize
+        orient.TEME.convert_to(date, orient.ITRF)
+        assert frame_cache.info().currsize == size + 1
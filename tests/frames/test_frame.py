@@ -234,13 +234,13 @@ def test_orbit2frame():
     assert tnw.orientation.orient == "TNW"
 
     s1 = soyouz.copy(frame='iss_inert')
-    assert_vector(s1, np.array([70.5889585, 73.6584008, -62.5406308, 0.0521557, 0.0998631, -0.0423856]))
+    assert_vector(s1, np.array([70.6160319, 73.6510905, -62.5278917, 0.0521517, 0.0998887, -0.0423624]))
 
     s2 = soyouz.copy(frame="iss_qsw")
-    assert_vector(s2, np.array([4.5450528, -18.6989377, -118.107503, 0.0393978, -0.0046244, -0.1136478]))
+    assert_vector(s2, np.array([4.5450427, -18.7297385, -118.107503, 0.0394326, -0.0046245, -0.1136477]))
 
     s3 = soyouz.copy(frame="iss_tnw")
-    assert_vector(s3, np.array([-18.6974528, -4.5511611, -118.107503, -0.0046116, -0.0393993, -0.1136478]))
+    assert_vector(s3, np.array([-18.7282537, -4.551161, -118.107503, -0.0046116, -0.0394341, -0.1136477]))
 
     # Whatever the local reference frame, the W vector is the same
     assert s2[2] == s3[2]
@@ -249,3 +249,172 @@ def test_orbit2frame():
     # same relative positions, but expressed in differents frames
     assert_almost_equal(norm(s1[:3]), norm(s2[:3]), decimal=5)
     assert_almost_equal(norm(s2[:3]), norm(s3[:3]))
+
+
+def test_orientation_plan(date):
+
+    from beyond.frames import orient
+    from beyond.frames.stations import create_station
+    from beyond.utils.matrix import expand
+
+    def reference(start, target):
+        """Step by step product of the 6x6 matrices"""
+
+        m = np.identity(6)
+        for a, b in start.steps(target):
+            if hasattr(start, f"{a}_to_{b}"):
+                m1, m2 = getattr(start, f"{a}_to_{b}")(date)
+            else:
+                m1, m2 = getattr(start, f"{b}_to_{a}")(date)
+                m1 = m1.T
+                m2 = m2.T if m2 is not None else None
+
+            M = expand(m1)
+            if m2 is not None:
+                M[3:, :3] = m2
+            m = M @ m
+        return m
+
+    station = create_station("Plan", (43.604482, 1.443962, 172.0))
+
+    pairs = [
+        (orient.TEME, orient.G50),
+        (orient.G50, orient.GCRF),
+        (orient.GCRF, orient.TEME),
+        (station.orientation, orient.G50),
+        (orient.EME2000, station.orientation),
+        (orient.CIRF, station.orientation),
+    ]
+
+    for start, target in pairs:
+        assert_almost_equal(start.convert_to(date, target), reference(start, target), 15)
+
+    assert_almost_equal(orient.TEME.convert_to(date, orient.TEME), np.identity(6))
+
+    # The plan is kept between calls, and the constant steps are computed once
+    pef_plan = station.orientation._plan("PEF")
+    assert station.orientation._plan("PEF") is pef_plan
+    assert len(pef_plan) == 2
+    assert pef_plan[0][1] is None
+    assert not callable(pef_plan[0][0])
+
+    plan = station.orientation._plan("G50")
+    assert [callable(step) for step, _ in plan] == [False, True, True, True, True, False]
+
+    # Consecutive constant steps are folded
+    station_g50 = create_station("PlanG50", (43.604482, 1.443962, 172.0), parent_frame=G50)
+    plan = station_g50.orientation._plan("EME2000")
+    assert len(plan) == 1
+    assert not callable(plan[0][0])
+    assert_almost_equal(
+        station_g50.orientation.convert_to(date, "EME2000"),
+        reference(station_g50.orientation, orient.EME2000),
+        15
+    )
+
+    # Any modification of the graph invalidates the plans
+    create_station("Plan2", (43.604482, 1.443962, 172.0))
+    assert station.orientation._plan("PEF") is not pef_plan
+
+
+@fixture
+def isolated_frame():
+    """Frame outside of the graphs of the library, removed with all the frames
+    attached to it afterward
+    """
+
+    from beyond.frames.center import Center
+    from beyond.frames.frames import Frame, dynamic
+    from beyond.frames.orient import Orientation
+
+    def create(name):
+        return Frame(name, Orientation(name), Center(name))
+
+    inertial = create("IsolatedInertial")
+    frame = create("Isolated")
+    frame.orientation + inertial.orientation
+    frame.center.node + inertial.center.node
+
+    yield frame
+
+    for node in frame.orientation.list:
+        dynamic.pop(node.name, None)
+        for neighbor in node.neighbors:
+            for cls in (Orientation, Center):
+                name = "{}_to_{}".format(node.name, neighbor.name)
+                if name in vars(cls):
+                    delattr(cls, name)
+
+
+def test_many_stations(isolated_frame):
+
+    from beyond.frames.stations import create_station
+
+    ref = create_station(
+        "IsolatedRef", (43.604482, 1.443962, 172.0), parent_frame=isolated_frame
+    )
+
+    orientation_path = ref.orientation.path("IsolatedInertial")
+    center_path = ref.center.node.path("IsolatedInertial")
+    expected = ["IsolatedRef", "Isolated", "IsolatedInertial"]
+    assert [node.name for node in orientation_path] == expected
+    assert [node.name for node in center_path] == expected
+
+    names = ["Isolated{}".format(i) for i in range(10000)]
+    for i, name in enumerate(names):
+        latlonalt = (-80 + i * 16e-3, -170 + i * 34e-3, 10.0)
+        create_station(name, latlonalt, parent_frame=isolated_frame)
+
+    assert [get_frame(name).name for name in names] == names
+
+    # The graphs are extended, but the paths between existing nodes are the same
+    assert ref.orientation.path("IsolatedInertial") == orientation_path
+    assert ref.center.node.path("IsolatedInertial") == center_path
+
+    station = get_frame("Isolated9999")
+    assert station.orientation.path("IsolatedRef") == [
+        station.orientation, isolated_frame.orientation, ref.orientation
+    ]
+    assert station.center.node.path("IsolatedInertial")[1:] == center_path[1:]
+
+
+def test_transform_array(date):
+
+    from beyond.dates import DateArray, timedelta
+    from beyond.frames.stations import create_station
+
+    create_station("Array", (43.604482, 1.443962, 172.0))
+
+    orb = Orbit(
+        [6678137.0, 0.0, 0.0, 0.0, 7726.6, 0.0],
+        date,
+        "cartesian",
+        "EME2000",
+        "Kepler",
+    )
+    orb.as_frame("array_qsw", orientation="QSW")
+
+    dates = DateArray.range(date, timedelta(hours=2), timedelta(minutes=7))
+    coords = np.array([
+        [-1033479.383 + 1000 * i, 7901295.2754, 6380356.5958, -3225.636520, -2872.451450, 5531.924446]
+        for i in range(len(dates))
+    ])
+
+    for src, dst in [("ITRF", "GCRF"), ("TEME", "G50"), ("Array", "CIRF"), ("EME2000", "array_qsw")]:
+
+        src, dst = get_frame(src), get_frame(dst)
+        out = src.transform_array(coords, dates, dst)
+
+        assert out.shape == coords.shape
+
+        for coord, d, new in zip(coords, dates, out):
+            ref = src.transform(StateVector(coord, d, "cartesian", src), dst)
+            assert_vector(ref, new, (7, 10))
+
+        # Single date
+        out = src.transform_array(coords, date, dst)
+        ref = src.transform(StateVector(coords[-1], date, "cartesian", src), dst)
+        assert_vector(ref, out[-1], (7, 10))
+
+    with raises(RuntimeError):
+        Hill.transform_array(coords, dates, ITRF)
@@ -6,9 +6,11 @@ from pytest import fixture, yield_fixture
 from unittest.mock import patch
 from numpy.testing import assert_almost_equal
 
-from beyond.dates.date import Date
+from beyond.dates.date import Date, DateArray, timedelta
 from beyond.dates.eop import Eop
-from beyond.frames.iau1980 import _earth_orientation, _precesion, _nutation, _sideral, rate
+from beyond.frames.iau1980 import (
+    _earth_orientation, _precesion, _nutation, _sideral, rate, nutation, precesion, sideral, equinox
+)
 
 
 @fixture
@@ -58,3 +60,28 @@ def test_sideral(date):
 
 def test_rate(date):
     assert_almost_equal(rate(date), np.array([0, 0, 7.2921150153560662e-05]))
+
+
+def test_arrays(date):
+
+    # The range spans MJD 50506, when the kinematic terms of the
+    # equation of the equinoxes are introduced
+    dates = DateArray.range(Date(1997, 2, 25), timedelta(days=4), timedelta(hours=1))
+    dates = DateArray.from_dates(list(dates) + [date])
+
+    eps, dpsi, deps = _nutation(dates)
+    assert eps.shape == dpsi.shape == deps.shape == (len(dates),)
+    assert rate(dates).shape == (len(dates), 3)
+
+    for func in (nutation, precesion, sideral):
+        assert func(dates).shape == (len(dates), 3, 3)
+
+    for i, d in enumerate(dates):
+        assert_almost_equal(_nutation(d), (eps[i], dpsi[i], deps[i]), decimal=15)
+        assert_almost_equal(equinox(d), equinox(dates)[i], decimal=15)
+        assert_almost_equal(rate(d), rate(dates)[i], decimal=15)
+        assert_almost_equal(nutation(d), nutation(dates)[i], decimal=15)
+        assert_almost_equal(precesion(d), precesion(dates)[i], decimal=15)
+        assert_almost_equal(
+            sideral(d, model="apparent"), sideral(dates, model="apparent")[i], decimal=15
+        )
@@ -2,11 +2,13 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
-from pytest import fixture, yield_fixture
+from pytest import fixture, yield_fixture, raises
 from unittest.mock import patch
 
-from beyond.dates.date import Date
+from beyond.dates.date import Date, DateArray, timedelta
+from beyond.config import config
 from beyond.dates.eop import Eop
+from beyond.errors import ConfigError
 from beyond.frames.iau2010 import _earth_orientation, _sideral, _planets, _xys, _xysxy2
 
 
@@ -70,4 +72,41 @@ def test_xys(date):
 
     # Check of the value of s
     _, _, s = np.degrees(_xys(date)) * 3600.
-    assert abs(s + 0.003027) < 1e-6
\ No newline at end of file
+    assert abs(s + 0.003027) < 1e-6
+
+
+def test_xys_array(date):
+
+    dates = DateArray.range(date, timedelta(days=30), timedelta(hours=6))
+    X, Y, s = _xys(dates)
+
+    assert X.shape == Y.shape == s.shape == (len(dates),)
+
+    for i, d in enumerate(dates):
+        x_i, y_i, s_i = _xys(d)
+        assert abs(X[i] - x_i) < 1e-17
+        assert abs(Y[i] - y_i) < 1e-17
+        assert abs(s[i] - s_i) < 1e-17
+
+
+def test_xys_interpolated(date):
+
+    dates = DateArray.range(date, timedelta(days=30), timedelta(minutes=17))
+    X, Y, s = _xys(dates)
+
+    config.set("frames", "iau2010", "xys", "interpolated")
+    try:
+        X2, Y2, s2 = _xys(dates)
+        assert np.abs(X2 - X).max() < 5e-14
+        assert np.abs(Y2 - Y).max() < 5e-14
+        assert np.abs(s2 - s).max() < 5e-14
+
+        x, y, s = _xys(date)
+        assert abs(x - X2[0]) < 1e-17
+        assert abs(y - Y2[0]) < 1e-17
+
+        config.set("frames", "iau2010", "xys", "dummy")
+        with raises(ConfigError):
+            _xys(date)
+    finally:
+        del config["frames"]
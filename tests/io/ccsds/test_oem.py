@@ -38,6 +38,22 @@ def test_dump_oem_linear(ephem, ccsds_format):
             assert "LINEAR" in line
 
 
+def test_dump_oem_hermite(ephem, ccsds_format):
+
+    ephem.method = ephem.HERMITE
+    ephem.order = 4
+    txt = dumps(ephem, fmt=ccsds_format)
+
+    assert "HERMITE" in txt
+    for line in txt.splitlines():
+        if "INTERPOLATION_DEGREE" in line:
+            assert "7" in line
+
+    new = loads(txt)
+    assert new.method == new.HERMITE
+    assert new.order == 4
+
+
 @mark.jpl
 def test_dump_oem_interplanetary(jplfiles, ephem, ccsds_format, datafile, helper):
 
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import numpy as np
+from pytest import fixture, raises
+
+from beyond.dates import Date, timedelta
+from beyond.io import ccsds, store
+from beyond.io.tle import Tle
+from beyond.orbits.ephem import Ephem
+
+OEM = Path(__file__).parent / "ccsds" / "data" / "oem.kvn"
+
+
+@fixture
+def ephem():
+    tle = Tle("""ISS (ZARYA)
+1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927
+2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537""")
+
+    ephem = tle.orbit().ephem(
+        start=Date(2008, 9, 20, 12, 30), stop=timedelta(hours=3), step=timedelta(minutes=1)
+    )
+    ephem.name = tle.name
+    ephem.cospar_id = tle.cospar_id
+    return ephem
+
+
+def test_dump_load(tmp_path, ephem):
+
+    filename = tmp_path / "iss.eph"
+    store.dump(ephem, filename)
+
+    new = store.load(filename)
+
+    assert new.columnar
+    assert not new[:, :].flags.owndata
+    assert len(new) == len(ephem)
+    assert new.start == ephem.start
+    assert new.stop == ephem.stop
+    assert new.frame == ephem.frame
+    assert new.form == ephem.form
+    assert new.method == ephem.method
+    assert new.order == ephem.order
+    assert new.name == ephem.name
+    assert new.cospar_id == ephem.cospar_id
+    assert np.array_equal(new[:, :], ephem[:, :])
+    assert list(new.dates) == list(ephem.dates)
+
+    # The file is read-only
+    with raises(ValueError):
+        new[:, 0][0] = 0
+
+    date = ephem.start + timedelta(minutes=33, seconds=27)
+    assert np.array_equal(new.interpolate(date).base, ephem.interpolate(date).base)
+
+    sub = new[10:20]
+    assert len(sub) == 10
+    assert sub.start == ephem[10].date
+    assert len(list(new.iter(step=timedelta(minutes=7)))) == 26
+
+    # Frame changes are done in memory
+    new.frame = "ITRF"
+    assert new.frame.name == "ITRF"
+    assert store.load(filename).frame.name == "TEME"
+
+    with raises(ValueError):
+        store.load(OEM)
+
+
+def test_oem(tmp_path):
+
+    ref = ccsds.loads(OEM.read_text())
+
+    filename = tmp_path / "oem.eph"
+    store.from_oem(OEM, filename)
+
+    new = store.load(filename)
+    assert len(new) == len(ref)
+    assert new.name == ref.name
+    assert new.method == ref.method
+    assert new.order == ref.order
+    assert np.array_equal(new[:, :], np.array(ref[:, :]))
+
+    oem = tmp_path / "new.oem"
+    store.to_oem(filename, oem)
+
+    assert ccsds.loads(oem.read_text()).start == ref.start
+    assert oem.read_text().splitlines()[5:] == ccsds.dumps(ref).splitlines()[5:]
+
+
+def test_no_name(tmp_path, ephem):
+
+    del ephem.name
+    del ephem.cospar_id
+
+    filename = tmp_path / "anonymous.eph"
+    store.dump(ephem, filename)
+
+    new = store.load(filename)
+    assert not hasattr(new, "name")
+    assert not hasattr(new, "cospar_id")
+    text = ccsds.dumps(new)
+    assert "None" not in text
+    assert text.splitlines()[5:] == ccsds.dumps(ephem).splitlines()[5:]
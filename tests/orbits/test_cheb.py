@@ -0,0 +1,98 @@
+import numpy as np
+from io import BytesIO
+from datetime import timedelta
+
+from pytest import fixture, raises
+
+from beyond.dates import Date, DateArray
+from beyond.orbits import StateVector
+from beyond.orbits.cheb import ChebEphem
+from beyond.propagators.kepler import Kepler
+
+
+@fixture
+def orbit():
+    sv = StateVector(
+        [42164e3, 0.0002, 0.001, 1, 2, 3], Date(2021, 1, 1), "keplerian", "EME2000"
+    )
+    return sv.as_orbit(Kepler())
+
+
+@fixture
+def ephem(orbit):
+    return orbit.ephem(start=orbit.date, stop=timedelta(days=2), step=timedelta(minutes=1))
+
+
+def test_fit(orbit, ephem):
+
+    cheb = ChebEphem.from_ephem(ephem, tol=0.01)
+
+    assert cheb.start == ephem.start
+    assert cheb.stop == ephem.stop
+    assert cheb.frame == ephem.frame
+    assert cheb.step == timedelta(minutes=1)
+
+    # Compression
+    assert cheb.coefs.size * 10 < len(ephem) * 6
+
+    dates = DateArray.range(ephem.start, ephem.stop, timedelta(seconds=317))
+    ref = ephem.interpolate_many(dates)
+    new = cheb.interpolate_many(dates)
+
+    assert np.abs(new[:, :3] - ref[:, :3]).max() < 0.01
+    assert np.abs(new[:, 3:] - ref[:, 3:]).max() < 1e-5
+
+    date = ephem.start + timedelta(hours=7, seconds=3)
+    orb = cheb.propagate(date)
+    assert orb.date == date
+    assert orb.form.name == "cartesian"
+    assert np.allclose(orb.base, orbit.propagate(date).base, rtol=0, atol=0.01)
+
+    # Sub-microsecond dates and other timescales are not rounded
+    dates = [date, Date(date.d, date.s + 4e-7, scale=date.scale.name)]
+    many = cheb.interpolate_many(dates)
+    orb = cheb.propagate(dates[1])
+    assert np.allclose(orb.base, many[1].base, rtol=0, atol=1e-6)
+    orb = cheb.propagate(date.change_scale("TT"))
+    assert np.allclose(orb.base, many[0].base, rtol=0, atol=1e-6)
+
+    with raises(ValueError):
+        cheb.propagate(ephem.stop + timedelta(seconds=1))
+
+    with raises(ValueError):
+        ChebEphem.from_ephem(ephem, tol=1e-9)
+
+
+def test_iter(ephem):
+
+    cheb = ChebEphem.from_ephem(ephem)
+
+    assert len(list(cheb.iter())) == len(ephem)
+    assert len(list(cheb.iter(step=timedelta(minutes=10)))) == 289
+
+    sub = cheb.ephem(start=ephem.start + timedelta(hours=1), stop=timedelta(hours=2))
+    assert sub.start == ephem.start + timedelta(hours=1)
+    assert sub.stop == ephem.start + timedelta(hours=3)
+
+    with raises(ValueError):
+        list(cheb.iter(stop=timedelta(days=3)))
+
+    sub = cheb.ephem(stop=timedelta(days=3), strict=False)
+    assert sub.stop == ephem.stop
+
+
+def test_save(ephem):
+
+    cheb = ChebEphem.from_ephem(ephem)
+
+    buffer = BytesIO()
+    cheb.save(buffer)
+    buffer.seek(0)
+    new = ChebEphem.load(buffer)
+
+    assert new.start == cheb.start
+    assert new.stop == cheb.stop
+    assert new.step == cheb.step
+    assert new.frame == cheb.frame
+    assert np.array_equal(new.bounds, cheb.bounds)
+    assert np.array_equal(new.coefs, cheb.coefs)
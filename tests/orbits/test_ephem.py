@@ -1,8 +1,11 @@
 import numpy as np
 from datetime import timedelta
 
-from beyond.dates import Date
+from beyond.dates import Date, DateArray
+from beyond.errors import OrbitError
+from beyond.orbits.ephem import Ephem
 from beyond.io.tle import Tle
+from beyond.propagators.kepler import Kepler
 from beyond.propagators.listeners import find_event, NodeListener, ApsideListener
 
 from pytest import raises, fixture
@@ -187,8 +190,8 @@ def test_sensitivity(ephem):
     ref_apo = find_event(ephem.iter(listeners=ApsideListener()), 'Apoapsis')
     ref_peri = find_event(ephem.iter(listeners=ApsideListener()), 'Periapsis')
 
-    assert str(ref_asc.date) == "2008-09-20T13:32:56.656687 UTC"
-    assert str(ref_desc.date) == "2008-09-20T12:47:05.809521 UTC"
+    assert str(ref_asc.date) == "2008-09-20T13:32:56.656689 UTC"
+    assert str(ref_desc.date) == "2008-09-20T12:47:05.809526 UTC"
 
     offsets = [
         timedelta(seconds=60),
@@ -217,3 +220,205 @@ def test_sensitivity(ephem):
         peri = find_event(subephem.iter(listeners=ApsideListener()), 'Periapsis')
         assert abs(ref_apo.date - apo.date) <= timedelta(microseconds=6), offset
         assert abs(ref_peri.date - peri.date) <= timedelta(microseconds=6), offset
+
+
+def test_frame(ephem):
+
+    ref = [orb.copy(frame="ITRF", form="keplerian") for orb in ephem]
+
+    ephem.form = "keplerian"
+    new = ephem.copy(frame="ITRF")
+
+    assert new.frame.name == "ITRF"
+    assert new.form.name == "keplerian"
+    assert ephem.frame.name == "TEME"
+
+    for orb, ref_orb in zip(new, ref):
+        assert orb.frame.name == "ITRF"
+        assert orb.form.name == "keplerian"
+        assert np.allclose(orb.base, ref_orb.base, rtol=1e-10, atol=0)
+
+    new.frame = "TEME"
+    new.form = "cartesian"
+    ephem.form = "cartesian"
+    for orb, ref_orb in zip(new, ephem):
+        assert np.allclose(orb.base, ref_orb.base, rtol=0, atol=1e-5)
+
+
+def test_columnar(ephem):
+
+    col = Ephem(ephem, columnar=True)
+
+    assert col.columnar
+    assert not ephem.columnar
+    assert len(col) == len(ephem)
+    assert col.start == ephem.start
+    assert col.stop == ephem.stop
+    assert col.frame.name == "TEME"
+    assert col.form.name == "cartesian"
+    assert list(col.dates) == list(ephem.dates)
+    assert np.array_equal(col[:, 2], ephem[:, 2])
+
+    for orb, ref in zip(col, ephem):
+        assert orb.date == ref.date
+        assert np.array_equal(orb.base, ref.base)
+
+    date = ephem.start + timedelta(minutes=33, seconds=27)
+    for method in ("linear", "lagrange"):
+        assert np.allclose(
+            col.interpolate(date, method=method),
+            ephem.interpolate(date, method=method),
+            rtol=0,
+            atol=1e-9,
+        )
+
+    # Slices share the data of the original ephemeris
+    sub = col[10:20]
+    assert sub.columnar
+    assert len(sub) == 10
+    assert sub.start == ephem[10].date
+    assert np.shares_memory(sub[:, 0], col[:, 0])
+
+    # Sub-ephemerides are columnar too
+    assert col.ephem(step=timedelta(minutes=10)).columnar
+
+    new = col.copy(frame="ITRF", form="keplerian")
+    assert new.columnar
+    assert new.frame.name == "ITRF"
+    assert new.form.name == "keplerian"
+    assert col.frame.name == "TEME"
+    assert col.form.name == "cartesian"
+
+    for orb, ref in zip(new, ephem):
+        ref = ref.copy(frame="ITRF", form="keplerian")
+        assert np.allclose(orb.base, ref.base, rtol=1e-10, atol=0)
+
+    mixed = list(ephem)
+    mixed[3] = mixed[3].copy(form="keplerian")
+    with raises(ValueError):
+        Ephem(mixed, columnar=True)
+
+
+def test_from_array(ephem):
+
+    coords = np.array(ephem[:])
+    dates = DateArray.from_dates(ephem.dates)
+
+    col = Ephem.from_array(coords, dates, "cartesian", "TEME", name="ISS")
+    assert np.shares_memory(col[:, :], coords)
+    assert col[5].name == "ISS"
+    assert col[5].frame.name == "TEME"
+
+    # Unordered points are sorted
+    col = Ephem.from_array(coords[::-1], dates[::-1], "cartesian", "TEME")
+    assert col.start == ephem.start
+    assert np.array_equal(col[:, :], coords)
+
+    with raises(OrbitError):
+        Ephem.from_array(coords[:, :3], dates, "cartesian", "TEME")
+
+
+def test_interpolate_many(ephem):
+
+    dates = DateArray.range(ephem.start, ephem.stop, timedelta(seconds=37), inclusive=True)
+
+    for method in ("linear", "lagrange"):
+        new = ephem.interpolate_many(dates, method=method)
+
+        assert new.columnar
+        assert len(new) == len(dates)
+        assert new.frame == ephem.frame
+        assert new.form == ephem.form
+
+        for orb in new[::10]:
+            ref = ephem.interpolate(orb.date, method=method)
+            assert np.allclose(orb.base, ref.base, rtol=0, atol=1e-6)
+
+    # Unsorted dates
+    shuffled = [dates[i] for i in np.random.RandomState(1).permutation(len(dates))]
+    new, index = ephem.interpolate_many(shuffled, method="hermite", return_index=True)
+    assert all(a.date < b.date for a, b in zip(new[:-1], new[1:]))
+    for date, coord in list(zip(shuffled, new[:, :][index]))[::10]:
+        ref = ephem.interpolate(date, method="hermite")
+        assert np.allclose(coord, ref.base, rtol=0, atol=1e-6)
+
+    # Interpolation on the points of the ephemeris gives the points themselves
+    new = ephem.interpolate_many(list(ephem.dates))
+    assert np.array_equal(new[:, :], ephem[:, :])
+
+    with raises(ValueError):
+        ephem.interpolate_many([ephem.start, ephem.stop + timedelta(minutes=1)])
+
+    with raises(ValueError):
+        ephem.interpolate_many(dates, method="dummy")
+
+    with raises(ValueError):
+        Ephem(ephem[:5]).interpolate_many(dates[:2])
+
+
+def test_hermite(ref_orb, start):
+
+    ref_orb.propagator = Kepler()
+    ephem = ref_orb.ephem(start=start, stop=stop, step=timedelta(minutes=5))
+
+    dates = DateArray.range(start, stop, timedelta(seconds=17))
+    ref = np.array([ref_orb.propagate(date).base for date in dates])
+
+    # With half the points, Hermite interpolation is more precise than Lagrange
+    hermite = ephem.interpolate_many(dates, method="hermite", order=4)
+    lagrange = ephem.interpolate_many(dates, method="lagrange", order=8)
+
+    assert np.abs(hermite[:, :3] - ref[:, :3]).max() < 0.5
+    assert np.abs(hermite[:, 3:] - ref[:, 3:]).max() < 1e-3
+    assert np.abs(lagrange[:, :3] - ref[:, :3]).max() > 5
+
+    date = start + timedelta(minutes=33, seconds=27)
+    orb = ephem.interpolate(date, method="hermite", order=4)
+    assert np.allclose(orb.base, ref_orb.propagate(date).base, rtol=0, atol=0.5)
+
+    # Same result as the interpolation of many dates at once, even below
+    # the microsecond
+    date2 = Date(date.d, date.s + 4e-7, scale=date.scale.name)
+    single = ephem.interpolate(date2, method="hermite", order=4)
+    many = ephem.interpolate_many([date2], method="hermite", order=4)
+    assert np.allclose(single.base, many[0].base, rtol=0, atol=1e-8)
+
+    # Conversion to cartesian is done internally
+    ephem.form = "keplerian"
+    orb = ephem.interpolate(date, method="hermite", order=4)
+    assert orb.form.name == "keplerian"
+    assert np.allclose(
+        orb.copy(form="cartesian").base, ref_orb.propagate(date).base, rtol=0, atol=0.5
+    )
+
+
+def test_uniform_step(ephem):
+
+    _, t, step = ephem._times
+    assert step == 60.
+
+    # The direct computation of the indices gives the same result as a search
+    x = np.linspace(0, t[-1], 1001)
+    assert np.array_equal(
+        ephem._prev_index(x),
+        np.maximum(np.searchsorted(t, x, side="left") - 1, 0),
+    )
+
+    # Barycentric Lagrange interpolation gives the same result as the product formula
+    date = ephem.start + timedelta(minutes=33, seconds=27)
+    orb = ephem.interpolate(date)
+
+    irregular = Ephem(list(ephem[:40]) + list(ephem[41:]))
+    assert irregular._times[2] is None
+    assert np.allclose(orb.base, irregular.interpolate(date).base, rtol=0, atol=1e-6)
+
+    # The times of a non-columnar ephemeris follow the modifications of its
+    # list of orbits
+    ephem._orbits.pop(40)
+    assert ephem._times[2] is None
+    assert len(ephem._times[1]) == len(ephem)
+    assert np.array_equal(ephem.interpolate(date).base, irregular.interpolate(date).base)
+
+    # Points are given back as is
+    orb = ephem.interpolate(ephem[17].date)
+    assert np.array_equal(orb.base, ephem[17].base)
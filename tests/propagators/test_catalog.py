@@ -0,0 +1,55 @@
+import numpy as np
+from numpy.testing import assert_almost_equal
+
+from beyond.dates import DateArray, timedelta
+from beyond.io.tle import Tle
+from beyond.propagators import catalog
+
+
+def test_propagate(iss_tle, molniya_tle):
+
+    text = "\n".join([iss_tle.text, molniya_tle.text])
+    orbits = [iss_tle.orbit(), molniya_tle.orbit()]
+    start = orbits[0].date
+    dates = DateArray.range(start, start + timedelta(hours=12), timedelta(minutes=10))
+
+    result = catalog.propagate(text, dates)
+
+    assert [tle.norad_id for tle in result.tles] == [25544, 24960]
+    assert result.frame.name == "TEME"
+    assert result.states.shape == (2, len(dates), 6)
+    assert result.valid.all()
+
+    for orb, states in zip(orbits, result.states):
+        for i in range(0, len(dates), 7):
+            assert_almost_equal(states[i], np.asarray(orb.propagate(dates[i])), decimal=4)
+
+    # Frame conversion, with one object per chunk, distributed among processes
+    result2 = catalog.propagate(
+        [iss_tle, molniya_tle], dates, frame="EME2000", chunksize=1, processes=2
+    )
+
+    assert result2.frame.name == "EME2000"
+    for orb, states in zip(orbits, result2.states):
+        for i in range(0, len(dates), 7):
+            ref = orb.propagate(dates[i]).copy(frame="EME2000")
+            assert_almost_equal(states[i], np.asarray(ref), decimal=4)
+
+
+def test_errors(iss_tle):
+
+    decayed = Tle(
+        """1 99999U 21001A   21001.00000000  .50000000  00000-0  50000-0 0  9993
+2 99999  51.6000 100.0000 0010000 100.0000 100.0000 16.40000000    04"""
+    )
+
+    start = decayed.epoch
+    dates = DateArray.range(start, start + timedelta(days=10), timedelta(days=1))
+
+    result = catalog.propagate([iss_tle, decayed], dates)
+
+    assert result.valid[0].all()
+    assert result.valid[1, 0]
+    assert not result.valid[1, -1]
+    assert result.errors[1, -1] != 0
+    assert np.isnan(result.states[1, -1]).all()
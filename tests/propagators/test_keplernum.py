@@ -5,9 +5,10 @@ from pytest import fixture, raises, mark
 from unittest.mock import patch
 
 import beyond.io.ccsds as ccsds
+from beyond.config import config
 from beyond.dates import Date, timedelta
 from beyond.io.tle import Tle
-from beyond.propagators.keplernum import KeplerNum, SOIPropagator
+from beyond.propagators.keplernum import KeplerNum, SOIPropagator, checkpoints
 from beyond.env.solarsystem import get_body
 from beyond.propagators.listeners import LightListener, NodeListener, find_event, ApsideListener
 from beyond.orbits.man import ImpulsiveMan, KeplerianImpulsiveMan, ContinuousMan, KeplerianContinuousMan
@@ -15,6 +16,14 @@ from beyond.orbits.man import ImpulsiveMan, KeplerianImpulsiveMan, ContinuousMan
 import beyond.env.jpl as jpl
 
 
+@fixture(autouse=True)
+def clear_checkpoints():
+    # The counts of steps assume a propagation starting from the epoch
+    checkpoints.clear()
+    yield
+    checkpoints.clear()
+
+
 @fixture
 def orbit_kepler(iss_tle):
 
@@ -246,8 +255,10 @@ def test_duty_cycle(orbit_kepler):
         assert len(data) == 91
         assert data[0].date == start
         assert data[-1].date == stop
+        # The retropolation resumes from the steps computed above
         assert mock.call_count == (
             count_steps(orbit_kepler.date - start, orbit_kepler.propagator.step)
+            - 11
             + count_steps(stop - start, orbit_kepler.propagator.step, False)
         )
         # assert mock.call_count == 125
@@ -272,10 +283,10 @@ def test_listener(orbit_kepler):
 
         events = [x for x in data if x.event]
         assert len(events) == 2
-        assert events[0].date == Date(2018, 5, 4, 13, 8, 38, 869128)
+        assert events[0].date == Date(2018, 5, 4, 13, 8, 38, 869127)
         assert events[0].event.info == "Umbra exit"
 
-        assert events[1].date == Date(2018, 5, 4, 14, 5, 21, 256924)
+        assert events[1].date == Date(2018, 5, 4, 14, 5, 21, 256927)
         assert events[1].event.info == "Umbra entry"
 
     with mock_step(orbit_kepler) as mock:
@@ -288,18 +299,16 @@ def test_listener(orbit_kepler):
             data.append(p)
 
         assert len(data) == 93
-        assert mock.call_count == (
-            count_steps(orbit_kepler.date - start, orbit_kepler.propagator.step)
-            + count_steps(stop - start, orbit_kepler.propagator.step, False)
-        )
+        # The retropolation to the start has already been computed
+        assert mock.call_count == count_steps(stop - start, orbit_kepler.propagator.step, False)
         # assert mock.call_count == 125
 
         events = [x for x in data if x.event]
         assert len(events) == 2
-        assert str(events[0].date) == "2018-05-04T13:08:30.765143 UTC"
+        assert str(events[0].date) == "2018-05-04T13:08:30.764762 UTC"
         assert events[0].event.info == "Periapsis"
 
-        assert str(events[1].date) == "2018-05-04T13:54:50.178229 UTC"
+        assert str(events[1].date) == "2018-05-04T13:54:50.177850 UTC"
         assert events[1].event.info == "Apoapsis"
 
 
@@ -429,7 +438,8 @@ def test_man_continuous(method, molniya_kepler):
 
 
 @mark.jpl
-def test_soi(jplfiles):
+@mark.parametrize("dense", [False, True])
+def test_soi(dense, jplfiles):
 
     opm = ccsds.loads("""CCSDS_OPM_VERS = 2.0
 CREATION_DATE = 2019-02-22T23:22:31
@@ -478,7 +488,7 @@ MAN_DV_3             = 0.000000 [km/s]
     central = jpl.get_body('Sun')
     planets = jpl.get_body('Earth')
 
-    opm = opm.as_orbit(SOIPropagator(solar_step, planetary_step, central, planets))
+    opm = opm.as_orbit(SOIPropagator(solar_step, planetary_step, central, planets, dense=dense))
 
     frames = set()
     for orb in opm.iter(stop=timedelta(5)):
@@ -488,3 +498,221 @@ MAN_DV_3             = 0.000000 [km/s]
 
     # Check if the last point is out of Earth sphere of influence
     assert orb.copy(frame='EME2000', form="spherical").r > SOIPropagator.SOI['Earth'].radius
+
+
+def test_soi_copy():
+
+    prop = SOIPropagator(
+        timedelta(hours=1), timedelta(minutes=1), get_body('Sun'), get_body('Earth'),
+        method=KeplerNum.DOPRI54, tol=1e-6, dense=True, min_step=timedelta(seconds=1),
+        max_step=timedelta(hours=2),
+    )
+    new = prop.copy()
+
+    for attr in ("method", "tol", "dense", "min_step", "max_step", "central_step", "alt_step"):
+        assert getattr(new, attr) == getattr(prop, attr)
+
+
+@mark.parametrize("method", [
+    KeplerNum.RK4, KeplerNum.RKF54, KeplerNum.DOPRI54, KeplerNum.DOP853, KeplerNum.ABM8
+])
+def test_dense(method, orbit_kepler):
+
+    orbit_kepler.propagator.method = method
+    start = orbit_kepler.date - timedelta(minutes=17)
+    stop = timedelta(hours=3)
+    step = timedelta(seconds=45)
+
+    ref = list(orbit_kepler.iter(start=start, stop=stop, step=step))
+
+    orbit_kepler.propagator.dense = True
+    with mock_step(orbit_kepler) as mock:
+        data = list(orbit_kepler.iter(start=start, stop=stop, step=step))
+
+    assert len(data) == len(ref) == 241
+    assert data[0].date == start
+    assert data[-1].date == start + stop
+
+    for p, p_ref in zip(data, ref):
+        assert p.date == p_ref.date
+        assert p.propagator.orbit is None
+        assert np.linalg.norm(p[:3] - p_ref[:3]) < 10
+
+    if method == KeplerNum.DOP853:
+        # The continuous extension keeps the accuracy of the method
+        assert max(np.linalg.norm(p[:3] - p_ref[:3]) for p, p_ref in zip(data, ref)) < 1e-3
+
+    if method == KeplerNum.RK4:
+        # No additional steps are needed for the interpolation
+        assert mock.call_count == count_steps(
+            orbit_kepler.date - start, orbit_kepler.propagator.step, False
+        ) + count_steps(stop, orbit_kepler.propagator.step, False)
+
+    # Propagation to a single date
+    date = orbit_kepler.date + timedelta(minutes=121, seconds=12)
+    assert np.linalg.norm(orbit_kepler.propagate(date)[:3] - ref[0].propagate(date)[:3]) < 10
+
+
+def test_dense_listener(orbit_kepler):
+
+    start = Date(2018, 5, 4, 13)
+    stop = start + timedelta(minutes=90)
+
+    orbit_kepler.propagator.dense = True
+    data = list(orbit_kepler.iter(start=start, stop=stop, listeners=[LightListener(), ApsideListener()]))
+
+    assert len(data) == 95
+
+    events = [x for x in data if x.event]
+    assert [x.event.info for x in events] == ["Periapsis", "Umbra exit", "Apoapsis", "Umbra entry"]
+
+    # Same events as with the interpolation of the ephemeris. The dates of
+    # the apsides of such a circular orbit are very sensitive
+    assert abs(events[0].date - Date(2018, 5, 4, 13, 8, 30, 764762)) < timedelta(seconds=1)
+    assert abs(events[1].date - Date(2018, 5, 4, 13, 8, 38, 869127)) < timedelta(seconds=0.05)
+    assert abs(events[2].date - Date(2018, 5, 4, 13, 54, 50, 177850)) < timedelta(seconds=1)
+    assert abs(events[3].date - Date(2018, 5, 4, 14, 5, 21, 256927)) < timedelta(seconds=0.05)
+
+    # Events are correctly ordered
+    assert all(a.date <= b.date for a, b in zip(data[:-1], data[1:]))
+
+
+@mark.parametrize("method, tol", [
+    (KeplerNum.RKF54, 1e-3), (KeplerNum.DOPRI54, 1e-3), (KeplerNum.DOP853, 1e-7)
+])
+def test_step_control(method, tol, molniya_kepler):
+
+    prop = molniya_kepler.propagator
+    prop.method = method
+    prop.tol = tol
+    prop.max_step = timedelta(minutes=30)
+    prop.min_step = timedelta(seconds=10)
+
+    data = list(molniya_kepler.iter(stop=timedelta(hours=24), real_steps=True))
+    steps = [b.date - a.date for a, b in zip(data[:-1], data[1:])]
+
+    # The step size increases at apogee, beyond the initial step size, and
+    # decreases at perigee
+    assert max(steps) > 2 * prop.step
+    assert min(steps) < prop.step / 2
+    assert all(prop.min_step <= step <= prop.max_step for step in steps)
+
+    stats = prop.stats
+    assert stats.accepted == len(steps)
+    assert stats.rejected < 10
+    assert stats.evaluations == (stats.accepted + stats.rejected) * len(prop.butcher["b"])
+
+    # The configuration of the step control is kept by the propagators of
+    # the resulting orbits
+    new = data[-1].propagator
+    assert (new.tol, new.min_step, new.max_step) == (prop.tol, prop.min_step, prop.max_step)
+
+    # A copied propagator, as well as the state of its step size controller,
+    # may be used directly
+    new = prop.copy()
+    assert new._prev_error == prop._prev_error
+    new.orbit = molniya_kepler
+    step, y, next_step = new._make_step(0.0, np.array(new.orbit), new.step)
+    assert new.min_step <= step <= new.step
+    assert 1e-4 <= new._prev_error <= 1
+
+    # The step size is kept from one step to the next, instead of restarting
+    # from the maximum step size and shrinking
+    prop.max_step = None
+    prop.step = timedelta(minutes=10)
+    molniya_kepler.propagate(timedelta(hours=24))
+    assert prop.stats.rejected < 10
+
+
+def test_multistep(orbit_kepler):
+
+    stop = timedelta(hours=12)
+
+    ref = orbit_kepler.copy()
+    ref.propagator = KeplerNum(timedelta(seconds=10), get_body('Earth'))
+    ref = ref.propagate(stop)
+
+    rk4 = orbit_kepler.propagate(stop)
+
+    prop = orbit_kepler.propagator
+    prop.method = KeplerNum.ABM8
+    abm = orbit_kepler.propagate(stop)
+
+    # Much more accurate than RK4 at the same step size, with half as many
+    # evaluations of the forces
+    assert np.linalg.norm(rk4[:3] - ref[:3]) > 100
+    assert np.linalg.norm(abm[:3] - ref[:3]) < 1
+
+    # The 7 first steps are computed with DOP853
+    steps = count_steps(stop, prop.step, False)
+    assert prop.stats.accepted == steps
+    assert prop.stats.evaluations == 7 * 12 + (steps - 7) * 2
+
+    # An impulsive maneuver restarts the multistep method
+    orbit_kepler.maneuvers = ImpulsiveMan(orbit_kepler.date + timedelta(hours=3), (10, 0, 0), frame="TNW")
+    orbit_kepler.propagate(stop)
+    assert prop.stats.evaluations == 14 * 12 + (steps - 14) * 2
+
+
+def test_perturbers(orbit_kepler):
+
+    moon = get_body('Moon')
+    prop = orbit_kepler.propagator
+    prop.bodies = [get_body('Earth'), moon]
+
+    with patch.object(moon, "propagate", wraps=moon.propagate) as mock:
+        orb = orbit_kepler.propagate(timedelta(hours=24))
+
+    # The positions of the Moon are only computed to fit the interpolation
+    # polynomials, instead of at each evaluation of the forces
+    pieces = count_steps(timedelta(hours=24), prop.PERTURBERS_SPAN)
+    assert mock.call_count == pieces * (prop.PERTURBERS_DEGREE + 1)
+    assert len(prop._perturbers) == pieces
+
+    for t in np.linspace(0, 86400, 50):
+        ref = moon.propagate(prop._date(t))
+        ref.frame = prop.orbit.frame
+        assert np.linalg.norm(prop._body_position(moon, t) - ref[:3]) < 1
+
+    # The Moon perturbs the orbit
+    prop.bodies = [get_body('Earth')]
+    assert np.linalg.norm(orb[:3] - orbit_kepler.propagate(timedelta(hours=24))[:3]) > 10
+
+
+def test_checkpoints(orbit_kepler):
+
+    step = orbit_kepler.propagator.step
+    dates = [orbit_kepler.date + timedelta(minutes=m, seconds=17) for m in (30, 10, 31, 45)]
+
+    config.set("propagators", "keplernum", "enabled", False)
+    try:
+        ref = [orbit_kepler.propagate(date) for date in dates]
+        assert len(checkpoints) == 0
+    finally:
+        del config["propagators"]
+
+    with mock_step(orbit_kepler) as mock:
+        data = [orbit_kepler.propagate(date) for date in dates]
+
+    # Each propagation resumes from the last point computed by the previous
+    # ones, instead of the epoch of the orbit
+    assert mock.call_count == count_steps(dates[-1] - orbit_kepler.date, step)
+    for p, p_ref in zip(data, ref):
+        assert np.array_equal(p, p_ref)
+
+    info = checkpoints.info()
+    assert info.currsize == 1
+    assert info.hits == 3
+
+    # Any maneuver leads to a different trajectory
+    orbit_kepler.maneuvers = ImpulsiveMan(orbit_kepler.date + timedelta(minutes=20), (10, 0, 0), frame="TNW")
+    assert np.linalg.norm(orbit_kepler.propagate(dates[-1])[:3] - ref[-1][:3]) > 100
+    assert checkpoints.info().currsize == 2
+
+    config.set("propagators", "keplernum", "maxsize", 1)
+    try:
+        orbit_kepler.propagate(orbit_kepler.date - timedelta(minutes=10))
+        assert checkpoints.info().currsize == 1
+        assert checkpoints.info().evictions == 2
+    finally:
+        del config["propagators"]
@@ -1,10 +1,11 @@
 import numpy as np
-from pytest import raises
+from pytest import raises, mark
 from numpy.testing import assert_almost_equal
 
 from beyond.orbits import Orbit
 from beyond.errors import UnknownPropagatorError
-from beyond.dates import Date, timedelta
+from beyond.dates import Date, DateArray, timedelta
+from beyond.propagators import get_propagator
 
 
 def test_iter_on_dates(orbit):
@@ -64,3 +65,36 @@ def test_j2(iss_tle):
     assert orbit.date + orbit.infos.period == orb2.date
     # a, e and i should not be modified
     assert_almost_equal(np.asarray(orbit[:3]), np.asarray(orb2[:3]))
+
+
+@mark.parametrize("propagator", ["Kepler", "J2"])
+def test_propagate_array(iss_tle, molniya_tle, propagator):
+
+    epoch = iss_tle.epoch
+    orbits = [
+        tle.orbit().propagate(epoch).copy(form="keplerian_mean", frame="EME2000")
+        for tle in (iss_tle, molniya_tle)
+    ]
+
+    dates = DateArray.range(epoch, epoch + timedelta(hours=12), timedelta(minutes=7))
+    prop = get_propagator(propagator)
+
+    states = prop.propagate_array(np.array(orbits), epoch, dates)
+    assert states.shape == (2, len(dates), 6)
+
+    for orb, state in zip(orbits, states):
+        orb = orb.as_orbit(prop())
+        ref = np.array([orb.propagate(date) for date in dates])
+        assert_almost_equal(state[:, :3], ref[:, :3], decimal=4)
+        assert_almost_equal(state[:, 3:], ref[:, 3:], decimal=7)
+
+    # One epoch per orbit
+    epochs = DateArray.from_dates([epoch, epoch + timedelta(hours=1)])
+    states2 = prop.propagate_array(np.array(orbits), epochs, dates)
+    assert_almost_equal(states2[0], states[0])
+    assert_almost_equal(
+        states2[1], prop.propagate_array(np.array(orbits[1:]), epochs[1], dates)[0]
+    )
+
+    with raises(ValueError):
+        prop.propagate_array([[7000000, 1.1, 0, 0, 0, 0]], epoch, dates)
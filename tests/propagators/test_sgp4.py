@@ -0,0 +1,100 @@
+import numpy as np
+from numpy.testing import assert_almost_equal
+from pytest import raises
+
+from beyond.dates import DateArray, timedelta
+from beyond.errors import OrbitError
+from beyond.io.tle import Tle
+from beyond.propagators.sgp4 import Sgp4, records
+
+from sgp4.api import Satrec, WGS72
+
+
+def test_iter(iss_tle):
+
+    orb = iss_tle.orbit()
+    ephem = list(orb.iter(start=orb.date, stop=timedelta(hours=3), step=timedelta(minutes=2)))
+
+    assert len(ephem) == 91
+    for sv in ephem[::10]:
+        assert_almost_equal(np.asarray(sv), np.asarray(orb.propagate(sv.date)))
+
+
+def test_propagate_array(iss_tle, molniya_tle):
+
+    orbits = [iss_tle.orbit(), molniya_tle.orbit()]
+
+    dates = DateArray.range(
+        orbits[0].date, orbits[0].date + timedelta(days=1), timedelta(minutes=10)
+    )
+
+    states = Sgp4.propagate_array(orbits, dates)
+    assert states.shape == (2, len(dates), 6)
+
+    for orb, state in zip(orbits, states):
+        for i in range(0, len(dates), 17):
+            assert_almost_equal(state[i], np.asarray(orb.propagate(dates[i])))
+
+
+def test_decayed():
+
+    # The drag of this object is so high that the sgp4 library considers
+    # it decayed a few days after its epoch
+    orb = Tle(
+        """1 99999U 21001A   21001.00000000  .50000000  00000-0  50000-0 0  9993
+2 99999  51.6000 100.0000 0010000 100.0000 100.0000 16.40000000    04"""
+    ).orbit()
+
+    date = orb.date + timedelta(days=10)
+    with raises(OrbitError):
+        orb.propagate(date)
+
+    states = Sgp4.propagate_array([orb], [orb.date, date])
+    assert not np.isnan(states[0, 0]).any()
+    assert np.isnan(states[0, 1]).all()
+
+
+
+def test_init(iss_tle):
+
+    orb = iss_tle.orbit()
+    lines = iss_tle.text.splitlines()[-2:]
+    ref = Satrec.twoline2rv(*lines, WGS72)
+
+    satrec = Sgp4._sgp4init(orb)
+    for name in ("inclo", "nodeo", "ecco", "argpo", "mo", "no_kozai", "bstar"):
+        assert_almost_equal(getattr(satrec, name), getattr(ref, name), decimal=14)
+
+    assert satrec.satnum == ref.satnum
+    assert satrec.jdsatepoch == ref.jdsatepoch
+    assert abs(satrec.jdsatepochF - ref.jdsatepochF) * 86400 < 1e-6
+
+    # No rounding of the elements, as it would happen through the TLE text
+    orb2 = orb.copy()
+    orb2[0] = 0.9
+    assert Sgp4._sgp4init(orb2).inclo == 0.9
+
+    # Alternate propagations of two orbits sharing the same propagator
+    records.clear()
+    orb2.propagator = orb.propagator
+    for _ in range(3):
+        orb.propagate(orb.date)
+        orb2.propagate(orb.date)
+    assert records.info().misses == 2
+
+
+def test_modified_orbit(iss_tle):
+
+    orb = iss_tle.orbit()
+    date = orb.date + timedelta(minutes=30)
+    ref = orb.propagate(date)
+
+    # Modifying the orbit in place creates a new record of the sgp4 library
+    orb[1] += 0.1
+    new = orb.propagate(date)
+    assert not np.allclose(new.base, ref.base)
+    assert_almost_equal(new.base, orb.copy().propagate(date).base)
+
+    # Even for a new propagator
+    orb.propagator = Sgp4()
+    assert_almost_equal(orb.propagate(date).base, new.base)
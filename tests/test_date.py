@@ -9,7 +9,7 @@ from datetime import datetime, timedelta, timezone
 import numpy as np
 
 from beyond.dates.eop import Eop
-from beyond.dates.date import Date, DateError, UnknownScaleError, DateRange
+from beyond.dates.date import Date, DateArray, DateError, UnknownScaleError, DateRange
 
 
 def test_creation():
@@ -339,4 +339,77 @@ def test_daterange():
 
     # Error when the step is null.
     with raises(ValueError):
-        list(Date.range(start, stop, timedelta(0)))
\ No newline at end of file
+        list(Date.range(start, stop, timedelta(0)))
+
+def test_date_array():
+
+    with patch('beyond.dates.date.EopDb.get') as m:
+        m.return_value = Eop(x=0, y=0, dx=0, dy=0, dpsi=0, deps=0, lod=0, ut1_utc=0.1242558, tai_utc=36.0)
+
+        start = Date(2015, 12, 6, 23, 30)
+        stop = timedelta(hours=1)
+        step = timedelta(seconds=30)
+
+        dates = DateArray.range(start, stop, step)
+        ref = list(Date.range(start, stop, step))
+
+        assert len(dates) == len(ref) == stop // step
+        assert isinstance(dates[0], Date)
+        assert dates[0] == start
+        assert dates[-1] == ref[-1]
+        assert list(dates) == ref
+
+        # The range crosses midnight
+        assert dates.d[0] + 1 == dates.d[-1]
+        assert np.allclose(dates.mjd, [x.mjd for x in ref], rtol=0, atol=1e-11)
+        assert np.allclose(dates.jd, [x.jd for x in ref], rtol=0, atol=1e-11)
+
+        assert len(DateArray.range(start, stop, step, inclusive=True)) == stop // step + 1
+
+        # Inverse order
+        dates2 = DateArray.range(start, -timedelta(minutes=2), -step)
+        assert list(dates2) == list(Date.range(start, -timedelta(minutes=2), -step))
+
+        with raises(ValueError):
+            DateArray.range(start, stop, -step)
+
+        with raises(ValueError):
+            DateArray.range(start, stop, timedelta(0))
+
+        # Scale change of the whole array at once
+        for scale in ("TT", "TAI", "UT1", "GPS", "TDB"):
+            converted = dates.change_scale(scale)
+            assert converted.scale.name == scale
+            assert np.allclose(
+                converted.julian_century,
+                [x.change_scale(scale).julian_century for x in ref],
+                rtol=0,
+                atol=1e-14,
+            )
+
+        assert dates.change_scale("TT")[0] == start
+        assert str(dates.change_scale("TT")[0]) == "2015-12-06T23:31:08.184000 TT"
+
+        # Operations with timedelta and Dates
+        shifted = dates + timedelta(hours=1)
+        assert shifted[0] == start + timedelta(hours=1)
+        assert np.allclose(shifted - dates, 3600)
+        assert np.allclose(dates - start, np.arange(len(dates)) * 30)
+        assert (dates - timedelta(minutes=1))[2] == start
+
+        with raises(TypeError):
+            dates + 1
+
+        # Comparisons and slicing
+        assert (dates < ref[10]).sum() == 10
+        sub = dates[dates >= ref[10]]
+        assert isinstance(sub, DateArray)
+        assert sub[0] == ref[10]
+        assert dates[2:5].stop == ref[4]
+
+        # Creation from Date objects, in different scales
+        dates3 = DateArray.from_dates([ref[0], ref[1].change_scale("TAI")])
+        assert dates3.scale.name == "UTC"
+        assert dates3[1] == ref[1]
+
+        assert dates.eop.ut1_utc.shape == (len(dates),)
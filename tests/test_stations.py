@@ -90,7 +90,7 @@ def test_station_visibility(orbit, station):
     assert points[10].event.info == "AOS"
     assert points[10].event.elev == "Mask"
     assert points[10].event.station == station
-    assert (points[10].date - Date(2018, 4, 5, 21, 9, 4, 977230)).total_seconds() <= 1e-5
+    assert (points[10].date - Date(2018, 4, 5, 21, 9, 4, 977253)).total_seconds() <= 1e-5
 
     assert isinstance(points[13].event, MaxEvent)
     assert points[13].event.info == "MAX"
@@ -108,7 +108,7 @@ def test_station_visibility(orbit, station):
     assert points[-1].event.elev == 0
     assert abs(points[-1].phi) < 1e-5
     assert points[-1].event.station == station
-    assert (points[-1].date - Date(2018, 4, 5, 21, 15, 25, 169655)).total_seconds() <= 1e-5
+    assert (points[-1].date - Date(2018, 4, 5, 21, 15, 25, 169666)).total_seconds() <= 1e-5
 
 
 def test_station_no_mask(orbit, station):
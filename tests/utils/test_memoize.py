@@ -0,0 +1,126 @@
+import numpy as np
+from unittest.mock import patch
+
+from beyond.config import config
+from beyond.utils.memoize import LruCache, memoize
+
+
+def test_lru():
+
+    cache = LruCache(maxsize=2)
+
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+
+    # "b" is the least recently used entry, and is evicted first
+    cache["c"] = 3
+    assert "b" not in cache
+    assert "a" in cache
+    assert len(cache) == 2
+
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 0
+    assert info.evictions == 1
+    assert info.maxsize == 2
+    assert info.currsize == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info().evictions == 0
+
+
+def test_lru_ttl():
+
+    cache = LruCache(ttl=10)
+
+    with patch("beyond.utils.memoize.time.monotonic") as m:
+        m.return_value = 100.
+        cache["a"] = 1
+        m.return_value = 105.
+        assert cache["a"] == 1
+        m.return_value = 111.
+        assert "a" in cache
+
+        try:
+            cache["a"]
+        except KeyError:
+            pass
+        else:  # pragma: no cover
+            raise AssertionError("Entry should have expired")
+
+    assert "a" not in cache
+    assert cache.info().evictions == 1
+    assert cache.info().misses == 1
+
+
+def test_lru_config():
+
+    cache = LruCache()
+    assert cache.maxsize == LruCache.DEFAULT_MAXSIZE
+    assert cache.ttl is None
+
+    config.set("memoize", "maxsize", 3)
+    try:
+        for i in range(5):
+            cache[i] = i
+        assert len(cache) == 3
+        assert cache.info().evictions == 2
+    finally:
+        del config["memoize"]
+
+
+def test_memoize():
+
+    calls = []
+
+    @memoize(maxsize=2)
+    def func(x, y=1):
+        calls.append((x, y))
+        return x * y
+
+    assert func(2) == 2
+    assert func(2) == 2
+    assert func(2, y=3) == 6
+    assert func(2, y=3) == 6
+    assert len(calls) == 2
+    assert func.cache_info().hits == 2
+    assert func.cache_info().misses == 2
+
+    func(3)
+    assert func.cache_info().evictions == 1
+
+    # Unhashable arguments are not cached
+    arr = np.arange(3)
+    assert np.all(func(arr) == arr)
+    assert np.all(func(arr) == arr)
+    assert len(calls) == 5
+
+    func.cache_clear()
+    assert func.cache_info().currsize == 0
+
+    # Bare decorator
+    @memoize
+    def func2(x):
+        return x
+
+    assert func2(1) == 1
+    assert func2.cache_info().misses == 1
+
+
+def test_lru_maxbytes():
+
+    cache = LruCache(maxbytes=100)
+
+    cache["a"] = np.zeros(5)  # 40 bytes
+    cache["b"] = np.zeros(5)
+    assert cache.info().currbytes == 80
+
+    cache["c"] = np.zeros(5)
+    assert "a" not in cache
+    assert cache.info().currbytes == 80
+    assert cache.info().evictions == 1
+
+    assert cache["b"] is not None
+    assert cache.info().hit_rate == 1.0
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from pytest import raises
+from pytest import raises, warns
 
 from beyond.utils.node import Node
 
@@ -87,3 +87,44 @@ def test_list():
     assert K in A.list
     assert L in A.list
     assert M in A.list
+
+
+def test_leaves():
+
+    root = Node('root')
+    hub = Node('hub')
+    root + hub
+    leaves = [Node('leaf{}'.format(i)) for i in range(2000)]
+    for leaf in leaves:
+        hub + leaf
+
+    assert leaves[10].path('leaf1500') == [leaves[10], hub, leaves[1500]]
+    assert root.steps('leaf3') == [(root, hub), (hub, leaves[3])]
+
+    # The result is a copy, so modifying it does not alter later calls
+    steps = root.steps('leaf3')
+    steps.append((leaves[3], hub))
+    assert root.steps('leaf3') == [(root, hub), (hub, leaves[3])]
+
+    # The result is kept until the graph is modified
+    root + leaves[3]
+    assert root.steps('leaf3') == [(root, leaves[3])]
+
+    # A leaf becoming an intermediate node
+    other = Node('other')
+    leaves[5] + other
+    assert root.path('other') == [root, hub, leaves[5], other]
+
+
+def test_routes():
+
+    with warns(DeprecationWarning):
+        routes = A.routes
+
+    assert set(routes) == set("BCDEFGHIJKLM")
+    assert routes['B'].direction is B
+    assert routes['B'].steps == 1
+    assert routes['H'].direction is B
+    assert routes['H'].steps == 3
+    assert routes['M'].direction is E
+    assert routes['M'].steps == 3